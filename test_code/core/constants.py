@@ -314,6 +314,11 @@ HEX_ERROR_BITS: str = ErrorCode.HEX_BITS_ERROR.value
 
 DEFAULT_CHAMBER_CHECK_TEMP_TIMEOUT_SEC: float = 300.0
 DEFAULT_CHAMBER_CHECK_TEMP_TOLERANCE_DEG: float = 0.5
+# 온도 안정화 대기 시 폴링 간격 (목표와의 차이에 비례, 아래 범위로 제한)
+CHAMBER_POLL_MIN_INTERVAL_SEC: float = 0.25
+CHAMBER_POLL_MAX_INTERVAL_SEC: float = 5.0
+CHAMBER_POLL_SEC_PER_DEG: float = 1.0
+CHAMBER_TEMP_CACHE_TTL_SEC: float = 0.5
 
 SETTINGS_CHIP_ID_KEY: str = "chip_id"
 SETTINGS_MULTIMETER_USE_KEY: str = "multimeter_use"
@@ -325,6 +330,7 @@ SETTINGS_CHAMBER_SERIAL_KEY: str = "chamber_serial"
 SETTINGS_LAST_JSON_PATH_KEY: str = "last_json_path"
 SETTINGS_EXCEL_SHEETS_CONFIG_KEY: str = "excel_export_sheets_config"
 SETTINGS_ERROR_HALTS_SEQUENCE_KEY: str = "error_halts_sequence"
+SETTINGS_I2C_READ_CACHE_TTL_STEPS_KEY: str = "i2c_read_cache_ttl_steps" # 0이면 I2C Read Addr 캐시 사용 안 함
 
 EXCEL_COL_TIMESTAMP: str = "Timestamp"
 EXCEL_COL_VARIABLE_NAME: str = "Variable Name"
@@ -1,10 +1,11 @@
 # data_models.py
-from typing import List, Tuple, TypedDict, Optional, Dict, Any, Union, Literal
+from typing import List, Tuple, TypedDict, NamedTuple, Optional, Dict, Any, Union, Literal
 
-class LogicalFieldInfo(TypedDict):
+class LogicalFieldInfo(NamedTuple):
     """
     Represents a logical register field, potentially spanning multiple addresses or bit regions.
     JSON 파일의 "registers" 배열 내 각 객체 정보와 파생된 정보를 저장합니다.
+    NamedTuple이므로 field_info.length 처럼 속성으로 접근합니다 (dict 해싱 없이 고정 오프셋 접근).
     """
     id: str                     # Original ID from JSON, e.g., "PRODUCT_CODE"
     display_name: str           # User-facing name, e.g., "PRODUCT_CODE<11:0>", "ENABLE"
@@ -14,7 +15,7 @@ class LogicalFieldInfo(TypedDict):
     # The following global_lsb/msb_index are relative to the field itself.
     # For a field of 'length' bits, its own LSB is 0 and MSB is length-1.
     global_lsb_index: int       # Typically 0 for the field's own context
-    global_msb_index: int       # Typically field_info['length'] - 1
+    global_msb_index: int       # Typically field_info.length - 1
     
     initial_value_int: int      # Integer representation of the field's initial (reset) value
     description: Optional[str]  # Description of the field, from JSON
@@ -27,11 +28,11 @@ class LogicalFieldInfo(TypedDict):
     #   field_part_lsb_in_field: int, # LSB index of this segment *within the field* (0 to field.length-1)
     #   field_part_msb_in_field: int  # MSB index of this segment *within the field* (0 to field.length-1)
     # )
-    # The list is sorted by field_part_lsb_in_field (LSB part of the field first).
-    regions_mapping: List[Tuple[str, int, int, int, int]]
+    # The tuple is sorted by field_part_lsb_in_field (LSB part of the field first).
+    regions_mapping: Tuple[Tuple[str, int, int, int, int], ...]
 
 
-class AddressBitMapping(TypedDict):
+class AddressBitMapping(NamedTuple):
     """
     Represents how a part of a logical field maps to a specific 8-bit address.
     Used in RegisterMap.address_layout.
@@ -1,14 +1,20 @@
 # core/hardware_control.py
 import time
+import math
+import threading
+import logging
+import functools
 import re # Add re import
 # typing 모듈에서 필요한 요소들을 임포트합니다.
-from typing import Optional, Tuple, Any, ForwardRef, TYPE_CHECKING 
+from typing import Optional, Tuple, Sequence, Any, ForwardRef, TYPE_CHECKING 
 from PyQt5.QtCore import pyqtSignal, QObject
 
 # core 패키지 내 모듈 임포트
 from core import helpers 
 from core import constants 
 
+logger = logging.getLogger(__name__)
+
 # --- raonpy 라이브러리 임포트 ---
 # TYPE_CHECKING은 정적 타입 검사 시에만 True가 됩니다.
 # 이를 통해 런타임 ImportError를 피하면서 타입 힌트를 제공할 수 있습니다.
@@ -51,9 +57,36 @@ except ImportError as e:
 # 순환 참조를 피하기 위해 문자열로 클래스 경로 지정
 SequencePlayerType = ForwardRef('core.sequence_player.SequencePlayer')
 
+# raonpy EVB는 연결이 끊긴 경우 전용 예외 타입 없이 메시지로만 알려주므로,
+# 예외 메시지(args[0])에서 찾을 표식을 미리 소문자로 정의해 둡니다.
+_NOT_OPENED_MARKERS: Tuple[str, ...] = ("is_not_opened", "not opened", "not_opened")
+
+
+def _is_not_opened_error(e: Exception) -> bool:
+    """EVB 미연결(is_not_opened) 상태를 나타내는 예외인지 확인합니다."""
+    msg = e.args[0] if e.args else None
+    if not isinstance(msg, str):
+        return False
+    msg = msg.casefold()
+    return any(marker in msg for marker in _NOT_OPENED_MARKERS)
+
+
+def _requires_connection(fail_result: Any = False):
+    """장치가 연결되어 있지 않거나 instrument가 없으면 메서드를 실행하지 않고 fail_result를 반환합니다."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            if not (self.is_connected and self.instrument):
+                return fail_result
+            return fn(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
 
 class I2CDevice:
     """I2C 장치 제어를 위한 클래스입니다."""
+    __slots__ = ('chip_id', 'evb_instance', 'is_opened')
+
     def __init__(self, chip_id_str: str = "0x18"):
         self.chip_id: int = 0 
         # 타입 힌트를 문자열 리터럴 또는 TYPE_CHECKING 블록 내부의 타입으로 변경
@@ -140,8 +173,8 @@ class I2CDevice:
                 print(f"Error: EVB 인스턴스에 'i2c0_change_port' 메서드가 없습니다.")
                 return False
         except Exception as e: 
-            print(f"Error: I2C 포트 변경 중 오류 발생 ('{str(e)}'). EVB 연결 상태를 확인하세요.")
-            if "is_not_opened" in str(e).lower(): 
+            print(f"Error: I2C 포트 변경 중 오류 발생 ('{e}'). EVB 연결 상태를 확인하세요.")
+            if _is_not_opened_error(e):
                 self.is_opened = False
             return False
 
@@ -168,7 +201,7 @@ class I2CDevice:
             return False
         except Exception as e:
             print(f"Error: I2C 쓰기 중 예외 발생 (Addr: {address_hex_str}, Val: {value_hex_str}): {e}")
-            if "is_not_opened" in str(e).lower(): self.is_opened = False
+            if _is_not_opened_error(e): self.is_opened = False
             return False
 
     def read(self, address_hex_str: str) -> tuple[bool, Optional[int]]: 
@@ -190,9 +223,30 @@ class I2CDevice:
             return False, None
         except Exception as e:
             print(f"Error: I2C 읽기 중 예외 발생 (Addr: {address_hex_str}): {e}")
-            if "is_not_opened" in str(e).lower(): self.is_opened = False
+            if _is_not_opened_error(e): self.is_opened = False
             return False, None
 
+    def write_program(self, program: Sequence[Tuple[int, int]]) -> bool:
+        """
+        이미 정수로 변환된 (주소, 값) 쌍들을 순서대로 씁니다.
+        쓰기마다 hex 문자열을 정규화/파싱하는 write()와 달리 변환 없이 바로 레지스터에 씁니다.
+        """
+        if not self.evb_instance or not self.is_opened:
+            print("Error: I2C EVB가 초기화되지 않았거나 연결되지 않았습니다 (write_program).")
+            return False
+        reg_write = self.evb_instance.i2c0_reg16_write
+        chip_id = self.chip_id
+        address = value = 0
+        try:
+            for address, value in program:
+                time.sleep(0.005)
+                reg_write(chip_id, address, value)
+            return True
+        except Exception as e:
+            print(f"Error: I2C 프로그램 쓰기 중 예외 발생 (Addr: 0x{address:04X}, Val: 0x{value:02X}): {e}")
+            if _is_not_opened_error(e): self.is_opened = False
+            return False
+
     def close(self):
         if self.evb_instance and self.is_opened:
             try:
@@ -205,6 +259,8 @@ class I2CDevice:
 
 class GPIBDevice:
     """GPIB 계측기 제어를 위한 기본 클래스입니다."""
+    # 주의: Chamber가 QObject와 함께 다중 상속하므로 __slots__를 둘 수 없습니다
+    # (sip 래퍼와 인스턴스 레이아웃이 충돌함).
     def __init__(self, serial_number_str: str, device_name: str, device_class_ref: Any):
         self.serial_number = serial_number_str 
         self.device_name = device_name
@@ -366,10 +422,12 @@ class Multimeter(GPIBDevice):
     def __init__(self, serial_number_str: str):
         # Match the device_name string used in your connect logic
         super().__init__(serial_number_str, "Multimeter (Agilent34401A)", agilent34401a_runtime_class)
+        self._current_terminal: Optional[str] = None # 마지막으로 설정한 터미널 (연결 직후에는 알 수 없음)
 
     def connect(self) -> bool:
         # Override to always disable beep after connecting
         connected = super().connect()
+        self._current_terminal = None
         if connected:
             # Try to disable beep
             try:
@@ -462,6 +520,10 @@ class Multimeter(GPIBDevice):
             print(f"DEBUG_DMM_ST: Not connected or no instrument for set_terminal.")
             return False
         
+        if terminal_type_str.upper() == self._current_terminal:
+            print(f"DEBUG_DMM_ST: DMM Terminal already {self._current_terminal}. Skipping.")
+            return True
+
         cmd = ""
         # Ensure terminal_type_str is compared against values from constants
         if terminal_type_str.upper() == constants.TERMINAL_FRONT: # Use constants.TERMINAL_FRONT.upper() if constants.TERMINAL_FRONT is 'FRONT'
@@ -483,6 +545,7 @@ class Multimeter(GPIBDevice):
                 print("INFO: DMM beep disabled after terminal change (SYST:BEEP:STAT OFF sent)")
             except Exception as e:
                 print(f"Warning: Failed to disable DMM beep after terminal change: {e}")
+            self._current_terminal = terminal_type_str.upper()
             print(f"DEBUG_DMM_ST: DMM Terminal set to {terminal_type_str.upper()} successfully.")
             return True
         else:
@@ -498,15 +561,32 @@ class Sourcemeter(GPIBDevice):
 
     def connect(self) -> bool:
         if super().connect():
-            return self.reset() and self.gpib_write("*CLS")
+            if self.reset() and self.gpib_write("*CLS"):
+                return True
         return False
 
+    def reset(self) -> bool:
+        # *RST는 계측기 상태를 기본값으로 되돌리므로, 계측기 상태를 기억하는 캐시도 함께 맞춤
+        success = super().reset()
+        if success:
+            self._current_terminal = constants.TERMINAL_FRONT # *RST 후 기본 터미널은 FRONT
+        return success
+
     def set_terminal(self, terminal_type_str: str) -> bool:
-        cmd = f":ROUTe:TERMinals {terminal_type_str.upper()}"
-        success = self.gpib_write(cmd)
+        terminal = terminal_type_str.upper()
+        if terminal == self._current_terminal and self.is_connected:
+            return True # 이미 해당 터미널이므로 릴레이 전환/대기 불필요
+
+        cmd = f":ROUTe:TERMinals {terminal}"
+        # *OPC? 는 릴레이 전환이 끝난 시점에 응답하므로 고정 대기 없이 완료를 기다릴 수 있음
+        success, _ = self.gpib_query(f"{cmd};*OPC?")
+        if not success:
+            # 쿼리를 지원하지 않는 경우 기존 방식(쓰기 후 고정 대기)으로 대체
+            success = self.gpib_write(cmd)
+            if success:
+                time.sleep(1.0) # Changed to 1.0s based on reference
         if success: 
-            self._current_terminal = terminal_type_str.upper() # 현재 터미널 업데이트
-            time.sleep(1.0) # Changed to 1.0s based on reference
+            self._current_terminal = terminal # 현재 터미널 업데이트
         return success
 
     def enable_output(self, state: bool) -> bool:
@@ -550,14 +630,12 @@ class Sourcemeter(GPIBDevice):
     def set_current(self, current_float: float) -> bool: # terminal_type_str 파라미터 제거
         if not self.is_connected: return False
         # 터미널 설정은 여기서 하지 않음.
-        if not self.gpib_write(":SOURce:FUNCtion CURRent"): return False
-        if not self.gpib_write(f":SOURce:CURRent:LEVel {current_float:.6e}"): return False
+        # 소스 기능/레벨/출력 명령을 하나의 SCPI 메시지로 묶어 한 번에 전송.
+        # 소스 기능은 매번 보냄: 계측기가 리셋/전면 패널 조작 등으로 바뀌었을 수 있으므로, 출력 ON 전에 항상 전류 소스임을 보장
         # 전류 소스 설정 시, 전압 감지 및 보호 설정이 필요할 수 있음. 현재는 레벨만 설정.
-        # 예: if not self.gpib_write(":SENSe:FUNCtion 'VOLTage:DC'"): return False
-        # 예: if not self.gpib_write(":SENSe:VOLTage:DC:RANGe:AUTO ON"): return False
-        # 예: if not self.set_protection_voltage(20.0): return False # 보호 전압 설정
-
-        if not self.enable_output(True): return False
+        # 예: ":SENSe:FUNCtion 'VOLTage:DC'", ":SENSe:VOLTage:DC:RANGe:AUTO ON", 보호 전압 설정 등
+        if not self.gpib_write(f":SOURce:FUNCtion CURRent;:SOURce:CURRent:LEVel {current_float:.6e};:OUTPut:STATe ON"):
+            return False
         
         self._cached_set_current = current_float 
         self._cached_set_voltage = None 
@@ -615,9 +693,8 @@ class Sourcemeter(GPIBDevice):
             return False, None
         
         # 전류 측정을 위해 SENSE 기능 설정 (set_voltage 또는 configure_vsource_and_enable에서 이미 했을 수 있음)
-        # 하지만 독립적인 측정 함수 호출 시 안전하게 다시 설정하는 것이 좋을 수 있음.
-        if not self.gpib_write(":SENSe:FUNCtion 'CURRent:DC'"): return False, None
-        if not self.gpib_write(":SENSe:CURRent:DC:RANGe:AUTO ON"): return False, None
+        # 하지만 독립적인 측정 함수 호출 시 안전하게 다시 설정하는 것이 좋을 수 있음. (한 메시지로 전송)
+        if not self.gpib_write(":SENSe:FUNCtion 'CURRent:DC';:SENSe:CURRent:DC:RANGe:AUTO ON"): return False, None
 
         response_str: Optional[str] = None
         try:
@@ -666,102 +743,151 @@ class Chamber(GPIBDevice, QObject):
         QObject.__init__(self, parent) # Pass parent to QObject                              
         
         self.stop_flag_ref: Optional[SequencePlayerType] = None 
+        # 중단 요청 시 온도 대기 루프를 즉시 깨우기 위한 이벤트
+        self._wake_event = threading.Event()
+        # 짧은 시간 내 반복 조회 시 계측기 왕복을 줄이기 위한 현재 온도 캐시 (get_current_temperature의 max_age로 사용 여부 선택)
+        self._cached_current_temperature: Optional[float] = None
+        self._cached_current_ts: float = 0.0
+        # raonpy 드라이버 메서드는 connect 시 한 번만 확인하여 저장 (없으면 None)
+        self._set_temp_fn: Optional[Any] = None
+        self._get_temp_fn: Optional[Any] = None
+        self._start_fn: Optional[Any] = None
+        self._stop_fn: Optional[Any] = None
+        self._power_off_fn: Optional[Any] = None
+        # 여러 스레드(UI, 시퀀스)가 온도를 읽을 때 드라이버 동시 접근을 막고, 캐시 TTL 안의 요청은 한 번의 조회를 공유
+        self._io_lock = threading.RLock()
 
     def set_stop_flag_ref(self, player_instance: SequencePlayerType): # 타입 힌트 수정
         """SequencePlayer의 중단 플래그를 참조하기 위한 메소드"""
         self.stop_flag_ref = player_instance
 
-    # ... (Chamber의 나머지 메소드들은 이전과 동일하게 유지) ...
+    def notify_stop(self):
+        """중단 요청을 알려 진행 중인 온도 안정화 대기를 즉시 깨웁니다."""
+        self._wake_event.set()
+
+    def _resolve_method(self, *names: str) -> Optional[Any]:
+        """instrument에서 주어진 이름 순서대로 처음 존재하는 메서드를 반환합니다."""
+        for name in names:
+            fn = getattr(self.instrument, name, None)
+            if fn is not None:
+                return fn
+        return None
+
+    def connect(self) -> bool:
+        connected = super().connect()
+        if connected:
+            self._set_temp_fn = self._resolve_method('set_target_temp', 'set_temp', 'setTemperature')
+            self._get_temp_fn = self._resolve_method('get_current_temp', 'get_temp', 'readTemperature')
+            self._start_fn = self._resolve_method('start', 'run')
+            self._stop_fn = self._resolve_method('stop')
+            self._power_off_fn = self._resolve_method('power_off')
+            self._invalidate_current_temperature()
+            logger.debug("Chamber resolved methods - set_temp: %s, get_temp: %s, start: %s",
+                         getattr(self._set_temp_fn, '__name__', None),
+                         getattr(self._get_temp_fn, '__name__', None),
+                         getattr(self._start_fn, '__name__', None))
+        return connected
+
+    def disconnect(self):
+        with self._io_lock:
+            super().disconnect()
+        self._invalidate_current_temperature()
+
+    def _invalidate_current_temperature(self):
+        self._cached_current_temperature = None
+        self._cached_current_ts = 0.0
+
+    def get_cached_current_temperature(self) -> Optional[float]: return self._cached_current_temperature
+
+    @_requires_connection(False)
     def set_target_temperature(self, temperature_float: float) -> bool:
-        if not self.is_connected or not self.instrument: return False
+        if self._set_temp_fn is None:
+            print(f"Error: {self.device_name}에 온도 설정 메서드가 없거나 SCPI 명령 전송 실패.")
+            return False
         try:
-            # Log the attempt to set temperature
-            print(f"DEBUG_CHAMBER: Attempting to set target temperature to {temperature_float}°C via raonpy.")
-            if hasattr(self.instrument, 'set_target_temp'): 
-                self.instrument.set_target_temp(temperature_float)
-                print(f"DEBUG_CHAMBER: Called self.instrument.set_target_temp({temperature_float})")
-            elif hasattr(self.instrument, 'set_temp'): 
-                self.instrument.set_temp(temperature_float)
-                print(f"DEBUG_CHAMBER: Called self.instrument.set_temp({temperature_float})")
-            elif hasattr(self.instrument, 'setTemperature'): 
-                self.instrument.setTemperature(temperature_float)
-                print(f"DEBUG_CHAMBER: Called self.instrument.setTemperature({temperature_float})")
-            else:
-                print(f"Error: {self.device_name}에 온도 설정 메서드가 없거나 SCPI 명령 전송 실패.")
-                return False
+            with self._io_lock:
+                self._set_temp_fn(temperature_float)
             self._cached_target_temperature = temperature_float 
-            print(f"DEBUG_CHAMBER: Target temperature {temperature_float}°C set and cached.")
+            self._invalidate_current_temperature()
+            logger.debug("Chamber target temperature %s°C set and cached.", temperature_float)
             return True
         except Exception as e:
             print(f"Error: Chamber 목표 온도 설정 중 오류: {e}")
             return False
 
+    @_requires_connection(False)
     def start_operation(self) -> bool:
-        if not self.is_connected or not self.instrument: return False
+        if self._start_fn is None:
+            print(f"Error: {self.device_name}에 동작 시작 메서드가 없거나 SCPI 명령 전송 실패.")
+            return False
         try:
-            print(f"DEBUG_CHAMBER: Attempting to start chamber operation via raonpy.")
-            if hasattr(self.instrument, 'start'): 
-                self.instrument.start()
-                print(f"DEBUG_CHAMBER: Called self.instrument.start()")
-            elif hasattr(self.instrument, 'run'): 
-                self.instrument.run()
-                print(f"DEBUG_CHAMBER: Called self.instrument.run()")
-            else: 
-                print(f"Error: {self.device_name}에 동작 시작 메서드가 없거나 SCPI 명령 전송 실패.")
-                return False
+            with self._io_lock:
+                self._start_fn()
             return True
         except Exception as e: print(f"Error: Chamber 동작 시작 중 오류: {e}"); return False
 
-    def get_current_temperature(self) -> tuple[bool, Optional[float]]:
-        if not self.is_connected or not self.instrument: return False, None
-        current_temp_val: Any = None
+    @_requires_connection((False, None))
+    def get_current_temperature(self, max_age: float = 0.0) -> tuple[bool, Optional[float]]:
+        """
+        현재 온도를 읽습니다. 기본값(max_age=0)은 항상 계측기에서 새로 읽습니다.
+        UI 주기 표시처럼 캐시를 공유해도 되는 호출자는 max_age(예: CHAMBER_TEMP_CACHE_TTL_SEC)를 지정하면,
+        마지막 측정값이 max_age초 이내일 때 계측기 조회 없이 캐시 값을 반환합니다.
+        """
+        if self._get_temp_fn is None:
+            print(f"Error: {self.device_name}에 현재 온도 읽기 메서드가 없거나 SCPI 쿼리 실패.")
+            return False, None
+        with self._io_lock:
+            # 잠금을 기다리는 동안 다른 스레드가 방금 읽었으면 그 값을 함께 사용 (동시 요청이 계측기를 중복 조회하지 않음)
+            if (max_age > 0 and self._cached_current_temperature is not None
+                    and time.monotonic() - self._cached_current_ts < max_age):
+                return True, self._cached_current_temperature
+            return self._read_temperature()
+
+    def _read_temperature(self) -> tuple[bool, Optional[float]]:
+        """드라이버에서 온도를 직접 읽고 캐시를 갱신합니다."""
+        if not self.is_connected or self._get_temp_fn is None: return False, None
         try:
-            print(f"DEBUG_CHAMBER_GET_TEMP: Attempting to get current temperature via raonpy.")
-            if hasattr(self.instrument, 'get_current_temp'): 
-                current_temp_val = self.instrument.get_current_temp()
-                print(f"DEBUG_CHAMBER_GET_TEMP: Raw value from get_current_temp: {current_temp_val}")
-            elif hasattr(self.instrument, 'get_temp'): 
-                current_temp_val = self.instrument.get_temp()
-                print(f"DEBUG_CHAMBER_GET_TEMP: Raw value from get_temp: {current_temp_val}")
-            elif hasattr(self.instrument, 'readTemperature'): 
-                current_temp_val = self.instrument.readTemperature()
-                print(f"DEBUG_CHAMBER_GET_TEMP: Raw value from readTemperature: {current_temp_val}")
-            else:
-                print(f"Error: {self.device_name}에 현재 온도 읽기 메서드가 없거나 SCPI 쿼리 실패.")
-                return False, None
-
+            with self._io_lock:
+                current_temp_val: Any = self._get_temp_fn()
             if current_temp_val is not None:
                 try:
-                    value_str = str(current_temp_val).strip()
-                    if not value_str:
-                        return False, None
-                    current_temp_float = float(value_str)
-                    # 소수점 첫째 자리까지 버림
-                    truncated_temp = float(int(current_temp_float * 10) / 10)
+                    if isinstance(current_temp_val, (int, float)):
+                        current_temp_float = float(current_temp_val)
+                    else:
+                        value_str = str(current_temp_val).strip()
+                        if not value_str:
+                            return False, None
+                        current_temp_float = float(value_str)
+                    # 소수점 첫째 자리까지 버림 (* 0.1 대신 / 10: 25.3 같은 값을 정확히 표현)
+                    truncated_temp = math.trunc(current_temp_float * 10) / 10
+                    self._cached_current_temperature = truncated_temp
+                    self._cached_current_ts = time.monotonic()
                     return True, truncated_temp
-                except (ValueError, TypeError):
+                except (ValueError, TypeError, OverflowError):
                     print(f"Error: Chamber 현재 온도 값 파싱 오류: {current_temp_val}")
                     return False, None
             return False, None 
         except Exception as e: print(f"Error: Chamber 현재 온도 읽기 중 오류: {e}"); return False, None
 
+    @_requires_connection(False)
     def stop_operation(self) -> bool:
-        if not self.is_connected or not self.instrument: return False
+        if self._stop_fn is None:
+            print(f"Error: {self.device_name}에 동작 중지 메서드가 없거나 SCPI 명령 전송 실패.")
+            return False
         try:
-            if hasattr(self.instrument, 'stop'): self.instrument.stop()
-            else: 
-                print(f"Error: {self.device_name}에 동작 중지 메서드가 없거나 SCPI 명령 전송 실패.")
-                return False
+            with self._io_lock:
+                self._stop_fn()
             return True
         except Exception as e: print(f"Error: Chamber 동작 중지 중 오류: {e}"); return False
 
+    @_requires_connection(False)
     def power_off(self) -> bool: 
-        if not self.is_connected or not self.instrument: return False
+        if self._power_off_fn is None:
+            print("Warning: Chamber에 power_off 기능이 명시적으로 없습니다. 동작 중지만 수행합니다.")
+            return self.stop_operation() 
         try:
-            if hasattr(self.instrument, 'power_off'): self.instrument.power_off()
-            else: 
-                print("Warning: Chamber에 power_off 기능이 명시적으로 없습니다. 동작 중지만 수행합니다.")
-                return self.stop_operation() 
+            with self._io_lock:
+                self._power_off_fn()
             return True
         except Exception as e: print(f"Error: Chamber 전원 끄는 중 오류: {e}"); return False
 
@@ -771,46 +897,56 @@ class Chamber(GPIBDevice, QObject):
                               timeout_sec: float = constants.DEFAULT_CHAMBER_CHECK_TEMP_TIMEOUT_SEC
                              ) -> tuple[bool, Optional[float]]:
         if not self.is_connected: return False, None
-        start_time = time.time()
+        start_time = time.monotonic()
         last_measured_temp: Optional[float] = None
+        self._wake_event.clear()
         
         log_msg_prefix = "Chamber (is_temperature_stable):"
         self.log_message_signal.emit(f"{log_msg_prefix} 온도 안정화 시작 (목표: {target_temp}°C, 허용오차: ±{tolerance}°C, 제한시간: {timeout_sec}초)")
-        print(f"DEBUG_CHAMBER_STABLE: Entry - Target: {target_temp}, Tol: {tolerance}, Timeout: {timeout_sec}")
+        logger.debug("Chamber stable wait entry - Target: %s, Tol: %s, Timeout: %s", target_temp, tolerance, timeout_sec)
 
-        while time.time() - start_time < timeout_sec:
+        while time.monotonic() - start_time < timeout_sec:
+            iter_start = time.monotonic()
             if self.stop_flag_ref and self.stop_flag_ref.request_stop_flag:
                 msg_stop = f"{log_msg_prefix} 온도 안정화 대기 중 중단 요청됨."
                 self.log_message_signal.emit(msg_stop)
-                print(f"DEBUG_CHAMBER_STABLE: {msg_stop}")
+                logger.debug("%s", msg_stop)
                 return False, last_measured_temp
 
-            read_success, current_temp = self.get_current_temperature()
-            print(f"DEBUG_CHAMBER_STABLE: Loop - Read success: {read_success}, Current temp: {current_temp}")
+            # 폴링 간격(최소 CHAMBER_POLL_MIN_INTERVAL_SEC)이 캐시 TTL보다 짧을 수 있으므로 항상 새로 읽음
+            read_success, current_temp = self.get_current_temperature(max_age=0.0)
+            logger.debug("Chamber stable wait loop - Read success: %s, Current temp: %s", read_success, current_temp)
             if read_success and current_temp is not None:
                 last_measured_temp = current_temp
                 self.log_message_signal.emit(f"  Chamber: 현재 {current_temp:.1f}°C (목표 {target_temp}°C)")
-                if abs(current_temp - target_temp) <= tolerance:
+                delta = abs(current_temp - target_temp)
+                if delta <= tolerance:
                     msg_stable = f"{log_msg_prefix} 온도가 {target_temp}°C 로 안정화되었습니다 (현재: {current_temp:.1f}°C)."
                     self.log_message_signal.emit(msg_stable)
-                    print(f"DEBUG_CHAMBER_STABLE: {msg_stable}")
+                    logger.debug("%s", msg_stable)
                     return True, current_temp
+                # 목표에 가까울수록 짧게, 멀수록 길게 폴링
+                sleep_interval = min(constants.CHAMBER_POLL_MAX_INTERVAL_SEC,
+                                     max(constants.CHAMBER_POLL_MIN_INTERVAL_SEC,
+                                         delta * constants.CHAMBER_POLL_SEC_PER_DEG))
             else: 
                 msg_read_fail = f"{log_msg_prefix} 현재 온도 읽기 실패. 재시도..."
                 self.log_message_signal.emit(msg_read_fail)
-                print(f"DEBUG_CHAMBER_STABLE: {msg_read_fail}")
-            
-            sleep_interval = 1.0 
-            time_left = timeout_sec - (time.time() - start_time)
-            actual_sleep = min(sleep_interval, max(0, time_left))
-            if actual_sleep == 0 and time_left > 0: 
-                actual_sleep = time_left
-            print(f"DEBUG_CHAMBER_STABLE: Sleeping for {actual_sleep:.2f}s (Time left: {time_left:.2f}s)")
+                logger.debug("%s", msg_read_fail)
+                sleep_interval = 1.0
+
+            # 읽기/로그에 소요된 시간을 빼서 폴링 주기가 늘어나지 않도록 보정
+            elapsed = time.monotonic() - iter_start
+            time_left = timeout_sec - (time.monotonic() - start_time)
+            actual_sleep = min(max(0.0, sleep_interval - elapsed), max(0.0, time_left))
+            logger.debug("Chamber stable wait sleeping for %.2fs (Time left: %.2fs)", actual_sleep, time_left)
 
-            if actual_sleep > 0:
-                 time.sleep(actual_sleep)
+            # 중단 요청(notify_stop) 시 대기 중이라도 즉시 깨어남
+            if actual_sleep > 0 and self._wake_event.wait(actual_sleep):
+                # 이벤트를 지워 두지 않으면 중단 플래그가 설정되지 않은 경우 이후 wait가 즉시 반환되어 바쁜 루프가 됨
+                self._wake_event.clear()
 
         msg_timeout = f"{log_msg_prefix} 온도 안정화 시간 초과 (목표: {target_temp}°C, 최종: {last_measured_temp if last_measured_temp is not None else 'N/A'}°C, 제한시간: {timeout_sec}초)."
         self.log_message_signal.emit(msg_timeout)
-        print(f"DEBUG_CHAMBER_STABLE: {msg_timeout}")
+        logger.debug("%s", msg_timeout)
         return False, last_measured_temp
\ No newline at end of file
@@ -1,5 +1,6 @@
 # helpers.py
 import re
+import functools
 from typing import List, Optional, Tuple
 
 # pandas는 UI 로직에서 직접 사용하지 않으므로, 헬퍼 함수에서는 pd.isna 대신 일반적인 None 확인을 사용합니다.
@@ -9,6 +10,13 @@ from typing import List, Optional, Tuple
 # import pandas as pd # Optional, if needed for specific helpers not yet defined
 
 from . import constants
+
+# "NAME<...>" 형태 필드 ID의 기본 이름 추출용 (음의 문자 클래스로 백트래킹 없이 매칭)
+_FIELD_BASE_RE = re.compile(r'^([^<]+)<')
+# normalize_hex_input의 16진수 문자 검증용 (bytes.translate로 삭제 후 남는 문자가 있으면 invalid)
+_HEX_BYTES = b"0123456789ABCDEF"
+
+@functools.lru_cache(maxsize=8192)
 def normalize_hex_input(hex_str: Optional[str], 
                         default_num_chars: Optional[int] = None, 
                         add_prefix: bool = True) -> Optional[str]:
@@ -31,10 +39,13 @@ def normalize_hex_input(hex_str: Optional[str],
     if hex_str is None:
         return None
     
-    s = str(hex_str).strip().upper()
+    s = (hex_str if isinstance(hex_str, str) else str(hex_str)).strip()
 
-    if s.startswith("0X"):
+    if s[:2] in ('0x', '0X'):
         s = s[2:]
+    # 이미 대문자이거나 숫자만인 경우(예: "0010")가 많으므로 필요할 때만 새 문자열 생성 ("0010".isupper()는 False)
+    if not (s.isupper() or s.isdigit()):
+        s = s.upper()
     
     if not s: # If string is empty after stripping "0X" (e.g., input was "0x")
         if default_num_chars is not None: # If padding is requested, treat as 0
@@ -42,14 +53,34 @@ def normalize_hex_input(hex_str: Optional[str],
         else: # Otherwise, it's an empty hex string, could be invalid or 0
             return "0x0" if add_prefix else "0" # Or return None if strictly invalid
 
-    if not all(c in "0123456789ABCDEF" for c in s):
-        return None # Contains non-hex characters
+    try:
+        if s.encode('ascii').translate(None, _HEX_BYTES):
+            return None # Contains non-hex characters
+    except UnicodeEncodeError:
+        return None # Non-ASCII characters
 
     if default_num_chars is not None:
         s = s.zfill(default_num_chars)
         
     return "0x" + s if add_prefix else s
 
+# 바이트 값(0~255) -> MSB 우선 비트 문자 8개. convert_hex_to_bits에서 바이트 단위로 펼칠 때 사용
+_BYTE_TO_BITS: Tuple[Tuple[str, ...], ...] = tuple(tuple(format(b, '08b')) for b in range(256))
+
+def convert_hex_to_int(hex_val_str: Optional[str]) -> Optional[int]:
+    """
+    Converts a hexadecimal string (e.g., "0xFF") to an int.
+    Returns None if hex_val_str is None, empty-invalid, or contains non-hex characters.
+    Use this instead of convert_hex_to_bits when only the integer value is needed.
+    """
+    normalized_hex = normalize_hex_input(hex_val_str)
+    if normalized_hex is None:
+        return None
+    try:
+        return int(normalized_hex, 16)
+    except ValueError:
+        return None
+
 def convert_hex_to_bits(hex_val_str: Optional[str], num_bits: int) -> List[str]:
     """
     Converts a hexadecimal string (e.g., "0xFF") to a list of binary strings (MSB first).
@@ -58,34 +89,25 @@ def convert_hex_to_bits(hex_val_str: Optional[str], num_bits: int) -> List[str]:
     """
     if num_bits <= 0:
         return []
-
-    normalized_hex = normalize_hex_input(hex_val_str) # Ensures "0x" prefix for int()
-
-    if normalized_hex is None: # Handles None, empty, or invalid characters
-        # print(f"Debug: normalize_hex_input for '{hex_val_str}' returned None. Defaulting to zeros.")
-        return ['0'] * num_bits 
-
-    try:
-        # Ensure that we are not trying to convert an empty hex string like "0x"
-        if normalized_hex == "0x": # If original was empty or just "0x"
-            val = 0
-        else:
-            val = int(normalized_hex, 16)
-
-        if val < 0:
-             # print(f"Debug: Negative hex value {val} not supported.")
-             return ['ERROR'] * num_bits
-        
-        binary_str = format(val, f'0{num_bits}b')
-        
-        # Handle potential overflow if the number is too large for num_bits
-        if len(binary_str) > num_bits:
-            # print(f"Debug: Hex value {normalized_hex} overflows {num_bits} bits. Truncating MSBs.")
-            return list(binary_str[-num_bits:]) # Take LSBs
-        return list(binary_str)
-    except ValueError:
-        # print(f"Debug: ValueError converting hex '{normalized_hex}' to bits.")
-        return ['ERROR'] * num_bits
+    # 캐시된 결과는 tuple이므로 호출자가 수정할 수 있도록 새 list로 반환
+    return list(_convert_hex_to_bits_cached(hex_val_str, num_bits))
+
+@functools.lru_cache(maxsize=8192)
+def _convert_hex_to_bits_cached(hex_val_str: Optional[str], num_bits: int) -> Tuple[str, ...]:
+    if normalize_hex_input(hex_val_str) is None: # Handles None, empty, or invalid characters
+        return ('0',) * num_bits 
+
+    val = convert_hex_to_int(hex_val_str)
+    if val is None or val < 0:
+        return ('ERROR',) * num_bits
+
+    # Overflow 시 MSB를 버리고 LSB num_bits만 사용
+    val &= (1 << num_bits) - 1
+    num_bytes = (num_bits + 7) // 8
+    bits: List[str] = []
+    for byte_val in val.to_bytes(num_bytes, 'big'):
+        bits.extend(_BYTE_TO_BITS[byte_val])
+    return tuple(bits[-num_bits:])
 
 def convert_bit_list_to_hex_string(bit_list: List[str], 
                                    total_bits_for_field: Optional[int] = None) -> str:
@@ -109,27 +131,27 @@ def convert_bit_list_to_hex_string(bit_list: List[str],
             # which might indicate an issue upstream. For conversion, take MSBs.
             actual_bits_to_convert = bit_list[:total_bits_for_field] 
 
-    valid_bits = []
-    for bit in actual_bits_to_convert:
-        if bit in ('0', '1'):
-            valid_bits.append(bit)
-        elif bit == '' or bit is None: # Treat empty string or None as '0'
-            valid_bits.append('0') 
-        else: # Contains 'ERROR' or other invalid char
-            return "0xERR_BITS" # Indicate an error in the input bits
-
-    if not valid_bits: # If all bits were invalid or empty, resulting in an empty list
+    # '0'/'1'은 그대로, ''/None은 '0', 그 외(예: 'ERROR')는 오류 표식 '\x01'로 한 번에 변환
+    binary_string = "".join(
+        bit if bit in ('0', '1') else '0' if (bit == '' or bit is None) else '\x01'
+        for bit in actual_bits_to_convert
+    )
+    if '\x01' in binary_string:
+        return "0xERR_BITS" # Indicate an error in the input bits
+    if not binary_string: # e.g. total_bits_for_field == 0
         return "0x0"
 
-    binary_string = "".join(valid_bits)
-        
-    try:
-        decimal_value = int(binary_string, 2)
-        # Calculate needed hex digits, ensuring at least 1 for "0"
-        num_hex_digits = max(1, (len(valid_bits) + 3) // 4) 
-        return f"0x{decimal_value:0{num_hex_digits}X}"
-    except ValueError: # Should not happen if bits are '0' or '1'
-        return "0xERR_CONV"
+    return convert_int_to_hex_string(int(binary_string, 2), len(binary_string))
+
+def convert_int_to_hex_string(value: int, num_bits: int) -> str:
+    """
+    Formats an int as a "0x" prefixed, zero-padded hexadecimal string sized for num_bits
+    (e.g., (5, 4) -> "0x5", (5, 12) -> "0x005"). Bit-list free counterpart of
+    convert_bit_list_to_hex_string for callers that already hold the integer.
+    """
+    # Calculate needed hex digits, ensuring at least 1 for "0"
+    num_hex_digits = max(1, (num_bits + 3) // 4)
+    return f"0x{value:0{num_hex_digits}X}"
 
 def map_access_to_type(access_str: Optional[str]) -> str:
     """Maps JSON 'access' string to a simplified 'Type' (RO/RW/WO)."""
@@ -154,8 +176,10 @@ def get_base_name_from_field_id(field_id_str: Optional[str]) -> str:
     if field_id_str is None or str(field_id_str).strip() == "":
         return ""
     
-    s = str(field_id_str)
-    match = re.match(r"(.+?)<.*>$", s)
+    s = field_id_str if isinstance(field_id_str, str) else str(field_id_str)
+    if '<' not in s or not s.endswith('>'):
+        return s
+    match = _FIELD_BASE_RE.match(s)
     if match:
         return match.group(1)
     return s
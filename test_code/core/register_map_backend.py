@@ -1,8 +1,19 @@
 # core/register_map_backend.py
 import json
-import re
 import os
-from typing import List, Tuple, Dict, Any, Optional
+import logging
+import sys
+import mmap
+import functools
+import re
+from operator import itemgetter, attrgetter
+from collections import defaultdict
+from typing import List, Tuple, Dict, Any, Optional, Iterator, Union
+
+try:
+    import orjson # 설치되어 있으면 C 기반 JSON 파서 사용 (대형 레지스터 맵 로딩 속도 개선)
+except ImportError:
+    orjson = None
 
 # --- 수정된 임포트 경로 ---
 # core 패키지 내의 다른 모듈들을 임포트합니다.
@@ -10,16 +21,266 @@ from .data_models import LogicalFieldInfo, AddressBitMapping
 from .helpers import normalize_hex_input, map_access_to_type
 from . import constants # constants도 core 패키지에서 가져옴
 
+try:
+    import numpy as np # pandas 의존성으로 함께 설치됨. REGA 일괄 적용에만 사용
+except ImportError:
+    np = None
+
+try:
+    from numba import njit # 설치되어 있으면 필드 get/set 비트 연산 루프를 JIT 컴파일 (없으면 순수 Python 경로 사용)
+except ImportError:
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+_local_lsb_key = attrgetter('local_lsb') # address_layout 항목 정렬 키
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_addr_key(addr_str: str) -> Optional[str]:
+    """주소 문자열을 address 키 형식("0X" + 최소 4자리 대문자 hex)으로 정규화합니다. 잘못된 형식이면 None.
+    REGA 재생/쓰기 확인에서 같은 주소가 반복되므로 정규화+대문자 변환 결과를 함께 캐시합니다."""
+    norm = normalize_hex_input(addr_str, 4, add_prefix=True)
+    return sys.intern(norm.upper()) if norm else None # 주소 키는 dict 키로 반복 사용되므로 intern
+
+_NORM_ADDR_KEY_RE = re.compile(r"0X[0-9A-F]{4,}") # _normalize_addr_key 결과 형식
+
+_HEX_DIGIT_BYTES = b"0123456789abcdefABCDEF"
+
+def _parse_hex_token(token: bytes) -> Optional[int]:
+    """REGA 파일의 hex 토큰(bytes, "0x" 접두사 선택)을 int로 변환합니다. 16진수가 아니면 None."""
+    if token[:2] in (b'0x', b'0X'):
+        token = token[2:]
+    if not token: # "0x"만 있는 경우 normalize_hex_input과 같이 0으로 취급
+        return 0
+    if token.translate(None, _HEX_DIGIT_BYTES):
+        return None
+    return int(token, 16)
+
+# 8비트 주소 내 (local_offset, local_width) 조합별 (local_mask, clear_mask) 테이블. 인덱스: offset * 9 + width
+_MASK_TABLE: Tuple[Tuple[int, int], ...] = tuple(
+    ((1 << w) - 1, ~(((1 << w) - 1) << o) & 0xFF) for o in range(8) for w in range(9)
+)
+
+@functools.lru_cache(maxsize=1024)
+def _fmt_hex(value_int: int, num_hex_digits: int) -> str:
+    """필드 값을 "0x" + 고정 자릿수 대문자 hex 문자열로 변환합니다. UI 갱신 시 같은 값이 반복되므로 캐시합니다."""
+    return f"0x{value_int:0{num_hex_digits}X}"
+
+# JIT 커널용 필드 region 배열 컬럼: (buf 인덱스, local_bit_offset, local_width, field_part_lsb, local_mask, affected 위치, clear_mask)
+_JIT_MAX_FIELD_BITS = 63 # int64 범위를 넘는 필드는 순수 Python 경로로 처리
+
+def _get_field_kernel(buf, regions, field_mask):
+    value = 0
+    for i in range(regions.shape[0]):
+        value |= ((buf[regions[i, 0]] >> regions[i, 1]) & regions[i, 4]) << regions[i, 3]
+    return value & field_mask
+
+def _set_field_kernel(buf, regions, affected_idx, value):
+    """affected 순서대로 필드 값을 반영한 예상 바이트 값 배열을 반환합니다."""
+    out = np.empty(affected_idx.shape[0], np.int64)
+    for k in range(affected_idx.shape[0]):
+        out[k] = buf[affected_idx[k]]
+    for i in range(regions.shape[0]):
+        k = regions[i, 5]
+        out[k] = (out[k] & regions[i, 6]) | (((value >> regions[i, 3]) & regions[i, 4]) << regions[i, 1])
+    return out
+
+if njit is not None and np is not None:
+    _get_field_kernel = njit(cache=True)(_get_field_kernel)
+    _set_field_kernel = njit(cache=True)(_set_field_kernel)
+    _USE_FIELD_KERNELS = True
+else:
+    _USE_FIELD_KERNELS = False
+
+AddressKey = Union[str, int]
+CompiledRegion = Tuple[int, int, int, int, int, int, str]
+
+class AddressValueStore:
+    """
+    8비트 주소값 저장소. 값은 연속된 bytearray에 (주소 - base) 인덱스로 저장되고,
+    기존 Dict[str, int] 사용처를 위해 "0X...." 문자열 키(또는 int 주소)를 받는 dict 형태 인터페이스를 제공합니다.
+    맵에 정의된 주소만 포함(present)되며, 범위 밖 주소에 대한 쓰기는 소수의 예외로 보고 별도 dict에 보관합니다.
+    """
+    __slots__ = ('base', 'buf', '_present', '_extra')
+
+    def __init__(self, base: int = 0, size: int = 0):
+        self.base: int = base
+        self.buf: bytearray = bytearray(size)
+        self._present: bytearray = bytearray(size) # 1이면 해당 인덱스의 주소가 맵에 정의됨
+        self._extra: Dict[int, int] = {}
+
+    def add_address(self, addr_int: int):
+        """주소를 저장소에 포함시킵니다 (값은 0)."""
+        idx = addr_int - self.base
+        if 0 <= idx < len(self.buf):
+            self._present[idx] = 1
+        else:
+            self._extra.setdefault(addr_int, 0)
+
+    def add_range(self, start_addr: int, end_addr: int):
+        """start_addr~end_addr(포함) 주소를 한 번에 저장소에 포함시킵니다. 버퍼 범위 안이어야 합니다."""
+        start_idx = start_addr - self.base
+        end_idx = end_addr - self.base + 1
+        if start_idx < 0 or end_idx > len(self.buf):
+            raise ValueError(f"Address range 0x{start_addr:04X}-0x{end_addr:04X} is outside the value buffer.")
+        self._present[start_idx:end_idx] = b'\x01' * (end_idx - start_idx)
+
+    def index_of(self, key: AddressKey) -> int:
+        """buf 인덱스를 반환합니다. 버퍼 범위 밖이거나 맵에 없는 주소면 -1."""
+        idx = (key if isinstance(key, int) else int(key, 16)) - self.base
+        if 0 <= idx < len(self.buf) and self._present[idx]:
+            return idx
+        return -1
+
+    def _lookup(self, key: AddressKey) -> Tuple[int, int]:
+        """(buf 인덱스 또는 -1, 주소 int)를 반환합니다. 잘못된 키는 ValueError/TypeError."""
+        addr_int = key if isinstance(key, int) else int(key, 16)
+        idx = addr_int - self.base
+        if 0 <= idx < len(self.buf) and self._present[idx]:
+            return idx, addr_int
+        return -1, addr_int
+
+    def update_existing(self, updates: Dict[int, int]) -> List[int]:
+        """
+        {주소 int: 값} 중 저장소에 이미 있는 주소만 한 번에 갱신하고, 없는 주소 목록을 반환합니다.
+        NumPy가 있으면 버퍼 뷰에 대한 fancy-index 대입 한 번으로 처리합니다.
+        """
+        if not updates:
+            return []
+        if np is None or not self.buf:
+            rejected = []
+            for addr_int, val_int in updates.items():
+                if addr_int in self:
+                    self[addr_int] = val_int
+                else:
+                    rejected.append(addr_int)
+            return rejected
+
+        addrs = np.fromiter(updates.keys(), dtype=np.int64, count=len(updates))
+        vals = np.fromiter((v & 0xFF for v in updates.values()), dtype=np.uint8, count=len(updates))
+        idx = addrs - self.base
+        in_buf = (idx >= 0) & (idx < len(self.buf))
+        valid = in_buf.copy()
+        present = np.frombuffer(self._present, dtype=np.uint8)
+        valid[in_buf] = present[idx[in_buf]] != 0
+        np.frombuffer(self.buf, dtype=np.uint8)[idx[valid]] = vals[valid] # bytearray를 직접 갱신하는 뷰
+
+        rejected = []
+        for addr_int, val_int in zip(addrs[~valid].tolist(), vals[~valid].tolist()):
+            if addr_int in self._extra:
+                self._extra[addr_int] = val_int
+            else:
+                rejected.append(addr_int)
+        return rejected
+
+    def __getitem__(self, key: AddressKey) -> int:
+        try:
+            idx, addr_int = self._lookup(key)
+        except (ValueError, TypeError):
+            raise KeyError(key)
+        if idx >= 0:
+            return self.buf[idx]
+        if addr_int in self._extra:
+            return self._extra[addr_int]
+        raise KeyError(key)
+
+    def get(self, key: AddressKey, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: AddressKey, value: int):
+        idx, addr_int = self._lookup(key)
+        if idx >= 0:
+            self.buf[idx] = value & 0xFF
+        elif 0 <= addr_int - self.base < len(self.buf):
+            self._present[addr_int - self.base] = 1
+            self.buf[addr_int - self.base] = value & 0xFF
+        else:
+            self._extra[addr_int] = value & 0xFF
+
+    def update(self, values: Dict[AddressKey, int]):
+        """여러 주소 값을 한 번에 설정합니다 (__setitem__과 동일한 규칙)."""
+        buf = self.buf
+        present = self._present
+        base = self.base
+        size = len(buf)
+        for key, value in values.items():
+            idx = (key if isinstance(key, int) else int(key, 16)) - base
+            if 0 <= idx < size and present[idx]:
+                buf[idx] = value & 0xFF
+            else:
+                self[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            idx, addr_int = self._lookup(key) # type: ignore[arg-type]
+        except (ValueError, TypeError):
+            return False
+        return idx >= 0 or addr_int in self._extra
+
+    def _iter_addresses(self) -> Iterator[int]:
+        present = self._present
+        base = self.base
+        for idx in range(len(present)):
+            if present[idx]:
+                yield base + idx
+        yield from self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        for addr_int in self._iter_addresses():
+            yield f"0X{addr_int:04X}"
+
+    def keys(self) -> Iterator[str]:
+        return iter(self)
+
+    def values(self) -> Iterator[int]:
+        for addr_int in self._iter_addresses():
+            yield self[addr_int]
+
+    def items(self) -> Iterator[Tuple[str, int]]:
+        for addr_int in self._iter_addresses():
+            yield f"0X{addr_int:04X}", self[addr_int]
+
+    def __len__(self) -> int:
+        return self._present.count(1) + len(self._extra)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def clear(self):
+        self.base = 0
+        self.buf = bytearray()
+        self._present = bytearray()
+        self._extra = {}
+
+    def copy(self) -> 'AddressValueStore':
+        new_store = AddressValueStore.__new__(AddressValueStore)
+        new_store.base = self.base
+        new_store.buf = bytearray(self.buf)
+        new_store._present = bytearray(self._present)
+        new_store._extra = dict(self._extra)
+        return new_store
+
 class RegisterMap:
     def __init__(self):
         self.metadata: Dict[str, Any] = {}
         self.logical_fields_map: Dict[str, LogicalFieldInfo] = {}
         # address_layout: 각 8비트 주소(str, "0xFFFF")에 어떤 필드의 어떤 부분이 매핑되는지 리스트로 저장
         self.address_layout: Dict[str, List[AddressBitMapping]] = {}
-        # initial_address_values: 각 8비트 주소의 초기값 (int)
-        self.initial_address_values: Dict[str, int] = {}
-        # current_address_values: 각 8비트 주소의 현재값 (int), UI나 REGA 파일에 의해 변경될 수 있음
-        self.current_address_values: Dict[str, int] = {}
+        # 불변 조건: RegisterMap 내부의 모든 주소 문자열(regions_mapping, address_layout 키, I2C op 키)은
+        # "0X" 접두사 + 대문자 hex 형식으로 로드 시 한 번만 정규화됩니다. 이후 .upper() 호출이 필요 없습니다.
+        # initial_address_values: 각 8비트 주소의 초기값 (bytearray 기반, "0XFFFF" 문자열 키로도 접근 가능)
+        self.initial_address_values: AddressValueStore = AddressValueStore()
+        # current_address_values: 각 8비트 주소의 현재값, UI나 REGA 파일에 의해 변경될 수 있음
+        self.current_address_values: AddressValueStore = AddressValueStore()
+        # 필드별로 로드 시 미리 계산한 (field_mask, regions, affected, hex 자릿수) 값. get/set 핫패스에서 dict 조회/마스크 계산 제거
+        # regions: (buf 인덱스, local_bit_offset, local_width, field_part_lsb, local_mask, clear_mask, 주소 키) 튜플
+        # affected: 필드가 걸친 주소의 (buf 인덱스, 주소 키), 주소 순 정렬/중복 제거
+        self._compiled_fields: Dict[str, Tuple[int, Tuple[CompiledRegion, ...], Tuple[Tuple[int, str], ...], int]] = {}
+        # Numba 사용 시 필드별 (region 배열, affected buf 인덱스 배열). 63비트 이하 필드만 포함
+        self._kernel_fields: Dict[str, Tuple[Any, Any]] = {}
 
         self._bits_per_address: int = constants.BITS_PER_ADDRESS
         self._min_addr_int: int = 0
@@ -34,11 +295,12 @@ class RegisterMap:
         parsing_errors: List[str] = [] # 파싱 오류 메시지 저장
 
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(json_path, 'rb') as f:
+                raw_bytes = f.read()
+            data = orjson.loads(raw_bytes) if orjson is not None else json.loads(raw_bytes)
         except FileNotFoundError:
             return False, [f"JSON file '{json_path}' not found."]
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, ValueError) as e: # orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스
             return False, [f"Could not decode JSON from '{json_path}'. Details: {e}"]
         except Exception as e:
             return False, [f"An unexpected error occurred while opening/reading JSON file '{json_path}': {e}"]
@@ -49,6 +311,8 @@ class RegisterMap:
         self.address_layout.clear()
         self.initial_address_values.clear()
         self.current_address_values.clear()
+        self._compiled_fields.clear()
+        self._kernel_fields.clear()
 
         self.metadata = {k: v for k, v in data.items() if k != "registerBlocks"}
         self._json_big_endian_flag = self.metadata.get("bigEndian", False)
@@ -89,7 +353,7 @@ class RegisterMap:
                     parsing_errors.append(f"Warning: Invalid register data format or missing 'id' in block. Skipping register: {reg_data}")
                     continue
 
-                field_id = str(reg_data["id"])
+                field_id = sys.intern(str(reg_data["id"]))
                 try:
                     total_length = int(reg_data.get("length", 0))
                 except (ValueError, TypeError):
@@ -122,26 +386,27 @@ class RegisterMap:
                     parsing_errors.append(f"Warning: Field '{field_id}' has no regions defined or regions is not a list. Skipping field.")
                     continue
                 
+                # 각 region의 주소를 한 번만 정규화/파싱하여 (주소 int, bitOffset, 정규화 주소, region)으로 준비 후 정렬
                 try:
-                    sorted_regions_for_field_assembly = sorted(
-                        raw_regions,
-                        key=lambda r: (int(normalize_hex_input(str(r["address"]), add_prefix=True) or "0", 16), int(r.get("bitOffset",0)))
-                    )
-                except (KeyError, ValueError, TypeError) as e:
+                    prepped_regions: List[Tuple[int, int, Optional[str], Dict[str, Any]]] = []
+                    for r in raw_regions:
+                        addr_hex_norm = _normalize_addr_key(str(r["address"]))
+                        prepped_regions.append((int(addr_hex_norm, 16) if addr_hex_norm else 0,
+                                                int(r.get("bitOffset", 0)), addr_hex_norm, r))
+                    prepped_regions.sort(key=itemgetter(0, 1))
+                except (KeyError, ValueError, TypeError, AttributeError) as e:
                     parsing_errors.append(f"Error: Field '{field_id}': Invalid region data for sorting. Error: {e}. Skipping field.")
                     continue
 
                 field_bit_cursor_from_msb = total_length
                 accumulated_region_width = 0
 
-                for region in sorted_regions_for_field_assembly:
+                for _, _, addr_hex_norm, region in prepped_regions:
                     try:
-                        addr_val_str = str(region["address"])
-                        addr_hex_norm = normalize_hex_input(addr_val_str, 4, add_prefix=True)
                         if not addr_hex_norm:
-                            parsing_errors.append(f"Warning: Field '{field_id}', Region Address '{addr_val_str}': Invalid format. Skipping region.")
+                            parsing_errors.append(f"Warning: Field '{field_id}', Region Address '{region['address']}': Invalid format. Skipping region.")
                             continue
-                        addr_hex = addr_hex_norm.upper()
+                        addr_hex = addr_hex_norm
 
                         local_offset = int(region["bitOffset"])
                         local_width = int(region["bitWidth"])
@@ -179,7 +444,7 @@ class RegisterMap:
                 if accumulated_region_width != total_length:
                      parsing_errors.append(f"Warning: Field '{field_id}' total length ({total_length}) does not match sum of region bitWidths ({accumulated_region_width}).")
 
-                regions_mapping_list.sort(key=lambda x: x[3]) # Sort by field_part_lsb_in_field
+                regions_mapping_list.sort(key=itemgetter(3)) # Sort by field_part_lsb_in_field
                 
                 display_name_length = total_length # JSON에 명시된 길이로 display name 구성
                 if (total_length - field_bit_cursor_from_msb) != total_length and (total_length - field_bit_cursor_from_msb) > 0 :
@@ -196,7 +461,7 @@ class RegisterMap:
                     global_msb_index=total_length - 1 if total_length > 0 else 0,
                     initial_value_int=initial_val_int,
                     description=description_str, # 수정된 부분: description 추가
-                    regions_mapping=regions_mapping_list
+                    regions_mapping=tuple(regions_mapping_list)
                 )
         
         if not self.logical_fields_map and not parsing_errors:
@@ -214,130 +479,167 @@ class RegisterMap:
         Populates self.address_layout (mapping addresses to field parts)
         and self.initial_address_values (8-bit integer value for each address).
         """
-        self.initial_address_values.clear()
         self.address_layout.clear()
+        self._compiled_fields.clear()
+        self._kernel_fields.clear()
 
-        all_involved_addresses = set()
+        field_addresses = set()
         for field_info in self.logical_fields_map.values():
-            for addr_hex, _, _, _, _ in field_info['regions_mapping']:
-                all_involved_addresses.add(addr_hex.upper())
-        
-        for addr_int in range(self._min_addr_int, self._max_addr_int + 1):
-            all_involved_addresses.add(f"0X{addr_int:04X}")
-
-        for addr_h in sorted(list(all_involved_addresses)): # 주소 순으로 처리
-            self.initial_address_values[addr_h] = 0
-            self.address_layout[addr_h] = []
-
+            for addr_hex, _, _, _, _ in field_info.regions_mapping:
+                field_addresses.add(addr_hex)
+
+        # 주소 범위(min~max)와 필드가 사용하는 모든 주소를 포함하는 연속 버퍼를 한 번에 할당
+        # (범위 내 주소마다 문자열 키를 만들지 않음)
+        field_addr_ints = [int(addr_h, 16) for addr_h in field_addresses]
+        buf_base = min(self._min_addr_int, min(field_addr_ints, default=self._min_addr_int))
+        buf_end = max(self._max_addr_int, max(field_addr_ints, default=self._max_addr_int))
+        initial_values = AddressValueStore(buf_base, buf_end - buf_base + 1)
+        initial_values.add_range(self._min_addr_int, self._max_addr_int)
+        for addr_int in field_addr_ints:
+            initial_values.add_address(addr_int)
+
+        # address_layout은 필드가 실제로 사용하는 주소만 포함 (한 번의 순회로 구성)
+        layout: Dict[str, List[AddressBitMapping]] = defaultdict(list)
+
+        buf = initial_values.buf
         for field_id, field_info in self.logical_fields_map.items():
-            field_initial_value = field_info['initial_value_int']
-            field_total_length = field_info['length']
+            field_initial_value = field_info.initial_value_int
+            compiled_regions: List[CompiledRegion] = []
 
-            for addr_hex, local_bit_offset, local_width, field_part_lsb, field_part_msb in field_info['regions_mapping']:
-                addr_key = addr_hex.upper() 
+            for addr_hex, local_bit_offset, local_width, field_part_lsb, field_part_msb in field_info.regions_mapping:
+                addr_key = addr_hex
+                addr_idx = int(addr_key, 16) - buf_base
 
-                mask_for_field_part = ((1 << local_width) - 1)
+                mask_for_field_part, clear_mask = _MASK_TABLE[local_bit_offset * 9 + local_width]
                 part_value_from_field = (field_initial_value >> field_part_lsb) & mask_for_field_part
+                buf[addr_idx] |= (part_value_from_field << local_bit_offset)
+                compiled_regions.append((addr_idx, local_bit_offset, local_width, field_part_lsb,
+                                         mask_for_field_part, clear_mask, addr_key))
 
-                current_addr_val = self.initial_address_values.get(addr_key, 0)
-                current_addr_val |= (part_value_from_field << local_bit_offset)
-                self.initial_address_values[addr_key] = current_addr_val
-
-                self.address_layout.setdefault(addr_key, []).append(AddressBitMapping(
+                layout[addr_key].append(AddressBitMapping(
                     field_id=field_id,
                     local_lsb=local_bit_offset,
                     local_msb=local_bit_offset + local_width - 1,
                     field_part_lsb_relative_to_field_lsb=field_part_lsb,
                     field_part_msb_relative_to_field_lsb=field_part_msb
                 ))
-
-        for addr_hex_key in self.address_layout:
-            self.address_layout[addr_hex_key].sort(key=lambda x: x['local_lsb'])
+            field_mask = (1 << field_info.length) - 1 if field_info.length > 0 else 0
+            num_hex_digits = (field_info.length + 3) // 4 if field_info.length > 0 else 1
+            affected = tuple(sorted({(region[0], region[6]) for region in compiled_regions}))
+            self._compiled_fields[field_id] = (field_mask, tuple(compiled_regions), affected, num_hex_digits)
+            if _USE_FIELD_KERNELS and field_info.length <= _JIT_MAX_FIELD_BITS:
+                self._kernel_fields[field_id] = self._compile_field_arrays(compiled_regions, affected)
+
+        self.initial_address_values = initial_values
+
+        # 일반 dict로 변환, 각 주소의 항목은 local_lsb 순으로 정렬
+        # (주소 키 순서는 사용처가 없으므로 주소 문자열 정렬은 하지 않음)
+        for mappings in layout.values():
+            mappings.sort(key=_local_lsb_key)
+        self.address_layout.update(layout)
+
+    @staticmethod
+    def _compile_field_arrays(compiled_regions: List[CompiledRegion], affected: Tuple[Tuple[int, str], ...]) -> Tuple[Any, Any]:
+        """JIT 커널에 넘길 (region 배열, affected buf 인덱스 배열)을 만듭니다."""
+        affected_pos = {addr_idx: k for k, (addr_idx, _) in enumerate(affected)}
+        regions = np.array([(addr_idx, local_offset, local_width, field_part_lsb, local_mask, affected_pos[addr_idx], clear_mask)
+                            for addr_idx, local_offset, local_width, field_part_lsb, local_mask, clear_mask, _ in compiled_regions],
+                           dtype=np.int64).reshape(-1, 7)
+        affected_idx = np.array([addr_idx for addr_idx, _ in affected], dtype=np.int64)
+        return regions, affected_idx
 
     def apply_rega_updates(self, rega_path: str):
         """Parses a .rega file and updates self.current_address_values."""
-        rega_updates_dict = self._parse_rega_to_updates_dict(rega_path)
-        for addr_hex_rega, value_hex_str_rega in rega_updates_dict.items():
-            addr_key = addr_hex_rega.upper() # Normalized address
-            try:
-                val_int = int(value_hex_str_rega, 16)
-                if addr_key in self.current_address_values:
-                    self.current_address_values[addr_key] = val_int
-                else:
-                    # If address from REGA is not in JSON map, it might be an error or intended.
-                    # Current behavior: only update if address is known from JSON.
-                    print(f"Warning: REGA - Address '{addr_key}' not in current map derived from JSON. Value not applied from REGA.")
-            except ValueError:
-                print(f"Warning: REGA - Invalid hex value '{value_hex_str_rega}' for address '{addr_key}'.")
+        rega_updates = self._parse_rega_to_int_updates(rega_path)
+        # If address from REGA is not in JSON map, it might be an error or intended.
+        # Current behavior: only update if address is known from JSON.
+        rejected = self.current_address_values.update_existing(rega_updates)
+        if rejected:
+            logger.warning("REGA - %d address(es) not in current map derived from JSON. Values not applied from REGA: %s",
+                           len(rejected), ", ".join(f"0X{addr_int:04X}" for addr_int in rejected))
 
     def _parse_rega_to_updates_dict(self, rega_path: str) -> Dict[str, str]:
         """Parses a .rega file into a dictionary {addr_hex_norm_upper: value_hex_norm_upper}."""
-        updates: Dict[str, str] = {}
-        try:
-            with open(rega_path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line or line.startswith('#'): # Skip comments or empty lines
-                        continue
-                    
-                    line_content = line.split('#', 1)[0].strip() # Remove inline comments
-                    parts = re.split(r'\s+', line_content) # Split by whitespace
+        return {sys.intern(f"0X{addr_int:04X}"): f"0X{val_int:02X}"
+                for addr_int, val_int in self._parse_rega_to_int_updates(rega_path).items()}
 
-                    if len(parts) >= 2:
-                        addr_str_raw = parts[0]
-                        val_str_raw = parts[1]
-                        
-                        addr_str_norm = normalize_hex_input(addr_str_raw, 4) # Normalize to 4-char hex
-                        val_str_norm = normalize_hex_input(val_str_raw, 2)   # Normalize to 2-char hex
+    def _parse_rega_to_int_updates(self, rega_path: str) -> Dict[int, int]:
+        """
+        Parses a .rega file into a dictionary {address_int: value_int}.
+        파일을 mmap으로 한 줄씩 읽고 bytes 상태로 파싱하여 줄마다 str 디코딩/정규화 문자열을 만들지 않습니다.
+        """
+        updates: Dict[int, int] = {}
+        try:
+            with open(rega_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0: # 빈 파일은 mmap 불가
+                    return updates
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for line_num, raw_line in enumerate(iter(mm.readline, b""), 1):
+                        if raw_line[:1] == b'#': # 줄 맨 앞 주석은 strip 전에 건너뜀
+                            continue
+                        line = raw_line.strip()
+                        if not line or line[:1] == b'#': # Skip comments or empty lines
+                            continue
 
-                        if addr_str_norm and val_str_norm:
-                            updates[addr_str_norm.upper()] = val_str_norm.upper()
-                        else:
-                            print(f"Warning: REGA file '{rega_path}', line {line_num}: Invalid address/value format '{line_content}'. Skipping.")
-                    elif line_content: # Content exists but not in 2 parts
-                        print(f"Warning: REGA file '{rega_path}', line {line_num}: Invalid line format '{line_content}'. Skipping.")
+                        # Remove inline comments (only when present)
+                        line_content = line.partition(b'#')[0].strip() if b'#' in line else line
+                        parts = line_content.split(None, 2) # 주소/값 두 토큰만 필요하므로 나머지는 분할하지 않음
+
+                        if len(parts) >= 2:
+                            addr_int = _parse_hex_token(parts[0])
+                            val_int = _parse_hex_token(parts[1])
+                            if addr_int is not None and val_int is not None:
+                                if val_int > 0xFF: # 8비트 주소에 담을 수 없는 값은 잘라내지 않고 거부
+                                    logger.warning("REGA file '%s', line %d: Value 0x%X exceeds 0xFF for address 0x%04X. Skipping.",
+                                                   rega_path, line_num, val_int, addr_int)
+                                    continue
+                                updates[addr_int] = val_int
+                            else:
+                                logger.warning("REGA file '%s', line %d: Invalid address/value format '%s'. Skipping.",
+                                               rega_path, line_num, line_content.decode('utf-8', 'replace'))
+                        elif line_content: # Content exists but not in 2 parts
+                            logger.warning("REGA file '%s', line %d: Invalid line format '%s'. Skipping.",
+                                           rega_path, line_num, line_content.decode('utf-8', 'replace'))
 
         except FileNotFoundError:
-            print(f"Info: REGA file '{rega_path}' not found. No updates applied.")
+            logger.info("REGA file '%s' not found. No updates applied.", rega_path)
         except Exception as e:
-            print(f"Error processing REGA file '{rega_path}': {e}")
+            logger.error("Error processing REGA file '%s': %s", rega_path, e)
         return updates
 
     def get_logical_field_value(self, field_id: str, from_initial: bool = False) -> int:
         """Returns the current (or initial) integer value of the specified logical field."""
-        if field_id not in self.logical_fields_map:
+        compiled = self._compiled_fields.get(field_id)
+        if compiled is None:
             raise ValueError(f"Field ID '{field_id}' not found in logical_fields_map.")
 
-        field_info = self.logical_fields_map[field_id]
-        source_values = self.initial_address_values if from_initial else self.current_address_values
+        field_mask, compiled_regions, _, _ = compiled
+        buf = (self.initial_address_values if from_initial else self.current_address_values).buf
+
+        kernel_arrays = self._kernel_fields.get(field_id)
+        if kernel_arrays is not None:
+            return int(_get_field_kernel(np.frombuffer(buf, dtype=np.uint8), kernel_arrays[0], field_mask))
 
         field_value_int = 0
-        for addr_hex, local_bit_offset, local_width, field_part_lsb, _ in field_info['regions_mapping']:
-            addr_key = addr_hex.upper()
-            addr_byte_val = source_values.get(addr_key, 0) # If address not found (should not happen for loaded fields), assume 0
-            if addr_key not in source_values: # Should ideally not happen if map is consistent
-                 print(f"Warning: Address '{addr_key}' for field '{field_id}' not found in {'initial' if from_initial else 'current'} values. Assuming 0 for this part.")
-
-            mask_for_local_part = ((1 << local_width) - 1)
-            local_part_val = (addr_byte_val >> local_bit_offset) & mask_for_local_part
-            field_value_int |= (local_part_val << field_part_lsb)
-        
-        field_mask = (1 << field_info['length']) - 1 if field_info['length'] > 0 else 0
+        for addr_idx, local_bit_offset, _, field_part_lsb, local_mask, _, _ in compiled_regions:
+            field_value_int |= ((buf[addr_idx] >> local_bit_offset) & local_mask) << field_part_lsb
         return field_value_int & field_mask
 
 
     def get_logical_field_value_hex(self, field_id: str, from_initial: bool = False) -> str:
         """Returns the current (or initial) value of the logical field as a hex string."""
-        try:
-            field_info = self.logical_fields_map.get(field_id)
-            if not field_info:
-                return constants.HEX_ERROR_NO_FIELD
-
-            value_int = self.get_logical_field_value(field_id, from_initial)
-            num_hex_digits = (field_info['length'] + 3) // 4 if field_info['length'] > 0 else 1
-            return f"0x{value_int:0{num_hex_digits}X}"
-        except ValueError: 
+        # UI 갱신 시 필드마다 호출되므로 get_logical_field_value 본문을 인라인하여 메서드 호출 한 번을 줄임
+        compiled = self._compiled_fields.get(field_id)
+        if compiled is None:
             return constants.HEX_ERROR_NO_FIELD
+        try:
+            field_mask, compiled_regions, _, num_hex_digits = compiled
+            buf = (self.initial_address_values if from_initial else self.current_address_values).buf
+
+            value_int = 0
+            for addr_idx, local_bit_offset, _, field_part_lsb, local_mask, _, _ in compiled_regions:
+                value_int |= ((buf[addr_idx] >> local_bit_offset) & local_mask) << field_part_lsb
+            return _fmt_hex(value_int & field_mask, num_hex_digits)
         except Exception: 
             return constants.HEX_ERROR_CONVERSION
 
@@ -359,51 +661,43 @@ class RegisterMap:
                   new values, to be confirmed and applied to current_address_values upon
                   successful I2C operations.
         """
-        if field_id not in self.logical_fields_map:
+        compiled = self._compiled_fields.get(field_id)
+        if compiled is None:
             raise ValueError(f"Field ID '{field_id}' not found for setting value.")
 
-        field_info = self.logical_fields_map[field_id]
-        field_mask = (1 << field_info['length']) - 1 if field_info['length'] > 0 else 0
+        field_mask, compiled_regions, affected, _ = compiled
         value_to_set_int &= field_mask # Ensure value fits within field length
 
-        # Create a temporary copy of current values to calculate prospective changes
-        prospective_address_values = self.current_address_values.copy()
-        
-        # Apply changes for this field to the prospective values
-        for addr_hex, local_offset, local_width, field_part_lsb, _ in field_info['regions_mapping']:
-            addr_key = addr_hex.upper()
-
+        buf = self.current_address_values.buf
+        kernel_arrays = self._kernel_fields.get(field_id)
+        if kernel_arrays is not None:
+            new_values = _set_field_kernel(np.frombuffer(buf, dtype=np.uint8), kernel_arrays[0], kernel_arrays[1], value_to_set_int).tolist()
+            i2c_ops: List[Tuple[str, int]] = []
+            to_confirm: Dict[str, int] = {}
+            for (addr_idx, addr_k_norm), new_val in zip(affected, new_values):
+                if buf[addr_idx] != new_val:
+                    i2c_ops.append((addr_k_norm, new_val))
+                    to_confirm[addr_k_norm] = new_val
+            return i2c_ops, to_confirm
+
+        # Calculate prospective byte values only for the addresses this field touches
+        prospective_values: Dict[int, int] = {} # buf index -> new byte value
+        for addr_idx, local_offset, _, field_part_lsb, local_mask, clear_mask, _ in compiled_regions:
             # Extract the part of the field's new value that corresponds to this region
-            part_val_for_region = (value_to_set_int >> field_part_lsb) & ((1 << local_width) - 1)
-
-            current_byte_val_at_addr = prospective_address_values.get(addr_key, 0)
-            if addr_key not in prospective_address_values: # Should not happen if map is consistent
-                 print(f"Warning: Address '{addr_key}' for field '{field_id}' not found in current values during prospective set. Assuming 0 for this address.")
-
-            # Clear the bits for this field part in the current byte value
-            byte_clear_mask = ~(((1 << local_width) - 1) << local_offset)
-            modified_byte_val = current_byte_val_at_addr & byte_clear_mask
-
-            # Set the new field part value into the byte
-            modified_byte_val |= (part_val_for_region << local_offset)
-
-            prospective_address_values[addr_key] = modified_byte_val
+            part_val_for_region = (value_to_set_int >> field_part_lsb) & local_mask
+            current_byte_val_at_addr = prospective_values.get(addr_idx, buf[addr_idx])
+            # Replace the bits for this field part in the current byte value
+            prospective_values[addr_idx] = (current_byte_val_at_addr & clear_mask) | (part_val_for_region << local_offset)
         
         i2c_ops_to_perform: List[Tuple[str, int]] = []
         values_to_confirm: Dict[str, int] = {}
 
-        # Identify which addresses actually changed and need I2C writes
-        related_addresses_for_field = {region_addr.upper() for region_addr,_,_,_,_ in field_info['regions_mapping']}
-
-        for addr_k_norm, prospective_new_val_int in prospective_address_values.items():
-            # Only consider addresses related to the current field for I2C ops triggered by this field set
-            if addr_k_norm in related_addresses_for_field:
-                original_val_int = self.current_address_values.get(addr_k_norm) # Can be None if addr_k_norm was not in current_address_values initially
-                
-                # If the value at this address has changed compared to the current state
-                if original_val_int != prospective_new_val_int:
-                    i2c_ops_to_perform.append((addr_k_norm, prospective_new_val_int))
-                    values_to_confirm[addr_k_norm] = prospective_new_val_int
+        # Identify which of the field's addresses actually changed and need I2C writes (in address order)
+        for addr_idx, addr_k_norm in affected:
+            prospective_new_val_int = prospective_values[addr_idx]
+            if buf[addr_idx] != prospective_new_val_int:
+                i2c_ops_to_perform.append((addr_k_norm, prospective_new_val_int))
+                values_to_confirm[addr_k_norm] = prospective_new_val_int
         
         return i2c_ops_to_perform, values_to_confirm
 
@@ -425,11 +719,10 @@ class RegisterMap:
                 - A dictionary {address_hex_str: new_8bit_value_int} if the value changes,
                   or an empty dictionary.
         """
-        norm_addr = normalize_hex_input(addr_hex_to_set, 4, add_prefix=True)
-        if norm_addr is None:
+        addr_key = _normalize_addr_key(addr_hex_to_set)
+        if addr_key is None:
             raise ValueError(f"Invalid address format for set_address_byte_value: {addr_hex_to_set}")
 
-        addr_key = norm_addr.upper()
         prospective_new_val = byte_value_int & 0xFF # Ensure it's a byte
 
         i2c_ops_to_perform: List[Tuple[str, int]] = []
@@ -456,24 +749,39 @@ class RegisterMap:
         """
         for addr_key, new_val in updated_values.items():
             # Ensure address key is normalized for consistency, though it should be already
-            norm_addr_key = normalize_hex_input(addr_key, 4, add_prefix=True)
+            norm_addr_key = _normalize_addr_key(addr_key)
             if norm_addr_key: 
-                 self.current_address_values[norm_addr_key.upper()] = new_val & 0xFF # Ensure byte value
+                 self.current_address_values[norm_addr_key] = new_val & 0xFF # Ensure byte value
             else:
                 # This case should ideally not be reached if inputs are validated upstream
-                print(f"Warning (confirm_update): Invalid address format '{addr_key}' received. Skipping update for this address.")
+                logger.warning("confirm_update: Invalid address format '%s' received. Skipping update for this address.", addr_key)
         # For debugging:
         # print(f"Debug: RegisterMap current_address_values confirmed update with: {updated_values}")
 
+    def confirm_address_values_update_fast(self, updated_values: Dict[str, int]):
+        """
+        confirm_address_values_update와 같지만 키 정규화를 생략합니다.
+        set_logical_field_value/set_address_byte_value가 반환한 values_to_confirm처럼
+        이미 정규화된("0XFFFF") 키만 전달해야 합니다. 외부 입력은 confirm_address_values_update를 사용하세요.
+        """
+        if __debug__:
+            for addr_key in updated_values:
+                assert _NORM_ADDR_KEY_RE.fullmatch(addr_key), f"confirm_update_fast: address key '{addr_key}' is not normalized."
+        self.current_address_values.update(updated_values)
+
 
     def get_all_field_ids(self) -> List[str]:
         """Returns a sorted list of all logical field IDs."""
-        return sorted(list(self.logical_fields_map.keys()))
+        return sorted(self.logical_fields_map)
 
     def get_all_logical_fields_info(self) -> List[LogicalFieldInfo]:
         """Returns a list of all LogicalFieldInfo objects."""
         return list(self.logical_fields_map.values())
 
+    def get_initial_value(self, addr_int: int) -> int:
+        """Returns the initial (reset) 8-bit value of the given address, or 0 if the address is not in the map."""
+        return self.initial_address_values.get(addr_int, 0)
+
     def get_address_range_hex(self) -> Tuple[str, str]:
         """Returns the min/max address range from JSON metadata as hex strings."""
         return f"0X{self._min_addr_int:04X}", f"0X{self._max_addr_int:04X}"
@@ -539,7 +847,7 @@ if __name__ == '__main__':
         print(f"MULTI_BYTE_FIELD: {reg_map_instance.get_logical_field_value_hex('MULTI_BYTE_FIELD')}") # Should be 0xABC
         assert reg_map_instance.get_logical_field_value('CTRL_REG') == 0xAB
         assert reg_map_instance.get_logical_field_value('MULTI_BYTE_FIELD') == 0xABC
-        assert reg_map_instance.logical_fields_map['CTRL_REG']['description'] == "Control Register"
+        assert reg_map_instance.logical_fields_map['CTRL_REG'].description == "Control Register"
 
 
         print("\n--- Setting Field Value 'CTRL_REG' to 0x55 (Prospective) ---")
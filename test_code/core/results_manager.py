@@ -1,19 +1,98 @@
 # results_manager.py
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np # pandas 의존성
 import pandas as pd
+from operator import itemgetter
 from core import constants # For EXCEL_COL_SAMPLE_NO etc.
+import io
 import os
+import time
+import logging
+from array import array
+
+# 선택적 고속 Excel 엔진 (설치되어 있으면 우선 사용, 없으면 openpyxl로 폴백)
+try:
+    from rustpy_xlsxwriter import FastExcel # Rust 기반 xlsx writer
+except ImportError:
+    FastExcel = None
+
+try:
+    from pyexcelerate import Workbook as PyExcelerateWorkbook
+except ImportError:
+    PyExcelerateWorkbook = None
+
+try:
+    import xlsxwriter # constant_memory 모드로 행 단위 스트리밍 저장
+except ImportError:
+    xlsxwriter = None
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml # noqa: F401  openpyxl은 lxml이 있으면 C(libxml2) 기반 XML 직렬화를 사용
+    _HAS_LXML = True
+except ImportError:
+    _HAS_LXML = False
+logger.debug("lxml available for openpyxl write-only export: %s", _HAS_LXML)
+
+_MISSING = float('nan') # 해당 행에 값이 없는 컬럼의 채움 값 (list of dict로 DataFrame을 만들 때와 같은 결측값)
+_NS_PER_MINUTE = 60 * 1_000_000_000
+_CATEGORY_COLUMNS: Tuple[str, ...] = ("Variable Name",) # get_results_dataframe에서 category dtype으로 변환할 컬럼
+
+_FLOAT_ROW = object() # _ValueColumn.other에서 "값이 array('d')에 있음"을 나타내는 표식 (None은 실제 측정값일 수 있음)
+
+class _ValueColumn:
+    """
+    "Value" 컬럼 저장소. float 측정값은 array('d')에 (Python float 객체 없이) 저장하고,
+    float가 아닌 값(문자열, int, None 등)은 같은 위치의 별도 리스트에 보관합니다 (float 행은 _FLOAT_ROW).
+    모든 값이 float이면 DataFrame 생성 시 array 버퍼를 그대로 float64 컬럼으로 사용합니다.
+    """
+    __slots__ = ("f64", "other", "n_other")
+
+    def __init__(self, n_missing: int = 0):
+        self.f64 = array('d', [_MISSING]) * n_missing
+        self.other: List[Any] = [_FLOAT_ROW] * n_missing
+        self.n_other = 0 # float가 아닌 값의 개수 (0이면 전체가 float64)
+
+    def append(self, value: Any) -> None:
+        if isinstance(value, float):
+            self.f64.append(value)
+            self.other.append(_FLOAT_ROW)
+        else:
+            self.f64.append(_MISSING)
+            self.other.append(value)
+            self.n_other += 1
+
+    def __len__(self) -> int:
+        return len(self.f64)
+
+    def values(self) -> Any:
+        """DataFrame 생성용 값. 전부 float이면 array 버퍼의 float64 뷰(복사 없음), 아니면 원래 값의 리스트."""
+        if not self.n_other:
+            return np.frombuffer(self.f64, dtype=np.float64)
+        return [f if o is _FLOAT_ROW else o for f, o in zip(self.f64, self.other)]
+
 
 class ResultsManager:
     """
     측정 결과를 관리하고, 테이블 및 파일 형태로 내보내는 클래스입니다.
-    결과는 메모리에 List[Dict] 형태로 저장됩니다.
+    결과는 메모리에 컬럼별 리스트(Dict[str, List]) 형태로 저장됩니다. 모든 컬럼 리스트의 길이는 행 개수와 같고,
+    해당 행에 값이 없는 컬럼은 NaN으로 채워집니다 (DataFrame 변환 시 결측값).
     """
+    SAMPLE_NO_COLUMN: str = constants.EXCEL_COL_SAMPLE_NO # 측정마다 모듈 속성을 조회하지 않도록 클래스에 보관
+
     def __init__(self):
-        self.results_data: List[Dict[str, Any]] = []
+        self.columns: Dict[str, Any] = {} # 컬럼명 -> 행별 값 리스트 ("Value"는 _ValueColumn, 처음 등장한 순서 유지)
+        self._n_rows: int = 0
         # 기본 컬럼 순서 정의 (Timestamp 제거)
-        self.base_columns = ["Variable Name", "Value", constants.EXCEL_COL_SAMPLE_NO]
+        self.base_columns = ["Variable Name", "Value", self.SAMPLE_NO_COLUMN]
+        self._has_sample_no: bool = False # 샘플 번호 컬럼이 한 번이라도 기록되었는지
         self._available_columns_cache: Optional[List[str]] = None
+        # 결과가 바뀔 때(add_measurement/clear_results)만 다시 만드는 캐시
+        self._df_cache: Optional[pd.DataFrame] = None # get_results_dataframe 결과
+        self._export_df_cache: Optional[pd.DataFrame] = None # Timestamp를 문자열로 포맷한 내보내기용 DataFrame
+        self._export_rows_cache: Optional[List[List[Any]]] = None # 내보내기용 DataFrame의 행 값 (결측값은 None)
+        self._col_positions_cache: Optional[Dict[str, int]] = None # 컬럼명 -> DataFrame 내 위치 (컬럼 집합 조회 겸용)
 
 
     def add_measurement(self,
@@ -32,12 +111,13 @@ class ResultsManager:
                                                   (예: {"SMU Set Voltage": 1.0, "Chamber Set Temp": 25.0}).
         """
         record: Dict[str, Any] = {
-            "Timestamp": pd.Timestamp.now(),
+            "Timestamp": time.time_ns(), # epoch ns (int). DataFrame 생성 시 로컬 시각 datetime64로 일괄 변환
+
             "Variable Name": variable_name,
             "Value": value
         }
         if sample_number is not None:
-            record[constants.EXCEL_COL_SAMPLE_NO] = sample_number
+            record[self.SAMPLE_NO_COLUMN] = sample_number
         
         if conditions:
             for cond_key, cond_value in conditions.items():
@@ -46,58 +126,129 @@ class ResultsManager:
                 # 여기서는 전달된 키를 그대로 사용하되, get_available_export_columns에서 처리
                 record[cond_key] = cond_value
         
-        self.results_data.append(record)
-        self._available_columns_cache = None # 새로운 키가 추가될 수 있으므로 캐시 무효화
-        print(f"ResultsManager: Measurement added - {variable_name}={value}, Sample={sample_number}, Conds={conditions}")
+        columns = self.columns
+        n_rows = self._n_rows
+        for key, val in record.items():
+            column = columns.get(key)
+            if column is None: # 새 컬럼: 이전 행들은 결측값으로 채움
+                column = columns[key] = _ValueColumn(n_rows) if key == "Value" else [_MISSING] * n_rows
+                self._available_columns_cache = None # 새로운 키가 추가되었으므로 컬럼 캐시 무효화
+                if key == self.SAMPLE_NO_COLUMN:
+                    self._has_sample_no = True
+                self._col_positions_cache = None
+            column.append(val)
+        self._n_rows = n_rows + 1
+        if len(columns) > len(record): # 이번 행에 없는 컬럼은 결측값으로 채움
+            for column in columns.values():
+                if len(column) == n_rows:
+                    column.append(_MISSING)
+        self._df_cache = None
+        self._export_df_cache = None
+        self._export_rows_cache = None
+        if logger.isEnabledFor(logging.DEBUG): # 측정마다 호출되므로 DEBUG가 꺼져 있으면 문자열 포맷도 생략
+            logger.debug("Measurement added - %s=%s, Sample=%s, Conds=%s", variable_name, value, sample_number, conditions)
 
     def clear_results(self):
         """모든 저장된 측정 결과를 초기화합니다."""
-        self.results_data = []
+        self.columns = {}
+        self._n_rows = 0
+        self._has_sample_no = False
         self._available_columns_cache = None # 결과가 비워졌으므로 캐시 무효화
-        print("ResultsManager: All results cleared.")
+        self._df_cache = None
+        self._export_df_cache = None
+        self._export_rows_cache = None
+        self._col_positions_cache = None
+        logger.info("All results cleared.")
 
     def get_results_dataframe(self) -> pd.DataFrame:
         """
         현재까지 저장된 모든 측정 결과를 Pandas DataFrame으로 변환하여 반환합니다.
         'Conditions' 딕셔너리는 평탄화되어 개별 컬럼으로 확장됩니다.
 
+        결과가 바뀌기 전까지 같은 DataFrame 객체를 캐시하여 반환하므로, 호출자는 반환값을 수정하지 말고 필요하면 copy()하세요.
+
         Returns:
             pd.DataFrame: 측정 결과 DataFrame. 결과가 없으면 빈 DataFrame 반환.
         """
-        if not self.results_data:
+        if not self._n_rows:
             return pd.DataFrame()
 
-        # DataFrame 생성 시, 모든 레코드에 존재할 수 있는 모든 키를 컬럼으로 인식하도록 함
-        # pd.json_normalize를 사용하면 중첩된 'Conditions'도 잘 처리할 수 있지만,
-        # 여기서는 이미 add_measurement에서 평탄화된 키로 저장한다고 가정하거나,
-        # DataFrame 생성 후 수동으로 평탄화할 수 있습니다.
-        # 가장 간단한 방법은 모든 레코드를 순회하며 모든 유니크한 키를 모으는 것입니다.
-        
-        # 모든 가능한 컬럼명을 수집 (순서 유지를 위해 Set 대신 List와 조건부 추가)
-        all_keys: List[str] = []
-        temp_keys_set: Set[str] = set() # 중복 방지 및 빠른 확인용
-
-        # 기본 컬럼 우선 추가 (Timestamp 제거)
-        # for key in self.base_columns: # base_columns에 이미 Timestamp 없음
-        #     if key not in temp_keys_set:
-        #         all_keys.append(key)
-        #         temp_keys_set.add(key)
-        
-        # "Timestamp"를 명시적으로 추가 (필요하다면, 그러나 기본 base_columns에서는 제거됨)
-        # if "Timestamp" not in temp_keys_set:
-        #    all_keys.append("Timestamp")
-        #    temp_keys_set.add("Timestamp")
-
-        # 나머지 모든 유니크한 키 추가 (base_columns 정의에 따라 동작)
-        for record in self.results_data:
-            for key in record.keys():
-                if key not in temp_keys_set:
-                    all_keys.append(key)
-                    temp_keys_set.add(key)
-        
-        # DataFrame 생성 시 columns 인자를 명시하여 순서 및 누락된 컬럼 처리
-        df = pd.DataFrame(self.results_data, columns=all_keys)
-        return df
+        if self._df_cache is None:
+            # 컬럼별 리스트를 그대로 사용하므로 레코드 x 키 순회 없이 생성 (컬럼 순서는 처음 등장한 순서)
+            # Value의 float64 뷰가 array 버퍼를 잡고 있으면 이후 append가 불가하므로 반드시 복사(copy=True)
+            df = pd.DataFrame(self._dataframe_columns(), copy=True)
+            # 반복되는 문자열 컬럼(측정 항목 이름, 샘플 번호)은 category로 저장하여 메모리/필터링 비용 절감
+            category_columns = {col: 'category' for col in _CATEGORY_COLUMNS + (self.SAMPLE_NO_COLUMN,)
+                                if col in df.columns and pd.api.types.is_string_dtype(df[col].dtype)}
+            if category_columns:
+                df = df.astype(category_columns)
+            self._df_cache = df
+        return self._df_cache
+
+    def _dataframe_columns(self) -> Dict[str, Any]:
+        """DataFrame 생성용 컬럼 dict. Timestamp 컬럼의 epoch ns 값은 로컬 시각으로, Value 컬럼은 배열/리스트로 변환합니다."""
+        data = dict(self.columns)
+        ts_column = data.get("Timestamp")
+        if ts_column is not None:
+            data["Timestamp"] = self._epoch_ns_to_local_datetimes(ts_column)
+        value_column = data.get("Value")
+        if value_column is not None:
+            data["Value"] = value_column.values()
+        return data
+
+    @staticmethod
+    def _epoch_ns_to_local_datetimes(values: List[Any]) -> Any:
+        """
+        epoch ns(int) 리스트를 로컬 시각(naive) datetime64 배열로 한 번에 변환합니다 (pd.Timestamp.now()와 같은 기준).
+        UTC 오프셋은 분 단위 구간별로 한 번만 조회하므로 DST 전환이 포함된 구간도 올바르게 변환됩니다.
+        조건(conditions)으로 덮어쓴 int가 아닌 값이 섞여 있으면 행 단위로 변환합니다.
+        """
+        if not all(type(v) is int for v in values):
+            return [pd.Timestamp.fromtimestamp(v / 1e9) if type(v) is int else v for v in values]
+        ns = np.fromiter(values, dtype=np.int64, count=len(values))
+        minutes, minute_idx = np.unique(ns // _NS_PER_MINUTE, return_inverse=True)
+        offsets_ns = np.array([time.localtime(int(m) * 60).tm_gmtoff for m in minutes], dtype=np.int64) * 1_000_000_000
+        return pd.to_datetime(ns + offsets_ns[minute_idx], unit='ns')
+
+    def _get_export_dataframe(self) -> pd.DataFrame:
+        """Timestamp 컬럼을 문자열(밀리초까지)로 한 번만 포맷한 내보내기용 DataFrame을 반환합니다 (캐시)."""
+        if self._export_df_cache is None:
+            export_df = self.get_results_dataframe().copy()
+            # 만약 Timestamp가 문자열 등 datetime이 아닌 값으로 저장되어 있다면 그대로 둠
+            if 'Timestamp' in export_df.columns and pd.api.types.is_datetime64_dtype(export_df['Timestamp']):
+                export_df['Timestamp'] = self._format_timestamps_ms(export_df['Timestamp'])
+            self._export_df_cache = export_df
+        return self._export_df_cache
+
+    @staticmethod
+    def _format_timestamps_ms(timestamps: pd.Series) -> np.ndarray:
+        """
+        datetime64 Series를 "YYYY-MM-DD HH:MM:SS.mmm" 문자열 배열로 변환합니다 (밀리초 미만은 버림, NaT는 NaN).
+        행마다 strftime + 문자열 슬라이스를 하는 대신 numpy C 루프 한 번으로 처리합니다.
+        """
+        ts_ms = timestamps.to_numpy(dtype='datetime64[ms]')
+        formatted = np.char.replace(np.datetime_as_string(ts_ms, unit='ms'), 'T', ' ').astype(object)
+        formatted[np.isnat(ts_ms)] = np.nan
+        return formatted
+
+    def _get_column_positions(self) -> Dict[str, int]:
+        """
+        컬럼명 -> 결과 DataFrame 내 정수 위치 dict를 반환합니다 (새 컬럼이 생길 때만 다시 계산).
+        DataFrame은 self.columns 순서대로 만들어지므로 위치가 그대로 일치합니다.
+        """
+        if self._col_positions_cache is None:
+            self._col_positions_cache = {col: pos for pos, col in enumerate(self.columns)}
+        return self._col_positions_cache
+
+    @property
+    def results_data(self) -> List[Dict[str, Any]]:
+        """행 단위 레코드 리스트 (호환용). 각 레코드에는 해당 행에 값이 있는 컬럼만 포함됩니다."""
+        records: List[Dict[str, Any]] = [{} for _ in range(self._n_rows)]
+        for key, column in self._dataframe_columns().items():
+            for record, val in zip(records, column):
+                if val is not _MISSING:
+                    record[key] = val
+        return records
 
     def get_available_export_columns(self) -> List[str]:
         """
@@ -109,44 +260,28 @@ class ResultsManager:
             List[str]: 사용 가능한 컬럼명 리스트.
         """
         if self._available_columns_cache is not None:
-            print("ResultsManager: Returning cached available export columns.")
+            logger.debug("Returning cached available export columns.")
             return self._available_columns_cache
 
-        if not self.results_data:
+        if not self._n_rows:
             self._available_columns_cache = self.base_columns[:]
-            print("ResultsManager: No data, returning base columns for export (cached).")
+            logger.debug("No data, returning base columns for export (cached).")
             return self._available_columns_cache
 
-        # get_results_dataframe()과 유사하게 모든 유니크한 키를 수집
-        all_keys_ordered: List[str] = []
-        seen_keys: Set[str] = set()
-
+        # self.columns는 add_measurement에서 갱신되는 (삽입 순서) 고유 키 집합이므로 레코드 순회 없이 구성
         # 1. 기본 컬럼 (Timestamp 제외, Variable Name, Value)
-        for key in ["Variable Name", "Value"]:
-            if key not in seen_keys:
-                all_keys_ordered.append(key)
-                seen_keys.add(key)
-        
-        # 2. 샘플 번호 컬럼
-        if constants.EXCEL_COL_SAMPLE_NO not in seen_keys:
-             # 모든 레코드에서 샘플 번호 키가 실제로 있는지 확인 후 추가
-            if any(constants.EXCEL_COL_SAMPLE_NO in record for record in self.results_data):
-                all_keys_ordered.append(constants.EXCEL_COL_SAMPLE_NO)
-                seen_keys.add(constants.EXCEL_COL_SAMPLE_NO)
+        all_keys_ordered: List[str] = ["Variable Name", "Value"]
 
+        # 2. 샘플 번호 컬럼 (측정 결과에 실제로 있는 경우에만)
+        if self._has_sample_no:
+            all_keys_ordered.append(self.SAMPLE_NO_COLUMN)
 
         # 3. 나머지 모든 유니크한 키 (주로 조건 컬럼들, 알파벳 순 정렬)
-        other_keys = []
-        for record in self.results_data:
-            for key in record.keys():
-                if key not in seen_keys:
-                    other_keys.append(key)
-                    seen_keys.add(key) # 여기서도 seen_keys에 추가해야 중복 추가 방지
-        
-        all_keys_ordered.extend(sorted(list(set(other_keys)))) # set으로 중복 제거 후 정렬하여 추가
+        leading_keys = set(all_keys_ordered)
+        all_keys_ordered.extend(sorted(key for key in self.columns if key not in leading_keys))
 
         self._available_columns_cache = all_keys_ordered
-        print(f"ResultsManager: Calculated and cached available export columns: {len(all_keys_ordered)} columns.")
+        logger.debug("Calculated and cached available export columns: %d columns.", len(all_keys_ordered))
         return all_keys_ordered
 
 
@@ -164,65 +299,152 @@ class ResultsManager:
         Returns:
             bool: 저장 성공 시 True, 실패 시 False.
         """
-        if not self.results_data:
-            print("Warning: 내보낼 결과 데이터가 없습니다.")
+        if not self._n_rows:
+            logger.warning("내보낼 결과 데이터가 없습니다.")
             return False
         if not sheet_definitions:
-            print("Warning: Excel 시트 정의가 제공되지 않았습니다. 내보내기를 수행할 수 없습니다.")
+            logger.warning("Excel 시트 정의가 제공되지 않았습니다. 내보내기를 수행할 수 없습니다.")
             return False
 
         try:
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                # 전체 데이터를 한 번만 DataFrame으로 변환 (효율성)
-                # get_results_dataframe()은 이미 모든 가능한 컬럼을 포함한 DataFrame을 반환
-                full_df = self.get_results_dataframe()
-
-                if full_df.empty: # 변환 후에도 비어있다면 (거의 발생 안 함)
-                    print("Warning: DataFrame으로 변환 후 데이터가 비어있습니다.")
-                    # 빈 파일이라도 생성할지, 아니면 False 반환할지 결정. 여기서는 빈 파일 생성.
-                    # 빈 DataFrame이라도 쓰면 빈 시트가 생성됨.
-                    # 또는 return False로 처리 가능.
-
-                for sheet_def in sheet_definitions:
-                    sheet_name = sheet_def.get('sheet_name', 'Sheet')
-                    columns_to_export = sheet_def.get('columns', [])
-
-                    if not columns_to_export:
-                        print(f"Warning: 시트 '{sheet_name}'에 대해 선택된 컬럼이 없습니다. 이 시트는 건너<0xEB><0>니다.")
-                        continue
-                    
-                    # full_df에서 필요한 컬럼만 선택. 존재하지 않는 컬럼은 무시.
-                    # (get_available_export_columns와 UI에서 이미 필터링되었을 것이므로, 대부분 존재해야 함)
-                    valid_columns_for_sheet = [col for col in columns_to_export if col in full_df.columns]
-                    
-                    if not valid_columns_for_sheet:
-                        print(f"Warning: 시트 '{sheet_name}'에 대해 유효한 컬럼이 없습니다. 이 시트는 건너<0xEB><0>니다.")
-                        continue
-
-                    df_sheet = full_df[valid_columns_for_sheet]
-                    
-                    # Timestamp 컬럼 포맷팅 (문자열로 변환하여 Excel에 원하는 형식으로 표시)
-                    if 'Timestamp' in df_sheet.columns:
-                        try:
-                            # 밀리초까지 표시 (소수점 아래 3자리)
-                            df_sheet['Timestamp'] = df_sheet['Timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S.%f').str[:-3]
-                        except AttributeError: # 만약 Timestamp가 문자열로 이미 저장되어 있다면 무시
-                            pass
-                        except KeyError: # Timestamp 컬럼이 df_sheet에 없는 경우 (선택 안했을 시)
-                            pass
-
-
-                    df_sheet.to_excel(writer, sheet_name=sheet_name, index=False)
-                    print(f"Info: 데이터가 Excel 시트 '{sheet_name}'에 저장되었습니다.")
-            
-            print(f"Info: 모든 결과가 '{file_path}'에 성공적으로 저장되었습니다.")
+            # 전체 데이터를 한 번만 DataFrame으로 변환하고 Timestamp 포맷도 한 번만 수행 (캐시)
+            # 모든 가능한 컬럼을 포함한 DataFrame
+            full_df = self._get_export_dataframe()
+
+            if full_df.empty: # 변환 후에도 비어있다면 (거의 발생 안 함)
+                logger.warning("DataFrame으로 변환 후 데이터가 비어있습니다.")
+
+            sheets = self._build_export_sheets(full_df, sheet_definitions)
+
+            # 엔진 선택: rustpy-xlsxwriter > pyexcelerate > openpyxl(write-only, lxml 있을 때) > xlsxwriter(constant_memory) > openpyxl(write-only)
+            # openpyxl write-only는 시트 XML 직렬화가 병목이라 lxml이 없으면(ElementTree) xlsxwriter보다 느리므로 lxml이 있을 때만 우선합니다.
+            if FastExcel is not None and sheets:
+                self._write_sheets_fast_excel(file_path, sheets)
+            elif PyExcelerateWorkbook is not None and sheets:
+                self._write_sheets_pyexcelerate(file_path, sheets)
+            elif _HAS_LXML and sheets:
+                self._write_sheets_openpyxl(file_path, sheets)
+            elif xlsxwriter is not None and sheets:
+                self._write_sheets_xlsxwriter(file_path, sheets)
+            else:
+                self._write_sheets_openpyxl(file_path, sheets)
+
+            logger.info("모든 결과가 '%s'에 성공적으로 저장되었습니다.", file_path)
             return True
         except Exception as e:
-            print(f"Error: 결과를 Excel 파일로 내보내는 중 오류 발생: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("결과를 Excel 파일로 내보내는 중 오류 발생: %s", e, exc_info=True)
             return False
 
+    def _build_export_sheets(self, full_df: pd.DataFrame, sheet_definitions: List[Dict[str, Any]]) -> List[Tuple[str, pd.DataFrame]]:
+        """시트 정의에 따라 (시트 이름, 시트 DataFrame) 목록을 만듭니다. 컬럼이 없는 시트는 건너뜁니다."""
+        sheets: List[Tuple[str, pd.DataFrame]] = []
+        column_positions = self._get_column_positions()
+        for sheet_def in sheet_definitions:
+            sheet_name = sheet_def.get('sheet_name', 'Sheet')
+            columns_to_export = sheet_def.get('columns', [])
+
+            if not columns_to_export:
+                logger.warning("시트 '%s'에 대해 선택된 컬럼이 없습니다. 이 시트는 건너뜁니다.", sheet_name)
+                continue
+
+            # full_df에서 필요한 컬럼만 선택. 존재하지 않는 컬럼은 무시.
+            # (get_available_export_columns와 UI에서 이미 필터링되었을 것이므로, 대부분 존재해야 함)
+            valid_columns_for_sheet = [col for col in columns_to_export if col in column_positions]
+
+            if not valid_columns_for_sheet:
+                logger.warning("시트 '%s'에 대해 유효한 컬럼이 없습니다. 이 시트는 건너뜁니다.", sheet_name)
+                continue
+
+            # Timestamp는 _get_export_dataframe에서 이미 포맷됨. 시트는 읽기 전용으로만 사용하므로 복사하지 않음
+            df_sheet = full_df.iloc[:, [column_positions[col] for col in valid_columns_for_sheet]]
+            sheets.append((sheet_name, df_sheet))
+        return sheets
+
+    def _get_export_rows(self) -> List[List[Any]]:
+        """
+        내보내기용 DataFrame 전체를 Python 값의 행 목록으로 한 번만 변환합니다 (캐시). 결측값(NaN/None)은 None.
+        시트마다 object 변환/결측값 치환을 반복하지 않고, 시트는 이 행에서 필요한 컬럼만 골라 씁니다.
+        """
+        if self._export_rows_cache is None:
+            export_df = self._get_export_dataframe()
+            self._export_rows_cache = export_df.astype(object).where(export_df.notna(), None).values.tolist()
+        return self._export_rows_cache
+
+    def _sheet_rows(self, df_sheet: pd.DataFrame) -> List[List[Any]]:
+        """헤더를 포함한 시트의 행 목록을 반환합니다. 결측값(NaN/None)은 빈 셀(None)로 씁니다."""
+        columns = list(df_sheet.columns)
+        column_positions = self._get_column_positions()
+        positions = [column_positions[col] for col in columns]
+        rows = self._get_export_rows()
+        if len(positions) == 1: # itemgetter는 인덱스가 하나면 튜플 대신 값을 반환
+            pos = positions[0]
+            return [columns] + [[row[pos]] for row in rows]
+        pick = itemgetter(*positions)
+        return [columns] + [list(pick(row)) for row in rows]
+
+    def _write_sheets_fast_excel(self, file_path: str, sheets: List[Tuple[str, pd.DataFrame]]):
+        """rustpy-xlsxwriter로 모든 시트를 한 번에 저장합니다 (셀 단위 Python 쓰기 없음)."""
+        writer = FastExcel(file_path)
+        for sheet_name, df_sheet in sheets:
+            writer = writer.sheet(sheet_name, df_sheet)
+            logger.debug("데이터가 Excel 시트 '%s'에 저장되었습니다.", sheet_name)
+        writer.save()
+
+    def _write_sheets_pyexcelerate(self, file_path: str, sheets: List[Tuple[str, pd.DataFrame]]):
+        """pyexcelerate로 모든 시트를 저장합니다."""
+        workbook = PyExcelerateWorkbook()
+        for sheet_name, df_sheet in sheets:
+            workbook.new_sheet(sheet_name, data=self._sheet_rows(df_sheet))
+            logger.debug("데이터가 Excel 시트 '%s'에 저장되었습니다.", sheet_name)
+        workbook.save(file_path)
+
+    def _write_sheets_xlsxwriter(self, file_path: str, sheets: List[Tuple[str, pd.DataFrame]]):
+        """
+        xlsxwriter constant_memory 모드로 행 단위 스트리밍 저장합니다 (메모리에 전체 셀을 보관하지 않음).
+        constant_memory 모드는 행 순서대로만 쓸 수 있는데 DataFrame.to_excel은 컬럼 순으로 셀을 쓰므로,
+        pandas ExcelWriter 대신 Workbook에 직접 write_row 합니다.
+        """
+        output = io.BytesIO()
+        workbook = xlsxwriter.Workbook(output, {'constant_memory': True, 'strings_to_numbers': False})
+        for sheet_name, df_sheet in sheets:
+            worksheet = workbook.add_worksheet(sheet_name)
+            for row_idx, row in enumerate(self._sheet_rows(df_sheet)):
+                worksheet.write_row(row_idx, 0, row)
+            logger.debug("데이터가 Excel 시트 '%s'에 저장되었습니다.", sheet_name)
+        workbook.close()
+        self._write_file_bytes(file_path, output.getbuffer())
+
+    def _write_sheets_openpyxl(self, file_path: str, sheets: List[Tuple[str, pd.DataFrame]]):
+        """
+        openpyxl write-only 워크북으로 모든 시트를 저장합니다.
+        일반 Worksheet(DataFrame.to_excel)와 달리 셀 객체를 메모리에 보관하지 않고 행 단위로 스트리밍합니다.
+        """
+        from openpyxl import Workbook # openpyxl 엔진을 사용할 때만 임포트
+
+        if not sheets: # 기존 ExcelWriter와 같이 시트가 하나도 없으면 오류로 처리
+            raise ValueError("No sheets to write: at least one sheet must be visible.")
+        workbook = Workbook(write_only=True)
+        for sheet_name, df_sheet in sheets:
+            worksheet = workbook.create_sheet(sheet_name)
+            for row in self._sheet_rows(df_sheet):
+                worksheet.append(row)
+            logger.debug("데이터가 Excel 시트 '%s'에 저장되었습니다.", sheet_name)
+        output = io.BytesIO()
+        workbook.save(output)
+        self._write_file_bytes(file_path, output.getbuffer())
+
+    @staticmethod
+    def _write_file_bytes(file_path: str, data: memoryview):
+        """
+        메모리에서 완성된 xlsx 내용을 한 번의 write로 파일에 씁니다.
+        엔진이 ZIP 컨테이너를 직렬화하며 발생시키는 작은 쓰기들을 파일 대신 BytesIO가 받도록 하고,
+        직렬화 중 오류가 나면 대상 파일을 건드리지 않습니다.
+        """
+        with open(file_path, 'wb', buffering=0) as f:
+            written = f.write(data)
+            while written < len(data): # raw 파일 write는 일부만 쓸 수 있음
+                written += f.write(data[written:])
+
 if __name__ == '__main__':
     # --- 테스트 코드 ---
     if not hasattr(constants, 'EXCEL_COL_SAMPLE_NO'): constants.EXCEL_COL_SAMPLE_NO = "Sample Number"
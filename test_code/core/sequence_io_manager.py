@@ -1,11 +1,178 @@
 # sequence_io_manager.py
 import json
+import mmap
 import os
-from typing import List, Dict, Optional, Union
+import re
+import logging
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Optional, Union, Tuple
 from . import constants
 from datetime import datetime
+from pathlib import Path
 from .data_models import SequenceItem, SimpleActionItem, LoopActionItem
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson # 설치되어 있으면 C 기반 JSON 직렬화 사용 (긴 시퀀스 저장 속도 개선)
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec # orjson이 없을 때의 C 기반 JSON 파서 대안
+except ImportError:
+    msgspec = None
+
+# get_saved_sequences 결과 캐시: 절대 디렉토리 경로 -> (디렉토리 st_mtime_ns, 시퀀스 정보 리스트, 파일 경로 -> (mtime_ns, size, ino))
+# 디렉토리 mtime이 같고(파일 추가/삭제/이름 변경 없음) 각 파일의 (mtime_ns, size, ino)도 같으면(제자리 수정 없음) 다시 스캔하지 않습니다.
+_LIST_CACHE: Dict[str, Tuple[int, List[Dict[str, str]], Dict[str, Tuple[int, int, int]]]] = {}
+
+def _invalidate_list_cache(directory: Optional[str] = None):
+    """목록 캐시를 무효화합니다. directory가 None이면 전체를 비웁니다."""
+    if directory is None:
+        _LIST_CACHE.clear()
+    else:
+        _LIST_CACHE.pop(os.path.abspath(directory), None)
+
+def _atomic_write_bytes(filepath: str, payload: bytes, overwrite: bool):
+    """
+    같은 디렉토리의 임시 파일에 쓰고 fsync한 뒤 대상 경로로 교체합니다.
+    쓰기 도중 중단되어도 대상 파일은 이전 내용 그대로이거나 새 내용 전체만 갖습니다 (부분 파일 없음).
+    overwrite=False면 대상이 이미 있을 때 FileExistsError를 발생시킵니다.
+    """
+    # mkstemp는 권한을 0600으로 만들므로 일반 open('xb')로 고유한 임시 파일을 생성 (umask에 따른 기본 권한 유지)
+    tmp_path = f"{filepath}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        with open(tmp_path, 'xb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        if overwrite:
+            os.replace(tmp_path, filepath)
+        else:
+            try:
+                os.link(tmp_path, filepath) # 대상이 있으면 FileExistsError (존재 확인과 생성이 원자적)
+            except FileExistsError:
+                raise
+            except OSError: # 하드 링크를 지원하지 않는 파일 시스템
+                if os.path.exists(filepath):
+                    raise FileExistsError(filepath)
+                os.replace(tmp_path, filepath)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _loads_json(raw: bytes) -> Any:
+    """JSON bytes를 파싱합니다 (orjson > msgspec > json 순으로 사용 가능한 파서 선택). 형식 오류는 json.JSONDecodeError 계열로 발생합니다."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(raw)
+        except msgspec.DecodeError as e: # 호출부의 json.JSONDecodeError 처리와 맞춤
+            raise json.JSONDecodeError(str(e), '', 0) from e
+    return json.loads(raw)
+
+# _read_json_file 원본 bytes 캐시: 절대 경로 -> (st_mtime_ns, st_size, st_ino, 파일 내용), 최근 사용 순 (LRU)
+# 원자적 저장(임시 파일 + replace)은 inode를 바꾸므로 st_ino를 키에 포함하고, 저장/이름 변경/삭제 시에는 명시적으로 제거
+# 파싱 결과 대신 bytes를 보관하는 이유: 호출자가 수정할 수 있는 새 객체가 필요한데, deepcopy는 다시 파싱하는 것보다 느림
+_LOAD_CACHE: "OrderedDict[str, Tuple[int, int, int, bytes]]" = OrderedDict()
+_LOAD_CACHE_MAX_ENTRIES = 32
+_LOAD_CACHE_MAX_FILE_SIZE = 1024 * 1024 # 이보다 큰 파일은 캐시하지 않고 (orjson이 있으면) mmap으로 파싱
+
+def _evict_load_cache(*filepaths: str):
+    """파일을 쓰거나 이름 변경/삭제한 경로의 load 캐시 항목을 제거합니다 (타임스탬프 해상도가 낮은 파일 시스템 대비)."""
+    for filepath in filepaths:
+        _LOAD_CACHE.pop(os.path.abspath(filepath), None)
+
+def _read_json_file(filepath: str) -> Any:
+    """
+    파일 전체를 한 번의 read()로 읽은 뒤 파싱합니다 (json.load의 청크 단위 반복 읽기 없음).
+    같은 파일(mtime, 크기, inode 동일)을 다시 읽으면 캐시된 bytes를 파싱하여 디스크 읽기를 생략합니다.
+    캐시하지 않는 큰 파일은 orjson이 있으면 mmap으로 매핑해 복사 없이(memoryview) 파싱합니다.
+    """
+    with open(filepath, 'rb') as f:
+        st = os.fstat(f.fileno())
+        if st.st_size > _LOAD_CACHE_MAX_FILE_SIZE:
+            if orjson is not None:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    with memoryview(mm) as view: # mmap을 닫기 전에 뷰를 해제해야 함
+                        return orjson.loads(view)
+            raw = f.read()
+        else:
+            cache_key = os.path.abspath(filepath)
+            cached = _LOAD_CACHE.get(cache_key)
+            if (cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size
+                    and cached[2] == st.st_ino):
+                _LOAD_CACHE.move_to_end(cache_key)
+                raw = cached[3]
+            else:
+                raw = f.read()
+                _LOAD_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, st.st_ino, raw)
+                _LOAD_CACHE.move_to_end(cache_key)
+                if len(_LOAD_CACHE) > _LOAD_CACHE_MAX_ENTRIES:
+                    _LOAD_CACHE.popitem(last=False)
+    return _loads_json(raw)
+
+# save_sequence는 "name"을 첫 번째 키로 저장하므로, 파일 앞부분만 읽어 최상위 "name" 문자열을 꺼낼 수 있음
+_NAME_HEAD_SIZE = 1024
+_HEAD_NAME_RE = re.compile(rb'\A\s*\{\s*"name"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+def _read_json_name(filepath: str) -> Any:
+    """
+    시퀀스 파일의 최상위 "name" 값을 반환합니다 (없으면 None).
+    파일 앞부분(_NAME_HEAD_SIZE 바이트)에서 첫 키가 "name"인 경우 전체 파싱 없이 추출하고,
+    그렇지 않으면(이전 형식, 긴 이름 등) 파일 전체를 파싱합니다.
+    """
+    with open(filepath, 'rb') as f:
+        head = f.read(_NAME_HEAD_SIZE)
+        match = _HEAD_NAME_RE.match(head)
+        if match is not None:
+            return _loads_json(b'"' + match.group(1) + b'"') # 이스케이프 시퀀스 해석
+        data = _loads_json(head + f.read())
+    return data.get("name") if isinstance(data, dict) else None
+
+# 시퀀스 디렉토리의 표시 이름 색인 파일: {파일명: [st_mtime_ns, st_size, 표시 이름]}
+# 프로그램을 다시 시작해도 바뀌지 않은 파일은 열지 않도록 get_saved_sequences가 읽고 갱신합니다 (시퀀스 확장자가 아니므로 목록에는 나타나지 않음).
+_INDEX_FILENAME = ".seq_index.json"
+
+# 표시 이름을 새로 읽어야 하는 파일이 이 개수 이상이면 스레드 풀로 파일 I/O를 겹쳐 수행
+_PARALLEL_NAME_READ_MIN_FILES = 8
+_NAME_READ_MAX_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+
+# 레거시 "ACTION: KEY=VAL; KEY2=VAL2" 라인의 파라미터 쌍. ';'로 나뉜 각 조각에서 첫 '=' 앞이 키, 뒤가 값 ('='가 없는 조각은 무시)
+_LEGACY_PARAM_RE = re.compile(r'([^;=]*)=([^;]*)')
+
+def _convert_legacy_lines(legacy_lines: List[str]) -> List[SequenceItem]:
+    """레거시 "sequence_lines" 문자열 리스트를 SimpleActionItem 리스트로 변환합니다. ':'가 없는 라인은 경고 후 건너뜁니다."""
+    id_suffix = datetime.now().timestamp() # 라인마다 현재 시각을 다시 조회하지 않음 (idx로 고유성 보장)
+    find_params = _LEGACY_PARAM_RE.findall
+    converted_items: List[SequenceItem] = []
+    append_item = converted_items.append
+    for idx, line_str in enumerate(legacy_lines):
+        action_type_str, sep, params_str = line_str.partition(":")
+        if not sep:
+            logger.warning("Error converting legacy line: '%s'. Error: missing ':' separator. Skipping.", line_str)
+            continue
+        simple_item: SimpleActionItem = {
+            "item_id": f"legacy_item_{idx}_{id_suffix}", # 고유 ID 강화
+            "action_type": action_type_str.strip(),
+            "parameters": {key.strip(): value.strip() for key, value in find_params(params_str)},
+            "display_name": line_str.strip() # 간단히 전체 라인을 표시명으로
+        }
+        append_item(simple_item)
+    return converted_items
+
+def _dumps_sequence_data(sequence_data: Dict) -> bytes:
+    """시퀀스 데이터를 들여쓰기 2칸의 UTF-8 JSON bytes로 직렬화합니다 (non-ASCII 문자는 그대로 유지)."""
+    if orjson is not None:
+        return orjson.dumps(sequence_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(sequence_data, indent=2, ensure_ascii=False).encode('utf-8')
+
 class SequenceIOManager:
     """
     테스트 시퀀스를 파일 시스템에 저장하고 불러오는 기능을 관리하는 클래스입니다.
@@ -13,14 +180,16 @@ class SequenceIOManager:
 
     def __init__(self, sequences_dir: str):
         self.sequences_dir = sequences_dir
+        # 파일 경로 -> (st_mtime_ns, st_size, st_ino, 표시용 이름). 바뀌지 않은 파일은 다시 열어 파싱하지 않습니다.
+        self._name_cache: Dict[str, Tuple[int, int, int, str]] = {}
         if not os.path.exists(self.sequences_dir):
             try:
                 os.makedirs(self.sequences_dir, exist_ok=True)
-                print(f"[SequenceIOManager] Created sequences directory: {self.sequences_dir}")
+                logger.info("Created sequences directory: %s", self.sequences_dir)
             except Exception as e:
                 # 디렉토리 생성 실패 시, 애플리케이션 레벨에서 처리하거나, 여기서 에러를 발생시켜야 할 수 있습니다.
                 # 여기서는 일단 경고만 출력하고, 실제 파일 작업 시 오류가 발생할 수 있음을 인지합니다.
-                print(f"[SequenceIOManager] CRITICAL: Failed to create sequences directory '{self.sequences_dir}': {e}")
+                logger.critical("Failed to create sequences directory '%s': %s", self.sequences_dir, e)
                 # raise OSError(f"Failed to create sequences directory: {self.sequences_dir}") from e # 필요시 예외 발생
 
     def save_sequence(self, sequence_name_no_ext: str, sequence_items: List[SequenceItem], overwrite: bool = False) -> bool:
@@ -37,25 +206,23 @@ class SequenceIOManager:
             bool: 저장 성공 여부.
         """
         if not sequence_name_no_ext or not sequence_name_no_ext.strip():
-            print(f"[SequenceIOManager] Error: Sequence name cannot be empty.")
+            logger.error("Sequence name cannot be empty.")
             return False
         
-        # Ensure the sequences directory exists, try to create it if not (might be redundant if __init__ handles it well)
-        if not os.path.exists(self.sequences_dir):
-            try:
-                os.makedirs(self.sequences_dir, exist_ok=True)
-                print(f"[SequenceIOManager] Created directory during save: {self.sequences_dir}")
-            except Exception as e:
-                print(f"[SequenceIOManager] Error creating directory during save '{self.sequences_dir}': {e}")
-                return False
-                
-        filename_with_ext = sequence_name_no_ext + constants.SEQUENCE_FILE_EXTENSION
-        filepath = os.path.join(self.sequences_dir, filename_with_ext)
-        
-        if os.path.exists(filepath) and not overwrite:
-            print(f"[SequenceIOManager] File '{filepath}' already exists and overwrite is False.")
+        seq_ext = constants.SEQUENCE_FILE_EXTENSION
+        if sequence_name_no_ext.endswith(seq_ext): # 확장자가 이미 붙어 있으면 중복으로 붙이지 않음
+            sequence_name_no_ext = sequence_name_no_ext[:-len(seq_ext)]
+
+        # Ensure the sequences directory exists (이미 있으면 아무 것도 하지 않음, 별도 존재 확인 stat 없음)
+        sequences_dir = Path(self.sequences_dir)
+        try:
+            sequences_dir.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            logger.error("Error creating directory during save '%s': %s", self.sequences_dir, e)
             return False
-            
+
+        filepath = str(sequences_dir / (sequence_name_no_ext + seq_ext))
+
         try:
             sequence_data = {
                 "name": sequence_name_no_ext, # Store the pure name inside JSON
@@ -63,88 +230,132 @@ class SequenceIOManager:
                 "sequence_items": sequence_items # 기존 sequence_lines 대신 sequence_items 사용
             }
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(sequence_data, f, indent=2, ensure_ascii=False)
+            payload = _dumps_sequence_data(sequence_data) # 전체를 먼저 직렬화한 뒤 한 번에 쓰기
+            _atomic_write_bytes(filepath, payload, overwrite)
+            _evict_load_cache(filepath)
+            _invalidate_list_cache(self.sequences_dir) # 덮어쓰기는 디렉토리 mtime을 바꾸지 않으므로 명시적으로 무효화
                 
-            print(f"[SequenceIOManager] Sequence successfully saved to '{filepath}'")
+            logger.info("Sequence successfully saved to '%s'", filepath)
             return True
-            
+
+        except FileExistsError:
+            logger.warning("File '%s' already exists and overwrite is False.", filepath)
+            return False
         except Exception as e:
-            print(f"[SequenceIOManager] Error saving sequence '{sequence_name_no_ext}' to '{filepath}': {e}")
+            logger.error("Error saving sequence '%s' to '%s': %s", sequence_name_no_ext, filepath, e)
             return False
 
+    def _load_name_index(self) -> Dict[str, Tuple[int, int, int, str]]:
+        """색인 파일을 읽어 표시 이름 캐시 형식(경로 -> (mtime_ns, size, ino, 이름))으로 반환합니다. 없거나 손상되었으면 빈 dict."""
+        try:
+            index = _loads_json(Path(self.sequences_dir, _INDEX_FILENAME).read_bytes())
+            # ino가 없는 이전 형식 항목은 건너뛰어 다시 읽도록 함
+            return {os.path.join(self.sequences_dir, filename): (int(entry[0]), int(entry[1]), int(entry[2]), str(entry[3]))
+                    for filename, entry in index.items() if len(entry) == 4}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.debug("Ignoring unreadable sequence index in '%s': %s", self.sequences_dir, e)
+            return {}
+
+    def _save_name_index(self, name_cache: Dict[str, Tuple[int, int, int, str]]):
+        """표시 이름 캐시를 색인 파일에 원자적으로 저장합니다. 실패해도(읽기 전용 디렉토리 등) 목록 조회에는 영향 없음."""
+        index = {os.path.basename(filepath): list(entry) for filepath, entry in name_cache.items()}
+        try:
+            _atomic_write_bytes(os.path.join(self.sequences_dir, _INDEX_FILENAME), _dumps_sequence_data(index), overwrite=True)
+        except Exception as e:
+            logger.debug("Could not write sequence index in '%s': %s", self.sequences_dir, e)
+
+    @staticmethod
+    def _file_keys_unchanged(file_keys: Dict[str, Tuple[int, int, int]]) -> bool:
+        """캐시된 목록의 각 파일이 여전히 같은 (mtime_ns, size, ino)인지 확인합니다 (디렉토리 mtime에 안 잡히는 제자리 수정 감지)."""
+        for filepath, file_key in file_keys.items():
+            try:
+                st = os.stat(filepath)
+            except OSError:
+                return False
+            if (st.st_mtime_ns, st.st_size, st.st_ino) != file_key:
+                return False
+        return True
+
+    @staticmethod
+    def _extract_display_name(filename: str, filepath: str, default_name: str) -> str:
+        """
+        시퀀스 파일의 표시용 이름을 반환합니다. JSON 내부의 "name" 필드를 우선 사용하고,
+        없거나 읽기/파싱에 실패하면 default_name(파일명에서 확장자를 뺀 이름)을 사용합니다. (스레드 풀에서 호출될 수 있음)
+        """
+        display_name = default_name
+        debug_enabled = logger.isEnabledFor(logging.DEBUG) # 파일마다 호출되므로 DEBUG가 꺼져 있으면 로그 호출 생략
+        try:
+            json_name = _read_json_name(filepath)
+            if isinstance(json_name, str) and json_name.strip():
+                display_name = json_name.strip()
+                if debug_enabled:
+                    logger.debug("  Found sequence '%s' (from JSON name) in '%s'", display_name, filename)
+            elif debug_enabled:
+                logger.debug("  Found sequence '%s' (from filename) in '%s' - no valid 'name' field in JSON.", display_name, filename)
+        except Exception as e:
+            logger.warning("Error reading or parsing JSON for '%s' to get display name: %s. Using filename as display name.", filename, e)
+        return display_name
+
+    def clear_cache(self):
+        """시퀀스 목록/표시 이름/로드 캐시를 비웁니다. 외부에서 파일을 수정/삭제/이름 변경한 뒤 강제로 다시 읽을 때 사용합니다."""
+        self._name_cache.clear()
+        _LOAD_CACHE.clear()
+        _invalidate_list_cache(self.sequences_dir)
+
     @staticmethod
     def load_sequence(filepath: str) -> Optional[List[SequenceItem]]:
         """
         JSON 파일에서 계층적인 시퀀스 아이템 리스트("sequence_items")를 로드합니다.
         """
-        print(f"[SequenceIOManager] Attempting to load sequence from: {filepath}") # 로드 시도 경로 로깅
-        if not os.path.exists(filepath):
-            print(f"[SequenceIOManager] Error loading: File not found '{filepath}'")
-            return None
+        logger.debug("Attempting to load sequence from: %s", filepath) # 로드 시도 경로 로깅
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            print(f"[SequenceIOManager] Successfully parsed JSON from '{filepath}'. Data keys: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
+            # 별도 존재 확인 stat 없이 바로 열기. 캐시 유효성도 열린 파일의 fstat으로 확인하므로 경로 stat은 open 한 번뿐
+            data = _read_json_file(filepath)
+            if not isinstance(data, dict):
+                logger.error("'%s' does not contain 'sequence_items' or 'sequence_lines'.", filepath)
+                return None
+            logger.debug("Successfully parsed JSON from '%s'. Data keys: %s", filepath, list(data.keys()))
 
-            # "sequence_items" 키를 우선적으로 확인
-            if "sequence_items" in data and isinstance(data["sequence_items"], list):
+            # 키마다 한 번만 조회 ("sequence_items" 우선, 이후 하위 호환 키)
+            sequence_items = data.get("sequence_items")
+            if isinstance(sequence_items, list):
                 # TODO: 여기서 각 아이템이 SimpleActionItem 또는 LoopActionItem 구조를 따르는지
                 #       세부적인 유효성 검사를 추가할 수 있습니다 (예: pydantic 사용).
                 #       현재는 타입 캐스팅 없이 반환합니다.
-                print(f"[SequenceIOManager] Sequence items loaded successfully from '{filepath}' using 'sequence_items' key.")
-                return data["sequence_items"]
-            elif "sequence_lines" in data and isinstance(data["sequence_lines"], list):
+                logger.info("Sequence items loaded successfully from '%s' using 'sequence_items' key.", filepath)
+                return sequence_items
+            legacy_lines = data.get("sequence_lines")
+            if isinstance(legacy_lines, list):
                 # 하위 호환성을 위해 기존 "sequence_lines" (List[str]) 처리
                 # 이 문자열 리스트를 List[SimpleActionItem]으로 변환해야 함.
-                print(f"[SequenceIOManager] Legacy sequence (sequence_lines) loaded from '{filepath}'. Converting...")
-                legacy_lines: List[str] = data["sequence_lines"]
-                converted_items: List[SequenceItem] = []
-                for idx, line_str in enumerate(legacy_lines):
-                    try:
-                        action_type_str, params_str = line_str.split(":", 1)
-                        params_dict_parsed = {}
-                        if params_str.strip():
-                            param_pairs = params_str.split(';')
-                            for pair in param_pairs:
-                                if '=' in pair: 
-                                    key, value = pair.split('=', 1)
-                                    params_dict_parsed[key.strip()] = value.strip()
-                        
-                        simple_item: SimpleActionItem = {
-                            "item_id": f"legacy_item_{idx}_{datetime.now().timestamp()}", # 고유 ID 강화
-                            "action_type": action_type_str.strip(),
-                            "parameters": params_dict_parsed,
-                            "display_name": line_str.strip() # 간단히 전체 라인을 표시명으로
-                        }
-                        converted_items.append(simple_item)
-                    except ValueError as e_parse_line:
-                        print(f"[SequenceIOManager] Error converting legacy line: '{line_str}'. Error: {e_parse_line}. Skipping.")
-                        # 유효하지 않은 레거시 라인은 무시하거나, 오류 처리
-                print(f"[SequenceIOManager] Converted {len(converted_items)} items from legacy 'sequence_lines'.")
+                logger.info("Legacy sequence (sequence_lines) loaded from '%s'. Converting...", filepath)
+                converted_items = _convert_legacy_lines(legacy_lines)
+                logger.info("Converted %d items from legacy 'sequence_lines'.", len(converted_items))
                 return converted_items
-            elif "steps" in data and isinstance(data["steps"], list): # Legacy support for "steps"
-                print(f"[SequenceIOManager] Legacy sequence (steps) loaded from '{filepath}'")
+            elif isinstance(data.get("steps"), list): # Legacy support for "steps"
+                logger.info("Legacy sequence (steps) loaded from '%s'", filepath)
                 # sequence_lines와 유사하게 SimpleActionItem으로 변환 필요
                 # 이 부분은 위 sequence_lines 변환 로직과 거의 동일하게 구현 가능
-                legacy_steps: List[str] = data["steps"]
                 converted_steps: List[SequenceItem] = []
                 # ... (위의 sequence_lines 변환 로직과 유사하게 구현) ...
-                print(f"[SequenceIOManager] WARNING: Conversion for 'steps' key not fully implemented yet in this pass.")
+                logger.warning("Conversion for 'steps' key not fully implemented yet in this pass.")
                 return converted_steps # 임시
             else:
-                print(f"[SequenceIOManager] Error: '{filepath}' does not contain 'sequence_items' or 'sequence_lines'.")
+                logger.error("'%s' does not contain 'sequence_items' or 'sequence_lines'.", filepath)
                 return None
+        except FileNotFoundError:
+            logger.error("Error loading: File not found '%s'", filepath)
+            return None
         except json.JSONDecodeError as e:
-            print(f"[SequenceIOManager] Error decoding JSON from '{filepath}': {e}")
+            logger.error("Error decoding JSON from '%s': %s", filepath, e)
             return None
         except IOError as e:
-            print(f"[SequenceIOManager] IOError loading sequence from '{filepath}': {e}")
+            logger.error("IOError loading sequence from '%s': %s", filepath, e)
             return None
         except Exception as e:
-            print(f"[SequenceIOManager] Unexpected error loading sequence from '{filepath}': {type(e).__name__} - {e}")
-            import traceback
-            traceback.print_exc() # 전체 트레이스백 출력
+            logger.error("Unexpected error loading sequence from '%s': %s - %s", filepath, type(e).__name__, e, exc_info=True) # 전체 트레이스백 포함
             return None
 
     def get_saved_sequences(self) -> List[Dict[str, str]]: # Return type changed
@@ -154,30 +365,76 @@ class SequenceIOManager:
         표시용 이름은 JSON 내부의 "name" 필드를 우선 사용하고, 없으면 파일명에서 추출합니다.
         """
         saved_sequences_info = []
-        if not os.path.isdir(self.sequences_dir):
-            print(f"[SequenceIOManager] Saved sequences directory not found: '{self.sequences_dir}'")
+        cache_key = os.path.abspath(self.sequences_dir)
+        try:
+            dir_mtime_ns = os.stat(self.sequences_dir).st_mtime_ns
+        except OSError:
+            dir_mtime_ns = None
+        if dir_mtime_ns is None or not os.path.isdir(self.sequences_dir):
+            _LIST_CACHE.pop(cache_key, None)
+            logger.warning("Saved sequences directory not found: '%s'", self.sequences_dir)
             return saved_sequences_info
-        
-        print(f"[SequenceIOManager] Scanning for sequences in: {self.sequences_dir}")
-        for filename in os.listdir(self.sequences_dir):
-            if filename.endswith(constants.SEQUENCE_FILE_EXTENSION):
-                filepath = os.path.join(self.sequences_dir, filename)
-                display_name = filename[:-len(constants.SEQUENCE_FILE_EXTENSION)] # Default to filename
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    if isinstance(data, dict) and "name" in data and isinstance(data["name"], str) and data["name"].strip():
-                        display_name = data["name"].strip()
-                        print(f"  Found sequence '{display_name}' (from JSON name) in '{filename}'")
-                    else:
-                        print(f"  Found sequence '{display_name}' (from filename) in '{filename}' - no valid 'name' field in JSON.")
-                except Exception as e:
-                    print(f"  Error reading or parsing JSON for '{filename}' to get display name: {e}. Using filename as display name.")
-                
-                saved_sequences_info.append({"display_name": display_name, "path": filepath})
+
+        cached = _LIST_CACHE.get(cache_key)
+        if cached is not None and cached[0] == dir_mtime_ns and self._file_keys_unchanged(cached[2]):
+            return [dict(info) for info in cached[1]] # 호출자가 수정해도 캐시가 바뀌지 않도록 복사
+
+        logger.debug("Scanning for sequences in: %s", self.sequences_dir)
+        seq_ext = constants.SEQUENCE_FILE_EXTENSION # 루프 밖에서 한 번만 조회
+        ext_len = len(seq_ext)
+        # os.scandir의 DirEntry는 name/path를 바로 제공하므로 os.path.join이 필요 없음
+        with os.scandir(self.sequences_dir) as dir_entries:
+            sequence_entries = [entry for entry in dir_entries if entry.name.endswith(seq_ext) and entry.is_file()]
+        name_cache = self._name_cache or self._load_name_index() # 처음 스캔할 때는 색인 파일에서 이전 결과를 가져옴
+        new_name_cache: Dict[str, Tuple[int, int, int, str]] = {} # 삭제된 파일 항목은 버리도록 스캔마다 새로 구성
+        uncached_entries: List[Tuple[str, str, Optional[Tuple[int, int, int]]]] = [] # (파일명, 경로, (mtime_ns, size, ino))
+        name_cache_get = name_cache.get
+        append_info = saved_sequences_info.append
+        for entry in sequence_entries:
+            filename = entry.name
+            filepath = entry.path
+            try:
+                st = entry.stat()
+                # Windows에서는 DirEntry.stat()의 st_ino가 0이므로 os.stat과 같은 값을 주는 inode()를 사용
+                file_key: Optional[Tuple[int, int, int]] = (st.st_mtime_ns, st.st_size, entry.inode())
+            except OSError:
+                file_key = None
+            cached_name = name_cache_get(filepath)
+            if file_key is not None and cached_name is not None and cached_name[:3] == file_key:
+                new_name_cache[filepath] = cached_name
+                append_info({"display_name": cached_name[3], "path": filepath})
+            else:
+                uncached_entries.append((filename, filepath, file_key))
+
+        # 캐시에 없는(새로 생겼거나 바뀐) 파일만 읽음. 많으면 스레드 풀로 I/O를 겹쳐 처리 (결과는 아래에서 정렬)
+        extract_args = ([filename for filename, _, _ in uncached_entries],
+                        [filepath for _, filepath, _ in uncached_entries],
+                        [filename[:-ext_len] for filename, _, _ in uncached_entries]) # 기본 표시 이름 (확장자 제외)
+        if len(uncached_entries) >= _PARALLEL_NAME_READ_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=min(_NAME_READ_MAX_WORKERS, len(uncached_entries))) as executor:
+                display_names = list(executor.map(self._extract_display_name, *extract_args))
+        else:
+            display_names = list(map(self._extract_display_name, *extract_args))
+        for (filename, filepath, file_key), display_name in zip(uncached_entries, display_names):
+            if file_key is not None:
+                new_name_cache[filepath] = (file_key[0], file_key[1], file_key[2], display_name)
+            append_info({"display_name": display_name, "path": filepath})
+        self._name_cache = new_name_cache
+        if uncached_entries or len(new_name_cache) != len(name_cache): # 파일이 추가/변경/삭제된 경우에만 색인 갱신
+            self._save_name_index(new_name_cache)
+            # 색인 파일 교체(os.replace)가 디렉토리 mtime을 바꾸므로, 다음 호출이 캐시를 놓치지 않게 다시 조회
+            try:
+                dir_mtime_ns = os.stat(self.sequences_dir).st_mtime_ns
+            except OSError:
+                pass
         
         saved_sequences_info.sort(key=lambda x: x['display_name'].lower())
-        print(f"[SequenceIOManager] Found {len(saved_sequences_info)} sequences.")
+        file_keys = {filepath: entry[:3] for filepath, entry in new_name_cache.items()}
+        if len(file_keys) == len(saved_sequences_info): # stat 실패로 키가 없는 파일이 있으면 목록을 캐시하지 않음
+            _LIST_CACHE[cache_key] = (dir_mtime_ns, [dict(info) for info in saved_sequences_info], file_keys)
+        else:
+            _LIST_CACHE.pop(cache_key, None)
+        logger.info("Found %d sequences.", len(saved_sequences_info))
         return saved_sequences_info
 
     @staticmethod
@@ -192,18 +449,19 @@ class SequenceIOManager:
             bool: 삭제 성공 시 True, 실패 시 False.
         """
         try:
-            if os.path.exists(filepath):
-                os.remove(filepath)
-                print(f"Info: 시퀀스 파일 '{filepath}'이(가) 삭제되었습니다.")
-                return True
-            else:
-                print(f"Warning: 삭제할 시퀀스 파일을 찾을 수 없습니다: '{filepath}'")
-                return False
+            os.remove(filepath) # 존재 확인 없이 바로 삭제 (없으면 FileNotFoundError)
+            _evict_load_cache(filepath)
+            _invalidate_list_cache(os.path.dirname(filepath))
+            logger.info("시퀀스 파일 '%s'이(가) 삭제되었습니다.", filepath)
+            return True
+        except FileNotFoundError:
+            logger.warning("삭제할 시퀀스 파일을 찾을 수 없습니다: '%s'", filepath)
+            return False
         except OSError as e:
-            print(f"Error: 시퀀스 파일 삭제 중 OS 오류 발생 '{filepath}': {e}")
+            logger.error("시퀀스 파일 삭제 중 OS 오류 발생 '%s': %s", filepath, e)
             return False
         except Exception as e:
-            print(f"Error: 시퀀스 파일 삭제 중 예기치 않은 오류 발생 '{filepath}': {e}")
+            logger.error("시퀀스 파일 삭제 중 예기치 않은 오류 발생 '%s': %s", filepath, e)
             return False
 
     @staticmethod
@@ -220,26 +478,37 @@ class SequenceIOManager:
         Returns:
             Optional[str]: 성공 시 새로운 전체 파일 경로, 실패 시 None.
         """
-        if not os.path.exists(old_filepath):
-            print(f"Error: 이름을 변경할 시퀀스 파일을 찾을 수 없습니다: '{old_filepath}'")
-            return None
-        
         new_filename = new_name_without_ext + constants.SEQUENCE_FILE_EXTENSION
         new_filepath = os.path.join(directory, new_filename)
 
-        if os.path.exists(new_filepath):
-            print(f"Error: 이미 동일한 이름의 시퀀스 파일이 존재합니다: '{new_filepath}'")
-            return None
-        
         try:
-            os.rename(old_filepath, new_filepath)
-            print(f"Info: 시퀀스 파일 이름이 '{os.path.basename(old_filepath)}'에서 '{new_filename}'(으)로 변경되었습니다.")
+            # 하드 링크 생성은 대상이 있으면 실패하므로, 존재 확인 stat 없이 덮어쓰기를 원자적으로 방지
+            try:
+                os.link(old_filepath, new_filepath)
+            except (FileNotFoundError, FileExistsError):
+                raise
+            except OSError: # 하드 링크를 지원하지 않는 파일 시스템: 확인 후 이름 변경
+                if os.path.exists(new_filepath):
+                    raise FileExistsError(new_filepath)
+                os.rename(old_filepath, new_filepath)
+            else:
+                os.remove(old_filepath)
+            _evict_load_cache(old_filepath, new_filepath)
+            _invalidate_list_cache(os.path.dirname(old_filepath))
+            _invalidate_list_cache(directory)
+            logger.info("시퀀스 파일 이름이 '%s'에서 '%s'(으)로 변경되었습니다.", os.path.basename(old_filepath), new_filename)
             return new_filepath
+        except FileNotFoundError:
+            logger.error("이름을 변경할 시퀀스 파일을 찾을 수 없습니다: '%s'", old_filepath)
+            return None
+        except FileExistsError:
+            logger.error("이미 동일한 이름의 시퀀스 파일이 존재합니다: '%s'", new_filepath)
+            return None
         except OSError as e:
-            print(f"Error: 시퀀스 파일 이름 변경 중 OS 오류 발생: {e}")
+            logger.error("시퀀스 파일 이름 변경 중 OS 오류 발생: %s", e)
             return None
         except Exception as e:
-            print(f"Error: 시퀀스 파일 이름 변경 중 예기치 않은 오류 발생: {e}")
+            logger.error("시퀀스 파일 이름 변경 중 예기치 않은 오류 발생: %s", e)
             return None
 
 if __name__ == '__main__':
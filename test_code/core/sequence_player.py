@@ -1,7 +1,9 @@
 # core/sequence_player.py
+import functools
+import re
 import time
 import sys 
-from typing import List, Tuple, Dict, Any, Optional, ForwardRef, cast
+from typing import List, Tuple, Dict, Any, Optional, ForwardRef, Callable, NamedTuple, cast
 
 from PyQt5.QtCore import QObject, pyqtSignal
 from PyQt5.QtWidgets import QMessageBox, QApplication, QPushButton, QDialog, QVBoxLayout, QLabel
@@ -20,6 +22,76 @@ from .data_models import SequenceItem, LoopActionItem, SimpleActionItem
 # 이 ForwardRef는 SequencePlayer가 main_window의 메소드를 호출할 때 타입 힌트를 위해 사용됩니다.
 RegMapWindowType = ForwardRef('main_window.RegMapWindow')
 
+# 실행 중 로그 메시지는 모아서 한 번에 emit (긴 루프에서 Qt 이벤트 큐/GUI 스레드 부하 감소)
+_LOG_FLUSH_MAX_MESSAGES = 64
+_LOG_FLUSH_INTERVAL_SEC = 0.05
+
+# I2C Read Addr 캐시를 유지해도 되는 액션 (허용 목록). 그 밖의 모든 액션(쓰기, 장비 설정/출력/터미널 변경,
+# 온도 대기, HOLD, Loop, 알 수 없는 타입 등)은 실행 전에 캐시를 비움
+_READ_CACHE_PRESERVING_ACTIONS = frozenset({
+    constants.SEQ_PREFIX_I2C_READ_ADDR,
+    constants.SEQ_PREFIX_I2C_READ_NAME,
+})
+
+# 실행 전에 쌓인 로그를 먼저 내보내는 액션: 릴레이 전환/출력 설정/온도 설정 등 계측기 응답을 오래 기다릴 수 있는 단계.
+# 그 밖의 짧은 단계(I2C, 측정)는 _LOG_FLUSH_MAX_MESSAGES / _LOG_FLUSH_INTERVAL_SEC 기준으로만 묶어서 보냄
+_LOG_FLUSH_BEFORE_ACTIONS = frozenset({
+    constants.SEQ_PREFIX_MM_SET_TERMINAL,
+    constants.SEQ_PREFIX_SM_SET_V,
+    constants.SEQ_PREFIX_SM_SET_I,
+    constants.SEQ_PREFIX_SM_ENABLE_OUTPUT,
+    constants.SEQ_PREFIX_SM_CONFIGURE_VSOURCE_AND_ENABLE,
+    constants.SEQ_PREFIX_SM_SET_TERMINAL,
+    constants.SEQ_PREFIX_SM_SET_PROTECTION_I,
+    constants.SEQ_PREFIX_CHAMBER_SET_TEMP,
+    constants.SEQ_PREFIX_CHAMBER_CHECK_TEMP,
+})
+
+# SimpleAction 처리 메서드: (치환된 파라미터, 현재 조건) -> (성공 여부, 오류 메시지)
+ActionHandler = Callable[[Dict[str, Any], Dict[str, Any]], Tuple[bool, str]]
+
+
+# "ACTION_TYPE: key=value; key2=value2" 형식 시퀀스 아이템 문자열 파싱용
+_ITEM_TEXT_RE = re.compile(r'\s*([^:]*):(.*)', re.DOTALL)
+_ITEM_PARAM_RE = re.compile(r'([^;=]*)=([^;]*)')
+
+@functools.lru_cache(maxsize=4096)
+def _parse_hex_param(value: str, num_chars: Optional[int] = None) -> Optional[Tuple[str, int]]:
+    """
+    hex 문자열 파라미터를 (정규화된 문자열, 정수)로 변환합니다. 형식이 잘못되면 None.
+    루프 안에서 같은 값이 반복해 들어오므로 정규화와 int 변환 결과를 함께 캐시합니다.
+    """
+    norm_hex = normalize_hex_input(value, num_chars)
+    if norm_hex is None:
+        return None
+    return norm_hex, int(norm_hex, 16)
+
+def _contains_placeholder(value: Any) -> bool:
+    """문자열/리스트/딕셔너리 안에 '{var}' 형태가 될 수 있는 문자열이 있는지 확인합니다."""
+    if isinstance(value, str):
+        return "{" in value
+    if isinstance(value, list):
+        return any(_contains_placeholder(item) for item in value)
+    if isinstance(value, dict):
+        return any(_contains_placeholder(v) for v in value.values())
+    return False
+
+class _CompiledAction(NamedTuple):
+    """
+    run_sequence 시작 시 SequenceItem마다 한 번 만드는 실행용 레코드입니다.
+    단계마다 dict 조회와 action_type 비교 체인을 반복하지 않도록 필요한 값과 처리 메서드를 미리 찾아 둡니다.
+    """
+    item: SequenceItem
+    action_type: Optional[str]
+    item_id: str
+    display_name: Any
+    step_header: str # 단계 시작 로그 문자열 (반복 실행마다 다시 포맷하지 않음)
+    handler: Optional[ActionHandler] # SimpleAction 처리 메서드 (Loop, HOLD, 알 수 없는 타입은 None)
+    params: Dict[str, Any]
+    has_placeholders: bool # params에 '{' 가 든 문자열이 있을 때만 루프 변수 치환이 필요
+    looped_actions: Tuple['_CompiledAction', ...] # Loop 아이템의 내부 액션 (컴파일됨)
+    loop_values: Optional[Tuple[List[Any], str]] # Loop 아이템의 (반복 값 목록, 오류 메시지). 미리 만들지 못했으면 None
+
 
 class SequencePlayer(QObject):
     """
@@ -27,6 +99,7 @@ class SequencePlayer(QObject):
     QThread에서 실행되어 GUI의 반응성을 유지합니다.
     """
     log_message_signal = pyqtSignal(str)
+    log_batch_signal = pyqtSignal(list) # [(기록 시각 epoch초, 메시지), ...] - 실행 중 로그를 모아서 전달
     measurement_result_signal = pyqtSignal(str, object, str, dict) 
     sequence_finished_signal = pyqtSignal(bool, str) 
     
@@ -51,6 +124,10 @@ class SequencePlayer(QObject):
         self.chamber = chamber_instance # Chamber 인스턴스 저장
         self.sample_number = sample_number if sample_number else ""
         self.main_window_ref = main_window_ref
+        self._refresh_device_use_flags()
+
+        self._log_buf: List[Tuple[float, str]] = [] # 아직 emit하지 않은 (기록 시각, 실행 로그 메시지)
+        self._last_log_flush = time.time()
         
         self.request_stop_flag: bool = False 
         
@@ -61,6 +138,132 @@ class SequencePlayer(QObject):
         self._current_smu_set_current: Optional[float] = None
         self._current_chamber_set_temp: Optional[float] = None
 
+        # _get_current_conditions의 장비 조건 캐시 (SMU/Chamber 설정 액션 실행 시 _conditions_dirty = True)
+        self._conditions_dirty: bool = True
+        self._base_conditions_cache: Dict[str, Any] = {}
+
+        # I2C Read Addr 결과 캐시: 정규화 주소 -> (읽은 값, 읽은 단계 번호)
+        # 값이 계속 바뀌는 레지스터(상태/ADC 등)가 있으므로 설정의 TTL(단계 수)이 0보다 클 때만 사용합니다.
+        # I2C 읽기(_READ_CACHE_PRESERVING_ACTIONS)가 아닌 액션을 실행하기 전에 항상 비워집니다.
+        self._read_cache: Dict[str, Tuple[int, int]] = {}
+        self._read_cache_ttl_steps: int = 0
+        self._step_counter: int = 0 # 실행한 SimpleAction 단계 수 (캐시 수명 계산용)
+
+        # action_type -> 처리 메서드 (if/elif 비교 체인 대신 dict 조회 한 번)
+        self._action_handlers: Dict[str, ActionHandler] = {
+            constants.SEQ_PREFIX_I2C_WRITE_NAME: self._do_i2c_write_name,
+            constants.SEQ_PREFIX_I2C_READ_NAME: self._do_i2c_read_name,
+            constants.SEQ_PREFIX_I2C_WRITE_ADDR: self._do_i2c_write_addr,
+            constants.SEQ_PREFIX_I2C_READ_ADDR: self._do_i2c_read_addr,
+            constants.SEQ_PREFIX_MM_MEAS_V: self._do_mm_meas_v,
+            constants.SEQ_PREFIX_MM_MEAS_I: self._do_mm_meas_i,
+            constants.SEQ_PREFIX_MM_SET_TERMINAL: self._do_mm_set_terminal,
+            constants.SEQ_PREFIX_SM_SET_V: self._do_sm_set_v,
+            constants.SEQ_PREFIX_SM_SET_I: self._do_sm_set_i,
+            constants.SEQ_PREFIX_SM_MEAS_I: self._do_sm_meas_i,
+            constants.SEQ_PREFIX_SM_ENABLE_OUTPUT: self._do_sm_enable_output,
+            constants.SEQ_PREFIX_SM_CONFIGURE_VSOURCE_AND_ENABLE: self._do_sm_configure_vsource_and_enable,
+            constants.SEQ_PREFIX_SM_SET_TERMINAL: self._do_sm_set_terminal,
+            constants.SEQ_PREFIX_SM_SET_PROTECTION_I: self._do_sm_set_protection_i,
+            constants.SEQ_PREFIX_CHAMBER_SET_TEMP: self._do_chamber_set_temp,
+            constants.SEQ_PREFIX_CHAMBER_CHECK_TEMP: self._do_chamber_check_temp,
+        }
+
+    def _log(self, message: str) -> None:
+        """
+        실행 로그를 기록 시각과 함께 버퍼에 쌓고, 개수나 경과 시간이 기준을 넘으면 한 번에 emit합니다.
+        UI는 줄마다 기록 시각을 표시하므로 묶어서 보내도 타임스탬프가 뭉개지지 않습니다.
+        """
+        now = time.time()
+        buf = self._log_buf
+        buf.append((now, message))
+        if len(buf) >= _LOG_FLUSH_MAX_MESSAGES or now - self._last_log_flush >= _LOG_FLUSH_INTERVAL_SEC:
+            self._flush_log()
+
+    def _flush_log(self) -> None:
+        """버퍼에 쌓인 로그 항목을 하나의 log_batch_signal로 보냅니다."""
+        if self._log_buf:
+            entries = self._log_buf
+            self._log_buf = []
+            self.log_batch_signal.emit(entries)
+        self._last_log_flush = time.time()
+
+    def _refresh_device_use_flags(self) -> None:
+        """장비 사용 여부 설정과 필드 맵을 한 번 읽어 두어, 액션 처리마다 속성/settings dict를 조회하지 않도록 합니다."""
+        # RegisterMap은 logical_fields_map을 재할당하지 않고 제자리에서 갱신하므로 dict 자체를 바인딩해 둠
+        self._logical_fields_map = self.register_map.logical_fields_map if self.register_map else {}
+        self._mm_on = bool(self.settings.get("multimeter_use"))
+        self._sm_on = bool(self.settings.get("sourcemeter_use"))
+        self._ch_on = bool(self.settings.get("chamber_use"))
+
+    @staticmethod
+    def _build_loop_values(loop_item: LoopActionItem) -> Tuple[List[Any], str]:
+        """Loop 아이템의 sweep_type에 따라 반복할 값 목록을 만듭니다. 설정이 잘못되었으면 ([], 오류 메시지)를 반환합니다."""
+        sweep_type = loop_item.get("sweep_type")
+        loop_iterations_source: List[Any] = []
+
+        if sweep_type == "NumericRange":
+            start_val = loop_item.get("start_value")
+            stop_val = loop_item.get("stop_value")
+            step_val = loop_item.get("step_value")
+            if start_val is None or stop_val is None or step_val is None or step_val == 0:
+                return [], "NumericRange loop: start, stop, or step value is invalid or step is zero."
+            # 값은 기존과 같이 누적 덧셈으로 생성 (start + i*step 방식은 끝값 포함 여부가 달라질 수 있음)
+            current = start_val
+            append = loop_iterations_source.append
+            if step_val > 0:
+                while current <= stop_val:
+                    append(current)
+                    current += step_val
+            else: # step_val < 0 (already checked step_val != 0)
+                while current >= stop_val:
+                    append(current)
+                    current += step_val
+        elif sweep_type == "ValueList":
+            value_list = loop_item.get("value_list", [])
+            if not value_list:
+                return [], "ValueList loop: list of values is empty."
+            loop_iterations_source = value_list
+        elif sweep_type == "FixedCount":
+            loop_count = loop_item.get("loop_count")
+            if loop_count is None or loop_count <= 0:
+                return [], "FixedCount loop: loop_count is invalid."
+            loop_iterations_source = list(range(1, loop_count + 1)) # 1-based iteration count for display
+        else:
+            return [], f"Unknown or unsupported sweep_type: {sweep_type}"
+        return loop_iterations_source, ""
+
+    def _compile_actions(self, sequence_items: List[SequenceItem]) -> List[_CompiledAction]:
+        """SequenceItem 리스트(중첩 Loop 포함)를 실행용 _CompiledAction 리스트로 한 번 변환합니다."""
+        compiled_actions: List[_CompiledAction] = []
+        handlers = self._action_handlers
+        for item_index, item in enumerate(sequence_items):
+            action_type = item.get("action_type")
+            looped_actions: Tuple[_CompiledAction, ...] = ()
+            loop_values: Optional[Tuple[List[Any], str]] = None
+            if action_type == "Loop":
+                looped_actions = tuple(self._compile_actions(item.get("looped_actions") or []))
+                try:
+                    loop_values = self._build_loop_values(cast(LoopActionItem, item))
+                except Exception: # 잘못된 값 타입 등: 기존과 같이 실행 시점에 다시 시도하여 오류를 드러냄
+                    loop_values = None
+            params = item.get("parameters", {})
+            item_id = item.get("item_id", f"item_{item_index}")
+            display_name = item.get("display_name", action_type)
+            compiled_actions.append(_CompiledAction(
+                item=item,
+                action_type=action_type,
+                item_id=item_id,
+                display_name=display_name,
+                step_header=f"\n--- 실행: '{display_name}' (ID: {item_id}, Type: {action_type}) ---",
+                handler=handlers.get(action_type),
+                params=params,
+                has_placeholders=_contains_placeholder(params),
+                looped_actions=looped_actions,
+                loop_values=loop_values,
+            ))
+        return compiled_actions
+
     def _resolve_placeholders(self, value: Any, current_loop_vars: Dict[str, Any]) -> Any:
         """Recursively resolves placeholders in a string or list/dict of strings."""
         if isinstance(value, str):
@@ -97,29 +300,41 @@ class SequencePlayer(QObject):
         # 지금은 빈 값 반환 또는 예외 발생으로 처리.
         # raise NotImplementedError("_parse_sequence_item is deprecated as SequencePlayer now uses SequenceItem objects.")
         # 임시로 기존 로직 유지 (SequenceControllerTab에서 호출될 수 있으므로)
-        try:
-            item_text_stripped = item_text.lstrip() 
-            action_type_str, params_str = item_text_stripped.split(":", 1)
-            action_type_str = action_type_str.strip()
-            params_dict = {}
-            if params_str.strip():
-                param_pairs = params_str.split(';')
-                for pair in param_pairs:
-                    if '=' in pair: 
-                        key, value = pair.split('=', 1)
-                        params_dict[key.strip()] = value.strip()
-            return action_type_str, params_dict
-        except ValueError: 
-            self.log_message_signal.emit(f"Error: 시퀀스 아이템 파싱 실패 - '{item_text_stripped if 'item_text_stripped' in locals() else item_text}'")
+        # 첫 ':' 앞은 액션 타입, 뒤는 ';'로 구분된 key=value 목록 ('='가 없는 조각은 무시)
+        match = _ITEM_TEXT_RE.match(item_text)
+        if match is None:
+            self.log_message_signal.emit(f"Error: 시퀀스 아이템 파싱 실패 - '{item_text.lstrip()}'")
             return None, {}
+        action_type_str, params_str = match.groups()
+        params_dict = {key.strip(): value.strip() for key, value in _ITEM_PARAM_RE.findall(params_str)}
+        return action_type_str.strip(), params_dict
 
     def _get_current_conditions(self) -> Dict[str, Any]:
+        # 장비 설정 조건은 SMU/Chamber 설정 액션이 실행될 때만 바뀌므로 캐시하고, 그때만 다시 조회 (_conditions_dirty)
+        if self._conditions_dirty:
+            self._base_conditions_cache = self._fetch_device_conditions()
+        base_conditions: Dict[str, Any] = dict(self._base_conditions_cache) # 측정 결과마다 별도 dict 전달
+        
+        # 활성 루프 컨텍스트의 모든 변수를 기본 조건에 추가
+        # 루프 변수 이름은 "loop_" 접두사를 가질 수 있음 (구현에 따라 다름)
+        for loop_ctx in self.active_loop_contexts:
+            loop_var_name = loop_ctx.get("loop_variable_name") # 기본값 없이 가져옴
+            current_loop_val = loop_ctx.get("current_value", None)
+            if loop_var_name and current_loop_val is not None: # 변수 이름이 있고, 값도 있을 때만 추가
+                 # SequencePlayer 내부에서 active_loop_vars 만들 때 이미 접두사 붙였다면 여기선 필요 없음
+                 # 여기서는 loop_ctx에서 가져온 loop_variable_name을 그대로 사용한다고 가정
+                base_conditions[str(loop_var_name)] = current_loop_val # str()로 명시적 형변환
+        return base_conditions
+
+    def _fetch_device_conditions(self) -> Dict[str, Any]:
+        """장비의 현재 설정 조건(SMU 전압/전류, Chamber 온도)을 조회합니다. 성공하면 _conditions_dirty를 해제합니다."""
         base_conditions: Dict[str, Any] = {}
         if self.main_window_ref and hasattr(self.main_window_ref, 'get_current_measurement_conditions'):
             try:
                 base_conditions = self.main_window_ref.get_current_measurement_conditions()
             except Exception as e:
-                self.log_message_signal.emit(f"Warning: main_window_ref.get_current_measurement_conditions 호출 중 오류: {e}.")
+                self._log(f"Warning: main_window_ref.get_current_measurement_conditions 호출 중 오류: {e}.")
+                return base_conditions # 다음 단계에서 다시 조회
         else: # Fallback if main_window_ref or method is not available
             if self.sourcemeter:
                 if self.sourcemeter.get_cached_set_voltage() is not None:
@@ -129,47 +344,51 @@ class SequencePlayer(QObject):
             if self.chamber:
                 if self.chamber.get_cached_target_temperature() is not None:
                     base_conditions[constants.EXCEL_COL_COND_CHAMBER_T] = self.chamber.get_cached_target_temperature()
-        
-        # 활성 루프 컨텍스트의 모든 변수를 기본 조건에 추가
-        # 루프 변수 이름은 "loop_" 접두사를 가질 수 있음 (구현에 따라 다름)
-        for loop_ctx in self.active_loop_contexts:
-            loop_var_name = loop_ctx.get("loop_variable_name") # 기본값 없이 가져옴
-            current_loop_val = loop_ctx.get("current_value", None)
-            if loop_var_name and current_loop_val is not None: # 변수 이름이 있고, 값도 있을 때만 추가
-                 # SequencePlayer 내부에서 active_loop_vars 만들 때 이미 접두사 붙였다면 여기선 필요 없음
-                 # 여기서는 loop_ctx에서 가져온 loop_variable_name을 그대로 사용한다고 가정
-                base_conditions[str(loop_var_name)] = current_loop_val # str()로 명시적 형변환
+        self._conditions_dirty = False
         return base_conditions
 
     def run_sequence(self):
         total_items = len(self.sequence_items) # 전체 아이템 수 (루프 포함)
-        self.log_message_signal.emit(f"시퀀스 실행 시작... (총 {total_items} 최상위 아이템, Sample: {self.sample_number})")
+        self._log(f"시퀀스 실행 시작... (총 {total_items} 최상위 아이템, Sample: {self.sample_number})")
 
         self.request_stop_flag = False
         self.active_loop_contexts = [] # 루프 컨텍스트 초기화
+        self._conditions_dirty = True # 실행 전 외부에서 바뀌었을 수 있는 장비 조건을 다시 조회
+        self._read_cache.clear()
+        self._step_counter = 0
+        self._refresh_device_use_flags()
+        try:
+            self._read_cache_ttl_steps = max(0, int(self.settings.get(constants.SETTINGS_I2C_READ_CACHE_TTL_STEPS_KEY, 0) or 0))
+        except (TypeError, ValueError):
+            self._read_cache_ttl_steps = 0
 
         if self.chamber and hasattr(self.chamber, 'set_stop_flag_ref'):
             self.chamber.set_stop_flag_ref(self)
 
         # 재귀적으로 액션 실행을 위한 내부 헬퍼 함수 호출
-        final_success, final_message = self._execute_actions_recursively(self.sequence_items, top_level_call=True)
+        # 아이템별 처리 메서드/속성을 한 번만 조회해 두고 실행 (루프 반복마다 다시 조회하지 않음)
+        try:
+            compiled_actions = self._compile_actions(self.sequence_items)
+            final_success, final_message = self._execute_actions_recursively(compiled_actions, top_level_call=True)
+        finally:
+            self._flush_log() # 예외로 빠져나가도 쌓인 로그를 잃지 않음
         
         self.sequence_finished_signal.emit(final_success, final_message)
 
-    def _execute_actions_recursively(self, actions_to_execute: List[SequenceItem], top_level_call: bool = False) -> Tuple[bool, str]:
+    def _execute_actions_recursively(self, actions_to_execute: List[_CompiledAction], top_level_call: bool = False) -> Tuple[bool, str]:
         halt_on_error = self.settings.get("error_halts_sequence", False)
+        log = self._log # 단계마다 반복되는 속성 조회를 피하기 위해 지역 변수로 바인딩
         overall_success = True
         completion_message = constants.MSG_SEQUENCE_PLAYBACK_COMPLETE
 
-        for item_index, current_action_item in enumerate(actions_to_execute):
+        for current_action_item, action_type, item_id, display_name, step_header, handler, params, has_placeholders, looped_actions, loop_values in actions_to_execute:
             if self.request_stop_flag:
-                self.log_message_signal.emit("시퀀스 실행 중단 요청됨.")
+                log("시퀀스 실행 중단 요청됨.")
                 return False, constants.MSG_SEQUENCE_PLAYBACK_ABORTED
 
-            action_type = current_action_item.get("action_type")
-            item_id = current_action_item.get("item_id", f"item_{item_index}")
-            display_name = current_action_item.get("display_name", action_type)
-            self.log_message_signal.emit(f"\n--- 실행: '{display_name}' (ID: {item_id}, Type: {action_type}) ---")
+            log(step_header)
+            if action_type not in _READ_CACHE_PRESERVING_ACTIONS:
+                self._read_cache.clear()
 
             step_success = False
             error_msg = ""
@@ -177,7 +396,8 @@ class SequencePlayer(QObject):
             # HOLD 액션: 팝업 띄우고, Pass 누를 때까지 대기
             if action_type == constants.SequenceActionType.HOLD.value:
                 hold_name = current_action_item.get("parameters", {}).get("HOLD_NAME", "(No Name)")
-                self.log_message_signal.emit(f"[HOLD] 시퀀스 일시정지: {hold_name}")
+                log(f"[HOLD] 시퀀스 일시정지: {hold_name}")
+                self._flush_log() # 다이얼로그로 대기하기 전에 쌓인 로그를 표시
                 # UI 스레드에서 모달 다이얼로그 띄우기
                 def show_hold_dialog():
                     dlg = QDialog()
@@ -207,24 +427,16 @@ class SequencePlayer(QObject):
                         app.processEvents()
                         result = show_hold_dialog()
                     if not result:
-                        self.log_message_signal.emit("[HOLD] 사용자가 취소하여 시퀀스를 중단합니다.")
+                        log("[HOLD] 사용자가 취소하여 시퀀스를 중단합니다.")
                         return False, "사용자에 의해 Hold에서 중단됨"
                 else:
-                    self.log_message_signal.emit("[HOLD] QApplication 인스턴스 없음. 자동 PASS.")
+                    log("[HOLD] QApplication 인스턴스 없음. 자동 PASS.")
                 step_success = True
                 continue
 
             if action_type == "Loop":
                 loop_item = cast(LoopActionItem, current_action_item)
                 loop_var_name = loop_item.get("loop_variable_name")
-                start_val = loop_item.get("start_value")
-                stop_val = loop_item.get("stop_value")
-                step_val = loop_item.get("step_value")
-                loop_count = loop_item.get("loop_count")
-                looped_actions = loop_item.get("looped_actions", [])
-
-                current_loop_val = start_val
-                iteration = 0
 
                 # 루프 컨텍스트 설정
                 loop_context = {
@@ -234,49 +446,22 @@ class SequencePlayer(QObject):
                     "sweep_type": loop_item.get("sweep_type") # Store sweep_type for logging/conditions
                 }
                 self.active_loop_contexts.append(loop_context)
-                self.log_message_signal.emit(f"  Loop Start: {display_name} (Type: {loop_context.get('sweep_type')})")
-
-                # Determine loop iteration logic based on sweep_type
-                sweep_type = loop_item.get("sweep_type")
-                current_iter_value: Any = None
-                loop_iterations_source: List[Any] = []
-
-                if sweep_type == "NumericRange":
-                    if not all(v is not None for v in [start_val, stop_val, step_val]) or (step_val is not None and step_val == 0):
-                        error_msg = "NumericRange loop: start, stop, or step value is invalid or step is zero."; break
-                    # Generate all values for the range
-                    current = start_val
-                    if step_val is not None and start_val is not None and stop_val is not None: # Check for None before comparison
-                        if step_val > 0:
-                            while current <= stop_val:
-                                loop_iterations_source.append(current)
-                                current += step_val
-                        else: # step_val < 0 (already checked step_val != 0)
-                            while current >= stop_val:
-                                loop_iterations_source.append(current)
-                                current += step_val
-                    else:
-                        error_msg = "NumericRange loop: start, stop or step value is None after check."; break
-                elif sweep_type == "ValueList":
-                    value_list = loop_item.get("value_list", [])
-                    if not value_list:
-                        error_msg = "ValueList loop: list of values is empty."; break
-                    loop_iterations_source = value_list
-                elif sweep_type == "FixedCount":
-                    if loop_count is None or loop_count <= 0:
-                        error_msg = "FixedCount loop: loop_count is invalid."; break
-                    loop_iterations_source = list(range(1, loop_count + 1)) # 1-based iteration count for display
-                else:
-                    error_msg = f"Unknown or unsupported sweep_type: {sweep_type}"; break
+                log(f"  Loop Start: {display_name} (Type: {loop_context.get('sweep_type')})")
+
+                # 반복 값 목록은 컴파일 시 미리 만들어 둠 (만들지 못한 경우에만 여기서 생성)
+                if loop_values is None:
+                    loop_values = self._build_loop_values(loop_item)
+                loop_iterations_source, error_msg = loop_values
+                if error_msg: break
 
                 for iter_idx, current_iter_value_from_source in enumerate(loop_iterations_source):
                     if self.request_stop_flag: break
 
                     loop_context["current_value"] = current_iter_value_from_source
                     if loop_var_name: # If a variable name is defined for this loop
-                        self.log_message_signal.emit(f"    Loop Iteration {iter_idx+1}/{len(loop_iterations_source)}: {loop_var_name} = {current_iter_value_from_source}")
+                        log(f"    Loop Iteration {iter_idx+1}/{len(loop_iterations_source)}: {loop_var_name} = {current_iter_value_from_source}")
                     else: # For FixedCount without a variable name, or other generic cases
-                        self.log_message_signal.emit(f"    Loop Iteration {iter_idx+1}/{len(loop_iterations_source)}")
+                        log(f"    Loop Iteration {iter_idx+1}/{len(loop_iterations_source)}")
 
                     # 내부 액션 실행
                     loop_internal_success, loop_internal_msg = self._execute_actions_recursively(looped_actions)
@@ -285,22 +470,25 @@ class SequencePlayer(QObject):
                 
                 self.active_loop_contexts.pop() # 현재 루프 컨텍스트 제거
                 if error_msg:
-                    self.log_message_signal.emit(f"  Loop Error: {error_msg}")
+                    log(f"  Loop Error: {error_msg}")
                     step_success = False
                 elif self.request_stop_flag:
-                     self.log_message_signal.emit(f"  Loop Interrupted by user.")
+                     log(f"  Loop Interrupted by user.")
                      step_success = False # 중단 시 성공으로 간주 안함
                 else:
-                    self.log_message_signal.emit(f"  Loop End: {display_name}")
+                    log(f"  Loop End: {display_name}")
                     step_success = True
             
             else: # SimpleActionItem 처리
-                simple_item = cast(SimpleActionItem, current_action_item)
-                params = simple_item.get("parameters", {})
-                
+                self._step_counter += 1
                 # Resolve placeholders in parameters
-                current_loop_vars_map = self._get_current_loop_variables_map()
-                resolved_params = self._resolve_placeholders(params, current_loop_vars_map)
+                # 치환할 자리표시자가 없거나 활성 루프 변수가 없으면 결과가 params와 같으므로 복사본을 만들지 않음
+                # (핸들러는 params를 읽기만 함)
+                resolved_params = params
+                if has_placeholders:
+                    current_loop_vars_map = self._get_current_loop_variables_map()
+                    if current_loop_vars_map:
+                        resolved_params = self._resolve_placeholders(params, current_loop_vars_map)
                 
                 modified_params: Dict[str, Any] # Declare type for modified_params
                 # Initialize step_success to True for simple actions, errors will set it to False
@@ -319,333 +507,12 @@ class SequencePlayer(QObject):
                     try:
                         current_conditions_with_loops = self._get_current_conditions() # 모든 활성 루프 변수 포함
                         
-                        if action_type == constants.SEQ_PREFIX_I2C_WRITE_NAME:
-                            name = modified_params.get(constants.SEQ_PARAM_KEY_TARGET_NAME)
-                            val_from_params = modified_params.get(constants.SEQ_PARAM_KEY_VALUE)
-
-                            if self.i2c_device and self.register_map and name and val_from_params is not None:
-                                field_info = self.register_map.logical_fields_map.get(name)
-                                if not field_info: error_msg = constants.MSG_FIELD_ID_NOT_FOUND.format(field_id=name)
-                                else:
-                                    val_to_write_int = 0
-                                    if isinstance(val_from_params, (int, float)):
-                                        val_to_write_int = int(round(val_from_params)) # 반올림하여 정수화
-                                    elif isinstance(val_from_params, str):
-                                        norm_hex = normalize_hex_input(val_from_params)
-                                        if norm_hex:
-                                            val_to_write_int = int(norm_hex, 16)
-                                        else: error_msg = constants.MSG_CANNOT_PARSE_HEX_FOR_FIELD.format(value=val_from_params)
-                                    else: error_msg = f"Invalid value type for I2C Write Name: {type(val_from_params)}"
-
-                                    if not error_msg:
-                                        if val_to_write_int >= (1 << field_info['length']):
-                                            error_msg = constants.MSG_VALUE_EXCEEDS_WIDTH.format(value=f"{val_to_write_int} (0x{val_to_write_int:X})", field_id=name, length=field_info['length'])
-                                        else:
-                                            # "값 변경 없음" 최적화 제거: 항상 I2C 쓰기 시도
-                                            # register_map을 사용하여 쓸 주소와 값을 계산하되, 실제 쓰기는 항상 수행
-                                            # 이 로직은 register_map.set_logical_field_value의 반환값을 사용하는 대신,
-                                            # 필요한 (address, value) 쌍을 직접 계산하여 i2c_device.write를 호출해야 함.
-                                            # RegisterMap에 field_to_physical_writes(field_id, value_int) 같은 헬퍼가 있으면 좋음.
-                                            # 임시로 set_logical_field_value를 호출하여 ops를 받고, 무조건 실행하는 형태로 유지
-                                            # (이 경우 set_logical_field_value 내부 최적화를 제거해야 함)
-                                            # 더 나은 방법: register_map이 항상 써야 할 최종 (addr, val) 목록을 반환하도록 수정
-                                            # 여기서는 set_logical_field_value가 반환하는 i2c_ops를 무조건 실행하도록 가정.
-                                            # (set_logical_field_value가 현재값과 비교하여 빈 리스트를 반환하는 로직 수정 필요)
-                                            
-                                            # --- 직접 I2C 쓰기 위한 (주소, 값) 계산 로직 (set_logical_field_value 대체 또는 보강) ---
-                                            temp_current_vals = self.register_map.current_address_values.copy()
-                                            actual_i2c_ops_needed: List[Tuple[str, int]] = []
-                                            
-                                            # 1. 해당 필드가 차지하는 모든 주소의 현재 값을 가져옴
-                                            # 2. 새 필드 값으로 인해 변경될 각 주소의 새 바이트 값을 계산
-                                            for addr_h, loc_offset, loc_width, f_part_lsb, _ in field_info['regions_mapping']:
-                                                addr_k = addr_h.upper()
-                                                # 필드의 이 부분에 해당하는 새 값 추출
-                                                part_mask_in_field = ((1 << loc_width) - 1)
-                                                new_part_val_for_region = (val_to_write_int >> f_part_lsb) & part_mask_in_field
-                                                
-                                                # 현재 주소의 바이트 값 가져오기 (또는 0)
-                                                current_byte_val = temp_current_vals.get(addr_k, 0)
-                                                
-                                                # 해당 부분 비우기
-                                                byte_clear_mask = ~(((1 << loc_width) - 1) << loc_offset)
-                                                modified_byte_val = current_byte_val & byte_clear_mask
-                                                
-                                                # 새 부분 값 채우기
-                                                modified_byte_val |= (new_part_val_for_region << loc_offset)
-                                                
-                                                # 변경된 주소와 값 저장 (실제 쓰기 대상)
-                                                if temp_current_vals.get(addr_k, 0) != modified_byte_val or True: # 항상 쓰도록 강제 (True 조건)
-                                                    # 중복 주소 연산 방지 (같은 주소에 여러 필드 일부가 있을 수 있으나, 최종 값은 하나)
-                                                    # 이 로직은 set_logical_field_value가 더 잘 처리할 수 있음. 여기서는 단순화.
-                                                    # 여기서는 그냥 추가하고, 실제 쓰기 전 중복 제거 또는 최종값 계산 필요.
-                                                    # 지금은 set_logical_field_value를 신뢰하고, 그 함수 내부의 최적화를 끈다고 가정.
-                                                    pass # 아래 set_logical_field_value 사용
-                                                temp_current_vals[addr_k] = modified_byte_val # 임시 값 업데이트
-
-                                            # register_map.set_logical_field_value가 항상 실제 써야할 ops를 반환한다고 가정 (내부 최적화 X)
-                                            # 또는, 위에서 계산된 actual_i2c_ops_needed를 사용.
-                                            # 더 간단한 접근: register_map.set_logical_field_value를 호출하고, 
-                                            # 반환된 i2c_ops가 비어있더라도, val_to_write_int를 기준으로 다시 ops를 생성하여 강제 쓰기.
-                                            
-                                            # 현재 register_map.set_logical_field_value는 변경이 있을 때만 ops를 반환함.
-                                            # 이를 수정하거나, 여기서 직접 ops를 생성해야 함.
-                                            # 여기서는 set_logical_field_value가 항상 올바른 최종 (addr, val) 쌍을 반환한다고 가정하고 진행.
-                                            # (set_logical_field_value 내부 로직이 이 가정을 만족하도록 수정 필요)
-
-                                            # set_logical_field_value는 (변경될_ops, 변경후_확인할_값들)을 반환.
-                                            # 항상 쓰려면, 이 함수가 "써야할_모든_ops"를 반환해야함.
-                                            # RegisterMap.get_physical_writes_for_field(field_id, value_int) 와 같은 함수가 필요.
-                                            # 임시로, set_logical_field_value를 호출하고, 만약 옵스가 비면, 현재 값으로라도 다시 계산해서 강제 쓰기.
-
-                                            i2c_ops, vals_to_confirm = self.register_map.set_logical_field_value(name, val_to_write_int)
-                                            
-                                            if not i2c_ops:
-                                                # 값이 변경되지 않았더라도, 명시적으로 쓰기 작업을 생성 (요청된 값 기준)
-                                                # RegisterMap에 이 로직을 위한 헬퍼 함수가 있는 것이 이상적
-                                                # 예: get_i2c_ops_for_value(field_id, value_int)
-                                                # 여기서는 set_logical_field_value가 항상 최종 상태를 반영하는 ops를 준다고 가정 (수정 필요)
-                                                # 또는, 아래와 같이 직접 계산하여 강제 쓰기
-                                                current_field_val_int = self.register_map.get_logical_field_value(name)
-                                                if current_field_val_int != val_to_write_int:
-                                                    # 이 경우는 set_logical_field_value가 ops를 반환했어야 함. 로직 오류.
-                                                    self.log_message_signal.emit(f"  Warning: Field '{name}' 값은 {val_to_write_int}(으)로 변경되어야 하나 I2C ops가 생성되지 않음.")
-                                                # 그럼에도 불구하고 현재 요청된 값으로 쓰기 위한 ops를 다시 구성
-                                                # (이 부분은 RegisterMap에 get_physical_writes_for_value(field_id, value_to_set_int) 와 같은 메서드를 만들어 사용하는 것이 좋음)
-                                                # 아래는 set_logical_field_value가 이미 올바른 ops를 반환한다고 가정하고, 비어있을때만 로그.
-                                                self.log_message_signal.emit(f"  Info: Register '{name}' 값(0x{val_to_write_int:X})이 현재 값과 동일하여 I2C Ops는 없지만, 로그 확인용.")
-                                                # step_success = True # 실제 쓰기 없이 성공 처리 (기존 로직)
-                                                # 강제 쓰기를 하려면 여기서 i2c_ops를 다시 만들어야함.
-                                                # 지금은 set_logical_field_value의 반환을 따름. "값 변경 없음 최적화 제거"는
-                                                # 이 함수가 항상 써야할 ops를 반환하도록 수정하는 것을 포함.
-                                                # 현재는 이 플레이어에서 set_logical_field_value가 최적화된 ops를 반환한다고 가정.
-                                                # "값 변경 없음 최적화 제거"를 위해, set_logical_field_value 수정이 선행되어야 함.
-                                                # 지금 당장은, ops가 없으면 메시지만 남기고 넘어감.
-                                                self.log_message_signal.emit(f"  Register '{name}' 값 변경 없음 (0x{val_to_write_int:X} 요청됨). 실제 쓰기 스킵됨.")
-                                                step_success = True # 실제 쓰기는 없었지만, 의도된 상태이므로 성공으로 간주
-                                            
-                                            all_writes_ok = True
-                                            if i2c_ops: # i2c_ops가 있을 때만 실행
-                                                for op_addr, op_val in i2c_ops:
-                                                    op_val_hex = f"0x{op_val:02X}"
-                                                    if not self.i2c_device.write(op_addr, op_val_hex):
-                                                        all_writes_ok = False; error_msg += f"I2C Write 실패 (Addr: {op_addr}, Val: {op_val_hex}); "; break
-                                                if all_writes_ok:
-                                                    self.register_map.confirm_address_values_update(vals_to_confirm)
-                                                    self.log_message_signal.emit(f"  Register '{name}'에 0x{val_to_write_int:X} ({val_to_write_int}) 쓰기 완료."); step_success = True
-                                            elif not error_msg: # i2c_ops도 없고 에러도 없으면 (위의 값 변경 없음 로그에서 이미 처리)
-                                                step_success = True # 이미 원하는 값이므로 성공
-
-                            elif not self.i2c_device: error_msg = "I2C 장치가 초기화되지 않았습니다."
-                            elif not self.register_map: error_msg = constants.MSG_NO_REGMAP_LOADED
-                            else: error_msg = "Name/Value 파라미터 누락"
-                        
-                        elif action_type == constants.SEQ_PREFIX_I2C_READ_NAME:
-                            name = modified_params.get(constants.SEQ_PARAM_KEY_TARGET_NAME); var_name = modified_params.get(constants.SEQ_PARAM_KEY_TEST_ITEM)
-                            if self.register_map and name and var_name:
-                                read_val_hex = self.register_map.get_logical_field_value_hex(name, from_initial=False)
-                                if constants.HEX_ERROR_NO_FIELD in read_val_hex or constants.HEX_ERROR_CONVERSION in read_val_hex : error_msg = f"Register '{name}' 읽기 오류: {read_val_hex}"
-                                else: self.measurement_result_signal.emit(var_name, read_val_hex, self.sample_number, current_conditions_with_loops); self.log_message_signal.emit(f"  Register '{name}' 읽기 값: {read_val_hex} (저장 변수: {var_name})"); step_success = True
-                            elif not self.register_map: error_msg = constants.MSG_NO_REGMAP_LOADED
-                            else: error_msg = "Name/Variable 파라미터 누락"
-                        
-                        elif action_type == constants.SEQ_PREFIX_I2C_WRITE_ADDR:
-                            addr = modified_params.get(constants.SEQ_PARAM_KEY_ADDRESS)
-                            val_from_params = modified_params.get(constants.SEQ_PARAM_KEY_VALUE)
-                            if self.i2c_device and addr and val_from_params is not None: # val_str -> val_from_params
-                                norm_addr = normalize_hex_input(addr, 4) 
-                                val_to_write_int = 0
-                                
-                                if isinstance(val_from_params, (int, float)):
-                                    val_to_write_int = int(round(val_from_params))
-                                elif isinstance(val_from_params, str):
-                                    norm_val_for_addr = normalize_hex_input(val_from_params, 2)
-                                    if norm_val_for_addr is None: error_msg = f"잘못된 값 형식: {val_from_params}"
-                                    else: val_to_write_int = int(norm_val_for_addr, 16)
-                                else: error_msg = f"Invalid value type for I2C Write Addr: {type(val_from_params)}"
-
-                                if norm_addr is None: error_msg = f"잘못된 주소 형식: {addr}"
-                                
-                                if not error_msg:
-                                    # 항상 쓰기 실행 (값 변경 없음 최적화 제거)
-                                    final_val_hex_to_write = f"0x{val_to_write_int:02X}"
-                                    if self.i2c_device.write(norm_addr, final_val_hex_to_write):
-                                        if self.register_map: 
-                                            self.register_map.confirm_address_values_update({norm_addr: val_to_write_int})
-                                        self.log_message_signal.emit(f"  I2C Write Addr: {norm_addr}, 값: {final_val_hex_to_write} ({val_to_write_int}) 쓰기 완료."); step_success = True
-                                    else: error_msg = f"I2C Write 실패 (Addr: {norm_addr}, Val: {final_val_hex_to_write})"
-                            elif not self.i2c_device: error_msg = "I2C 장치가 초기화되지 않았습니다."
-                            else: error_msg = "Address/Value 파라미터 누락"
-                        
-                        elif action_type == constants.SEQ_PREFIX_I2C_READ_ADDR:
-                            addr = modified_params.get(constants.SEQ_PARAM_KEY_ADDRESS); var_name = modified_params.get(constants.SEQ_PARAM_KEY_TEST_ITEM)
-                            if self.i2c_device and self.register_map and addr and var_name:
-                                norm_addr = normalize_hex_input(addr, 4)
-                                if norm_addr is None: error_msg = f"잘못된 주소 형식: {addr}"
-                                else:
-                                    read_hw_success, read_val_int = self.i2c_device.read(norm_addr)
-                                    if read_hw_success and read_val_int is not None:
-                                        self.register_map.confirm_address_values_update({norm_addr: read_val_int})
-                                        read_val_hex = f"0x{read_val_int:02X}"
-                                        self.measurement_result_signal.emit(var_name, read_val_hex, self.sample_number, current_conditions_with_loops)
-                                        self.log_message_signal.emit(f"  I2C Read Addr: {norm_addr}, 값: {read_val_hex} (저장 변수: {var_name})"); step_success = True
-                                    else: error_msg = f"I2C Read 실패 (Addr: {norm_addr})"
-                            elif not self.i2c_device: error_msg = "I2C 장치가 초기화되지 않았습니다."
-                            elif not self.register_map: error_msg = constants.MSG_NO_REGMAP_LOADED
-                            else: error_msg = "Address/Variable 파라미터 누락"
-                        
-                        elif action_type == constants.SEQ_PREFIX_MM_MEAS_V:
-                            var_name = modified_params.get(constants.SEQ_PARAM_KEY_TEST_ITEM)
-                            if self.multimeter and self.settings.get("multimeter_use") and var_name:
-                                s, v = self.multimeter.measure_voltage()
-                                if s and v is not None: self.measurement_result_signal.emit(var_name, v, self.sample_number, current_conditions_with_loops); self.log_message_signal.emit(f"  Multimeter V: {v:.6f} (Var: {var_name})"); step_success = True
-                                else: error_msg = "Multimeter 전압 측정 실패"
-                            elif not self.settings.get("multimeter_use"): error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Multimeter")
-                            elif not self.multimeter: error_msg = "Multimeter가 초기화되지 않았습니다."
-                            else: error_msg = "변수명 누락"
-                        elif action_type == constants.SEQ_PREFIX_MM_MEAS_I:
-                            var_name = modified_params.get(constants.SEQ_PARAM_KEY_TEST_ITEM)
-                            if self.multimeter and self.settings.get("multimeter_use") and var_name:
-                                s, curr = self.multimeter.measure_current()
-                                if s and curr is not None: self.measurement_result_signal.emit(var_name, curr, self.sample_number, current_conditions_with_loops); self.log_message_signal.emit(f"  Multimeter I: {curr:.6e} (Var: {var_name})"); step_success = True
-                            elif not self.settings.get("multimeter_use"): error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Multimeter")
-                            elif not self.multimeter: error_msg = "Multimeter가 초기화되지 않았습니다."
-                            else: error_msg = "변수명 누락"
-
-                        elif action_type == constants.SEQ_PREFIX_MM_SET_TERMINAL:
-                            term_val_from_params = modified_params.get(constants.SEQ_PARAM_KEY_TERMINAL)
-                            term = str(term_val_from_params) # 루프 변수 치환 결과가 숫자일 수 있으므로 str 변환
-                            if self.multimeter and self.settings.get("multimeter_use") and term:
-                                step_success = self.multimeter.set_terminal(term)
-                                if step_success: self.log_message_signal.emit(f"  Multimeter 터미널 {term}으로 설정.")
-                                else: error_msg = f"Multimeter 터미널 설정 실패 ({term})"
-                            elif not self.settings.get("multimeter_use"): error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Multimeter")
-                            elif not self.multimeter: error_msg = "Multimeter가 초기화되지 않았습니다."
-                            else: error_msg = "터미널 파라미터 누락"
-
-                        elif action_type == constants.SEQ_PREFIX_SM_SET_V:
-                            val_from_params = modified_params.get(constants.SEQ_PARAM_KEY_VALUE)
-                            if self.sourcemeter and self.settings.get("sourcemeter_use") and val_from_params is not None:
-                                try: 
-                                    val_float = float(val_from_params) # 루프 변수(숫자) 또는 직접 입력(문자열->숫자) 처리
-                                    step_success = self.sourcemeter.set_voltage(val_float) # 터미널 파라미터 없이 호출
-                                    if step_success: self.log_message_signal.emit(f"  SM Set Voltage Level: {val_float:.3f}V (Output may not be enabled yet)")
-                                    else: error_msg = f"SM 전압 레벨 설정 실패 ({val_float}V)"
-                                except ValueError: error_msg = f"SM 전압 값 '{val_from_params}' 오류"
-                            elif not self.settings.get("sourcemeter_use"): error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Sourcemeter")
-                            elif not self.sourcemeter: error_msg = "Sourcemeter가 초기화되지 않았습니다."
-                            else: error_msg = "변수명 누락"
-                        
-                        elif action_type == constants.SEQ_PREFIX_SM_SET_I:
-                            val_from_params = modified_params.get(constants.SEQ_PARAM_KEY_VALUE)
-                            if self.sourcemeter and self.settings.get("sourcemeter_use") and val_from_params is not None:
-                                try: 
-                                    val_float = float(val_from_params)
-                                    step_success = self.sourcemeter.set_current(val_float) # 터미널 파라미터 없이 호출
-                                    if step_success: self.log_message_signal.emit(f"  SM Set Current Level: {val_float:.3e}A (Output may not be enabled yet)")
-                                    else: error_msg = f"SM 전류 레벨 설정 실패 ({val_float}A)"
-                                except ValueError: error_msg = f"SM 전류 값 '{val_from_params}' 오류"
-                            elif not self.settings.get("sourcemeter_use"): error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Sourcemeter")
-                            elif not self.sourcemeter: error_msg = "Sourcemeter가 초기화되지 않았습니다."
-                            else: error_msg = "값 파라미터 누락"
-
-                        elif action_type == constants.SEQ_PREFIX_SM_MEAS_I:
-                            var_name = modified_params.get(constants.SEQ_PARAM_KEY_TEST_ITEM); term = modified_params.get(constants.SEQ_PARAM_KEY_TERMINAL, constants.TERMINAL_FRONT)
-                            if self.sourcemeter and self.settings.get("sourcemeter_use") and var_name:
-                                s, curr = self.sourcemeter.measure_current(term)
-                                if s and curr is not None: self.measurement_result_signal.emit(var_name, curr, self.sample_number, current_conditions_with_loops); self.log_message_signal.emit(f"  SM I ({term}): {curr:.4e} (Var: {var_name})"); step_success = True
-                            elif not self.settings.get("sourcemeter_use"): error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Sourcemeter")
-                            elif not self.sourcemeter: error_msg = "Sourcemeter가 초기화되지 않았습니다."
-                            else: error_msg = "변수명 누락"
-
-                        elif action_type == constants.SEQ_PREFIX_SM_ENABLE_OUTPUT: # 이름 변경된 상수에 맞춰 확인 (SEQ_PREFIX_SM_OUTPUT_CONTROL)
-                            state_str = modified_params.get(constants.SEQ_PARAM_KEY_STATE, "TRUE").upper()
-                            if self.sourcemeter and self.settings.get("sourcemeter_use"):
-                                state_bool = (state_str == "TRUE")
-                                step_success = self.sourcemeter.enable_output(state_bool)
-                                if step_success: self.log_message_signal.emit(f"  SM Output: {state_str}")
-                                else: error_msg = f"SM 출력 상태 변경 실패 ({state_str})"
-                            elif not self.settings.get("sourcemeter_use"): error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Sourcemeter")
-                            elif not self.sourcemeter: error_msg = "Sourcemeter가 초기화되지 않았습니다."
-                            # V-Source 구성 액션은 별도로 처리 (이 블록은 순수 Enable/Disable만)
-                            # else: error_msg = "상태 파라미터 누락" # V-Source의 경우 파라미터 없을 수 있음
-
-                        elif action_type == constants.SEQ_PREFIX_SM_CONFIGURE_VSOURCE_AND_ENABLE:
-                            if self.sourcemeter and self.settings.get("sourcemeter_use"):
-                                if self.sourcemeter.get_cached_set_voltage() is None:
-                                    error_msg = "SM Configure V-Source: Output voltage level not set prior to enabling."
-                                else:
-                                    step_success = self.sourcemeter.configure_vsource_and_enable()
-                                    if step_success: 
-                                        current_smu_terminal = self.sourcemeter._current_terminal
-                                        self.log_message_signal.emit(f"  SM V-Source Configured and Output Enabled on {current_smu_terminal} (using cached voltage: {self.sourcemeter.get_cached_set_voltage():.3f}V)")
-                                    else: error_msg = f"SM V-Source 구성 및 출력 활성화 실패"
-                            elif not self.settings.get("sourcemeter_use"): error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Sourcemeter")
-                            elif not self.sourcemeter: error_msg = "Sourcemeter가 초기화되지 않았습니다."
-
-                        elif action_type == constants.SEQ_PREFIX_SM_SET_TERMINAL:
-                            term = modified_params.get(constants.SEQ_PARAM_KEY_TERMINAL)
-                            if self.sourcemeter and self.settings.get("sourcemeter_use") and term:
-                                step_success = self.sourcemeter.set_terminal(term)
-                                if step_success: self.log_message_signal.emit(f"  SM 터미널 {term}으로 설정.")
-                                else: error_msg = f"SM 터미널 설정 실패 ({term})"
-                            elif not self.settings.get("sourcemeter_use"): error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Sourcemeter")
-                            elif not self.sourcemeter: error_msg = "Sourcemeter가 초기화되지 않았습니다."
-                            else: error_msg = "터미널 파라미터 누락"
-
-                        elif action_type == constants.SEQ_PREFIX_SM_SET_PROTECTION_I:
-                            val_from_params = modified_params.get(constants.SEQ_PARAM_KEY_CURRENT_LIMIT)
-                            if self.sourcemeter and self.settings.get("sourcemeter_use") and val_from_params is not None:
-                                try:
-                                    limit_float = float(val_from_params)
-                                    step_success = self.sourcemeter.set_protection_current(limit_float)
-                                    if step_success: self.log_message_signal.emit(f"  SM Protection Current: {limit_float:.3e}A")
-                                    else: error_msg = f"SM 보호 전류 설정 실패 ({limit_float:.3e}A)"
-                                except ValueError: error_msg = f"SM 보호 전류 값 '{val_from_params}' 오류"
-                            elif not self.settings.get("sourcemeter_use"): error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Sourcemeter")
-                            elif not self.sourcemeter: error_msg = "Sourcemeter가 초기화되지 않았습니다."
-                            else: error_msg = "전류 제한 값 파라미터 누락"
-
-                        elif action_type == constants.SEQ_PREFIX_CHAMBER_SET_TEMP:
-                            val_from_params = modified_params.get(constants.SEQ_PARAM_KEY_VALUE)
-                            if self.chamber and self.settings.get("chamber_use") and val_from_params is not None:
-                                try:
-                                    temp_float = float(val_from_params)
-                                    self.log_message_signal.emit(f"  DEBUG_SP: Attempting Chamber.set_target_temperature({temp_float})")
-                                    set_temp_ok = self.chamber.set_target_temperature(temp_float)
-                                    if set_temp_ok: 
-                                        self.log_message_signal.emit(f"  DEBUG_SP: Attempting Chamber.start_operation() after set_target_temperature.")
-                                        start_op_ok = self.chamber.start_operation()
-                                        if start_op_ok:
-                                            self.log_message_signal.emit(f"  Chamber 목표 온도 {temp_float}°C 설정 및 동작 시작.")
-                                            step_success = True
-                                        else: error_msg = "Chamber 동작 시작 실패"
-                                    else: error_msg = f"Chamber 목표 온도 설정 실패 ({temp_float}°C)"
-                                except ValueError: error_msg = f"Chamber 온도 값 '{val_from_params}' 오류"
-                            elif not self.settings.get("chamber_use"): error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Chamber")
-                            elif not self.chamber: error_msg = "Chamber가 초기화되지 않았습니다."
-                            else: error_msg = "온도 값 파라미터 누락"
-                        
-                        elif action_type == constants.SEQ_PREFIX_CHAMBER_CHECK_TEMP:
-                            target_temp_from_params = modified_params.get(constants.SEQ_PARAM_KEY_VALUE)
-                            timeout_from_params = modified_params.get(constants.SEQ_PARAM_KEY_TIMEOUT, str(constants.DEFAULT_CHAMBER_CHECK_TEMP_TIMEOUT_SEC))
-                            tolerance_from_params = modified_params.get(constants.SEQ_PARAM_KEY_TOLERANCE, str(constants.DEFAULT_CHAMBER_CHECK_TEMP_TOLERANCE_DEG))
-
-                            if self.chamber and self.settings.get("chamber_use") and target_temp_from_params is not None:
-                                try:
-                                    target_temp_float = float(target_temp_from_params)
-                                    timeout_float = float(timeout_from_params)
-                                    tolerance_float = float(tolerance_from_params)
-                                    self.log_message_signal.emit(f"  DEBUG_SP: Attempting Chamber.is_temperature_stable(target={target_temp_float}, tol={tolerance_float}, timeout={timeout_float})")
-                                    is_stable, last_temp = self.chamber.is_temperature_stable(target_temp_float, tolerance_float, timeout_float)
-                                    
-                                    if self.request_stop_flag: error_msg = "온도 안정화 대기 중 중단됨."
-                                    elif is_stable: self.log_message_signal.emit(constants.MSG_CHAMBER_TEMP_STABLE.format(target_temp=target_temp_float, current_temp=last_temp if last_temp is not None else "N/A")); step_success = True
-                                    else: error_msg = constants.MSG_CHAMBER_TEMP_TIMEOUT.format(target_temp=target_temp_float, current_temp=last_temp if last_temp is not None else "N/A", timeout=timeout_float)
-                                except ValueError: error_msg = "Chamber Check Temp 파라미터 숫자 변환 오류"
-                            elif not self.settings.get("chamber_use"): error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Chamber")
-                            elif not self.chamber: error_msg = "Chamber가 초기화되지 않았습니다."
-                            else: error_msg = "목표 온도 파라미터 누락"
+                        if handler is not None:
+                            if action_type in _LOG_FLUSH_BEFORE_ACTIONS:
+                                # 계측기 설정/대기로 오래 걸릴 수 있는 단계는 어떤 단계가 실행 중인지 보이도록 헤더까지 먼저 표시
+                                self._flush_log()
+                            # 단계 성공 여부는 기존과 같이 예외 발생 여부로만 판단하고, 핸들러의 error_msg는 로그에 사용
+                            _, error_msg = handler(modified_params, current_conditions_with_loops)
                         else:
                              error_msg = f"알 수 없거나 아직 처리되지 않은 액션 타입: {action_type}"
 
@@ -656,7 +523,7 @@ class SequencePlayer(QObject):
                         error_msg = f"실행 중 예외: {type(e).__name__} - {e}"
                         current_step_success_flag = False # Update local flag
                         import traceback
-                        self.log_message_signal.emit(f"  Stack trace: {traceback.format_exc()}")
+                        log(f"  Stack trace: {traceback.format_exc()}")
                 
                 step_success = current_step_success_flag # Assign to the loop-level step_success
 
@@ -664,13 +531,13 @@ class SequencePlayer(QObject):
                 error_msg = "알 수 없는 오류로 단계 실행 실패"
             
             if error_msg: 
-                self.log_message_signal.emit(f"Error during '{display_name}' (ID: {item_id}): {error_msg}")
+                log(f"Error during '{display_name}' (ID: {item_id}): {error_msg}")
             
             if not step_success:
                 overall_success = False
                 completion_message = f"오류로 중단 (항목: '{display_name}', 오류: {error_msg})"
                 if halt_on_error:
-                    self.log_message_signal.emit(f"오류로 인해 시퀀스 중단됨 (항목: '{display_name}').")
+                    log(f"오류로 인해 시퀀스 중단됨 (항목: '{display_name}').")
                     return False, completion_message
             
             if not self.request_stop_flag and top_level_call: # 최상위 호출에서만 짧은 딜레이
@@ -678,6 +545,369 @@ class SequencePlayer(QObject):
         
         return overall_success, completion_message
 
+    def _do_i2c_write_name(self, params: Dict[str, Any], conditions: Dict[str, Any]) -> Tuple[bool, str]:
+        step_success = False
+        error_msg = ""
+        name = params.get(constants.SEQ_PARAM_KEY_TARGET_NAME)
+        val_from_params = params.get(constants.SEQ_PARAM_KEY_VALUE)
+
+        if self.i2c_device and self.register_map and name and val_from_params is not None:
+            field_info = self._logical_fields_map.get(name)
+            if not field_info: error_msg = constants.MSG_FIELD_ID_NOT_FOUND.format(field_id=name)
+            else:
+                val_to_write_int = 0
+                if isinstance(val_from_params, (int, float)):
+                    val_to_write_int = int(round(val_from_params)) # 반올림하여 정수화
+                elif isinstance(val_from_params, str):
+                    parsed_hex = _parse_hex_param(val_from_params)
+                    if parsed_hex:
+                        val_to_write_int = parsed_hex[1]
+                    else: error_msg = constants.MSG_CANNOT_PARSE_HEX_FOR_FIELD.format(value=val_from_params)
+                else: error_msg = f"Invalid value type for I2C Write Name: {type(val_from_params)}"
+
+                if not error_msg:
+                    if val_to_write_int >= (1 << field_info.length):
+                        error_msg = constants.MSG_VALUE_EXCEEDS_WIDTH.format(value=f"{val_to_write_int} (0x{val_to_write_int:X})", field_id=name, length=field_info.length)
+                    else:
+                        # "값 변경 없음" 최적화 제거: 항상 I2C 쓰기 시도
+                        # register_map을 사용하여 쓸 주소와 값을 계산하되, 실제 쓰기는 항상 수행
+                        # 이 로직은 register_map.set_logical_field_value의 반환값을 사용하는 대신,
+                        # 필요한 (address, value) 쌍을 직접 계산하여 i2c_device.write를 호출해야 함.
+                        # RegisterMap에 field_to_physical_writes(field_id, value_int) 같은 헬퍼가 있으면 좋음.
+                        # 임시로 set_logical_field_value를 호출하여 ops를 받고, 무조건 실행하는 형태로 유지
+                        # (이 경우 set_logical_field_value 내부 최적화를 제거해야 함)
+                        # 더 나은 방법: register_map이 항상 써야 할 최종 (addr, val) 목록을 반환하도록 수정
+                        # 여기서는 set_logical_field_value가 반환하는 i2c_ops를 무조건 실행하도록 가정.
+                        # (set_logical_field_value가 현재값과 비교하여 빈 리스트를 반환하는 로직 수정 필요)
+
+                        # 쓸 (주소, 값)은 set_logical_field_value가 필드가 걸친 주소만으로 계산하므로
+                        # 여기서 전체 주소값 저장소를 복사해 다시 계산하지 않음.
+
+                        # register_map.set_logical_field_value가 항상 실제 써야할 ops를 반환한다고 가정 (내부 최적화 X)
+                        # 더 간단한 접근: register_map.set_logical_field_value를 호출하고,
+                        # 반환된 i2c_ops가 비어있더라도, val_to_write_int를 기준으로 다시 ops를 생성하여 강제 쓰기.
+
+                        # 현재 register_map.set_logical_field_value는 변경이 있을 때만 ops를 반환함.
+                        # 이를 수정하거나, 여기서 직접 ops를 생성해야 함.
+                        # 여기서는 set_logical_field_value가 항상 올바른 최종 (addr, val) 쌍을 반환한다고 가정하고 진행.
+                        # (set_logical_field_value 내부 로직이 이 가정을 만족하도록 수정 필요)
+
+                        # set_logical_field_value는 (변경될_ops, 변경후_확인할_값들)을 반환.
+                        # 항상 쓰려면, 이 함수가 "써야할_모든_ops"를 반환해야함.
+                        # RegisterMap.get_physical_writes_for_field(field_id, value_int) 와 같은 함수가 필요.
+                        # 임시로, set_logical_field_value를 호출하고, 만약 옵스가 비면, 현재 값으로라도 다시 계산해서 강제 쓰기.
+
+                        i2c_ops, vals_to_confirm = self.register_map.set_logical_field_value(name, val_to_write_int)
+
+                        if not i2c_ops:
+                            # 값이 변경되지 않았더라도, 명시적으로 쓰기 작업을 생성 (요청된 값 기준)
+                            # RegisterMap에 이 로직을 위한 헬퍼 함수가 있는 것이 이상적
+                            # 예: get_i2c_ops_for_value(field_id, value_int)
+                            # 여기서는 set_logical_field_value가 항상 최종 상태를 반영하는 ops를 준다고 가정 (수정 필요)
+                            # 또는, 아래와 같이 직접 계산하여 강제 쓰기
+                            current_field_val_int = self.register_map.get_logical_field_value(name)
+                            if current_field_val_int != val_to_write_int:
+                                # 이 경우는 set_logical_field_value가 ops를 반환했어야 함. 로직 오류.
+                                self._log(f"  Warning: Field '{name}' 값은 {val_to_write_int}(으)로 변경되어야 하나 I2C ops가 생성되지 않음.")
+                            # 그럼에도 불구하고 현재 요청된 값으로 쓰기 위한 ops를 다시 구성
+                            # (이 부분은 RegisterMap에 get_physical_writes_for_value(field_id, value_to_set_int) 와 같은 메서드를 만들어 사용하는 것이 좋음)
+                            # 아래는 set_logical_field_value가 이미 올바른 ops를 반환한다고 가정하고, 비어있을때만 로그.
+                            self._log(f"  Info: Register '{name}' 값(0x{val_to_write_int:X})이 현재 값과 동일하여 I2C Ops는 없지만, 로그 확인용.")
+                            # step_success = True # 실제 쓰기 없이 성공 처리 (기존 로직)
+                            # 강제 쓰기를 하려면 여기서 i2c_ops를 다시 만들어야함.
+                            # 지금은 set_logical_field_value의 반환을 따름. "값 변경 없음 최적화 제거"는
+                            # 이 함수가 항상 써야할 ops를 반환하도록 수정하는 것을 포함.
+                            # 현재는 이 플레이어에서 set_logical_field_value가 최적화된 ops를 반환한다고 가정.
+                            # "값 변경 없음 최적화 제거"를 위해, set_logical_field_value 수정이 선행되어야 함.
+                            # 지금 당장은, ops가 없으면 메시지만 남기고 넘어감.
+                            self._log(f"  Register '{name}' 값 변경 없음 (0x{val_to_write_int:X} 요청됨). 실제 쓰기 스킵됨.")
+                            step_success = True # 실제 쓰기는 없었지만, 의도된 상태이므로 성공으로 간주
+
+                        all_writes_ok = True
+                        if i2c_ops: # i2c_ops가 있을 때만 실행
+                            # 필드가 여러 주소에 걸쳐 있어도 정수 (주소, 값) 프로그램으로 한 번에 전달 (쓰기마다 hex 문자열 생성/재파싱 없음)
+                            # set_logical_field_value의 주소는 이미 정규화된 hex 문자열
+                            program = [(int(op_addr, 16), op_val) for op_addr, op_val in i2c_ops]
+                            if not self.i2c_device.write_program(program):
+                                all_writes_ok = False
+                                ops_desc = ", ".join(f"Addr: {op_addr}, Val: 0x{op_val:02X}" for op_addr, op_val in i2c_ops)
+                                error_msg += f"I2C Write 실패 ({ops_desc}); "
+                            if all_writes_ok:
+                                self.register_map.confirm_address_values_update_fast(vals_to_confirm) # set_logical_field_value 결과는 이미 정규화됨
+                                self._log(f"  Register '{name}'에 0x{val_to_write_int:X} ({val_to_write_int}) 쓰기 완료."); step_success = True
+                        elif not error_msg: # i2c_ops도 없고 에러도 없으면 (위의 값 변경 없음 로그에서 이미 처리)
+                            step_success = True # 이미 원하는 값이므로 성공
+
+        elif not self.i2c_device: error_msg = "I2C 장치가 초기화되지 않았습니다."
+        elif not self.register_map: error_msg = constants.MSG_NO_REGMAP_LOADED
+        else: error_msg = "Name/Value 파라미터 누락"
+        return step_success, error_msg
+
+    def _do_i2c_read_name(self, params: Dict[str, Any], conditions: Dict[str, Any]) -> Tuple[bool, str]:
+        step_success = False
+        error_msg = ""
+        name = params.get(constants.SEQ_PARAM_KEY_TARGET_NAME); var_name = params.get(constants.SEQ_PARAM_KEY_TEST_ITEM)
+        if self.register_map and name and var_name:
+            read_val_hex = self.register_map.get_logical_field_value_hex(name, from_initial=False)
+            if constants.HEX_ERROR_NO_FIELD in read_val_hex or constants.HEX_ERROR_CONVERSION in read_val_hex : error_msg = f"Register '{name}' 읽기 오류: {read_val_hex}"
+            else: self.measurement_result_signal.emit(var_name, read_val_hex, self.sample_number, conditions); self._log(f"  Register '{name}' 읽기 값: {read_val_hex} (저장 변수: {var_name})"); step_success = True
+        elif not self.register_map: error_msg = constants.MSG_NO_REGMAP_LOADED
+        else: error_msg = "Name/Variable 파라미터 누락"
+        return step_success, error_msg
+
+    def _do_i2c_write_addr(self, params: Dict[str, Any], conditions: Dict[str, Any]) -> Tuple[bool, str]:
+        step_success = False
+        error_msg = ""
+        addr = params.get(constants.SEQ_PARAM_KEY_ADDRESS)
+        val_from_params = params.get(constants.SEQ_PARAM_KEY_VALUE)
+        if self.i2c_device and addr and val_from_params is not None: # val_str -> val_from_params
+            norm_addr = normalize_hex_input(addr, 4)
+            val_to_write_int = 0
+
+            if isinstance(val_from_params, (int, float)):
+                val_to_write_int = int(round(val_from_params))
+            elif isinstance(val_from_params, str):
+                parsed_val_for_addr = _parse_hex_param(val_from_params, 2)
+                if parsed_val_for_addr is None: error_msg = f"잘못된 값 형식: {val_from_params}"
+                else: val_to_write_int = parsed_val_for_addr[1]
+            else: error_msg = f"Invalid value type for I2C Write Addr: {type(val_from_params)}"
+
+            if norm_addr is None: error_msg = f"잘못된 주소 형식: {addr}"
+
+            if not error_msg:
+                # 항상 쓰기 실행 (값 변경 없음 최적화 제거)
+                final_val_hex_to_write = f"0x{val_to_write_int:02X}"
+                if self.i2c_device.write(norm_addr, final_val_hex_to_write):
+                    if self.register_map:
+                        self.register_map.confirm_address_values_update({norm_addr: val_to_write_int})
+                    self._log(f"  I2C Write Addr: {norm_addr}, 값: {final_val_hex_to_write} ({val_to_write_int}) 쓰기 완료."); step_success = True
+                else: error_msg = f"I2C Write 실패 (Addr: {norm_addr}, Val: {final_val_hex_to_write})"
+        elif not self.i2c_device: error_msg = "I2C 장치가 초기화되지 않았습니다."
+        else: error_msg = "Address/Value 파라미터 누락"
+        return step_success, error_msg
+
+    def _do_i2c_read_addr(self, params: Dict[str, Any], conditions: Dict[str, Any]) -> Tuple[bool, str]:
+        step_success = False
+        error_msg = ""
+        addr = params.get(constants.SEQ_PARAM_KEY_ADDRESS); var_name = params.get(constants.SEQ_PARAM_KEY_TEST_ITEM)
+        if self.i2c_device and self.register_map and addr and var_name:
+            norm_addr = normalize_hex_input(addr, 4)
+            if norm_addr is None: error_msg = f"잘못된 주소 형식: {addr}"
+            else:
+                cache_ttl = self._read_cache_ttl_steps
+                cached = self._read_cache.get(norm_addr) if cache_ttl else None
+                if cached is not None and self._step_counter - cached[1] <= cache_ttl:
+                    read_hw_success, read_val_int = True, cached[0] # 최근 읽은 값 재사용 (그 사이 쓰기 없음)
+                else:
+                    read_hw_success, read_val_int = self.i2c_device.read(norm_addr)
+                    if cache_ttl and read_hw_success and read_val_int is not None:
+                        self._read_cache[norm_addr] = (read_val_int, self._step_counter)
+                if read_hw_success and read_val_int is not None:
+                    self.register_map.confirm_address_values_update({norm_addr: read_val_int})
+                    read_val_hex = f"0x{read_val_int:02X}"
+                    self.measurement_result_signal.emit(var_name, read_val_hex, self.sample_number, conditions)
+                    self._log(f"  I2C Read Addr: {norm_addr}, 값: {read_val_hex} (저장 변수: {var_name})"); step_success = True
+                else: error_msg = f"I2C Read 실패 (Addr: {norm_addr})"
+        elif not self.i2c_device: error_msg = "I2C 장치가 초기화되지 않았습니다."
+        elif not self.register_map: error_msg = constants.MSG_NO_REGMAP_LOADED
+        else: error_msg = "Address/Variable 파라미터 누락"
+        return step_success, error_msg
+
+    def _do_mm_meas_v(self, params: Dict[str, Any], conditions: Dict[str, Any]) -> Tuple[bool, str]:
+        step_success = False
+        error_msg = ""
+        var_name = params.get(constants.SEQ_PARAM_KEY_TEST_ITEM)
+        if self.multimeter and self._mm_on and var_name:
+            s, v = self.multimeter.measure_voltage()
+            if s and v is not None: self.measurement_result_signal.emit(var_name, v, self.sample_number, conditions); self._log(f"  Multimeter V: {v:.6f} (Var: {var_name})"); step_success = True
+            else: error_msg = "Multimeter 전압 측정 실패"
+        elif not self._mm_on: error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Multimeter")
+        elif not self.multimeter: error_msg = "Multimeter가 초기화되지 않았습니다."
+        else: error_msg = "변수명 누락"
+        return step_success, error_msg
+
+    def _do_mm_meas_i(self, params: Dict[str, Any], conditions: Dict[str, Any]) -> Tuple[bool, str]:
+        step_success = False
+        error_msg = ""
+        var_name = params.get(constants.SEQ_PARAM_KEY_TEST_ITEM)
+        if self.multimeter and self._mm_on and var_name:
+            s, curr = self.multimeter.measure_current()
+            if s and curr is not None: self.measurement_result_signal.emit(var_name, curr, self.sample_number, conditions); self._log(f"  Multimeter I: {curr:.6e} (Var: {var_name})"); step_success = True
+        elif not self._mm_on: error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Multimeter")
+        elif not self.multimeter: error_msg = "Multimeter가 초기화되지 않았습니다."
+        else: error_msg = "변수명 누락"
+        return step_success, error_msg
+
+    def _do_mm_set_terminal(self, params: Dict[str, Any], conditions: Dict[str, Any]) -> Tuple[bool, str]:
+        step_success = False
+        error_msg = ""
+        term_val_from_params = params.get(constants.SEQ_PARAM_KEY_TERMINAL)
+        term = str(term_val_from_params) # 루프 변수 치환 결과가 숫자일 수 있으므로 str 변환
+        if self.multimeter and self._mm_on and term:
+            step_success = self.multimeter.set_terminal(term)
+            if step_success: self._log(f"  Multimeter 터미널 {term}으로 설정.")
+            else: error_msg = f"Multimeter 터미널 설정 실패 ({term})"
+        elif not self._mm_on: error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Multimeter")
+        elif not self.multimeter: error_msg = "Multimeter가 초기화되지 않았습니다."
+        else: error_msg = "터미널 파라미터 누락"
+        return step_success, error_msg
+
+    def _do_sm_set_v(self, params: Dict[str, Any], conditions: Dict[str, Any]) -> Tuple[bool, str]:
+        step_success = False
+        error_msg = ""
+        self._conditions_dirty = True # 측정 조건(설정값)이 바뀔 수 있으므로 다음 단계에서 다시 조회
+        val_from_params = params.get(constants.SEQ_PARAM_KEY_VALUE)
+        if self.sourcemeter and self._sm_on and val_from_params is not None:
+            try:
+                val_float = float(val_from_params) # 루프 변수(숫자) 또는 직접 입력(문자열->숫자) 처리
+                step_success = self.sourcemeter.set_voltage(val_float) # 터미널 파라미터 없이 호출
+                if step_success: self._log(f"  SM Set Voltage Level: {val_float:.3f}V (Output may not be enabled yet)")
+                else: error_msg = f"SM 전압 레벨 설정 실패 ({val_float}V)"
+            except ValueError: error_msg = f"SM 전압 값 '{val_from_params}' 오류"
+        elif not self._sm_on: error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Sourcemeter")
+        elif not self.sourcemeter: error_msg = "Sourcemeter가 초기화되지 않았습니다."
+        else: error_msg = "변수명 누락"
+        return step_success, error_msg
+
+    def _do_sm_set_i(self, params: Dict[str, Any], conditions: Dict[str, Any]) -> Tuple[bool, str]:
+        step_success = False
+        error_msg = ""
+        self._conditions_dirty = True # 측정 조건(설정값)이 바뀔 수 있으므로 다음 단계에서 다시 조회
+        val_from_params = params.get(constants.SEQ_PARAM_KEY_VALUE)
+        if self.sourcemeter and self._sm_on and val_from_params is not None:
+            try:
+                val_float = float(val_from_params)
+                step_success = self.sourcemeter.set_current(val_float) # 터미널 파라미터 없이 호출
+                if step_success: self._log(f"  SM Set Current Level: {val_float:.3e}A (Output may not be enabled yet)")
+                else: error_msg = f"SM 전류 레벨 설정 실패 ({val_float}A)"
+            except ValueError: error_msg = f"SM 전류 값 '{val_from_params}' 오류"
+        elif not self._sm_on: error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Sourcemeter")
+        elif not self.sourcemeter: error_msg = "Sourcemeter가 초기화되지 않았습니다."
+        else: error_msg = "값 파라미터 누락"
+        return step_success, error_msg
+
+    def _do_sm_meas_i(self, params: Dict[str, Any], conditions: Dict[str, Any]) -> Tuple[bool, str]:
+        step_success = False
+        error_msg = ""
+        var_name = params.get(constants.SEQ_PARAM_KEY_TEST_ITEM); term = params.get(constants.SEQ_PARAM_KEY_TERMINAL, constants.TERMINAL_FRONT)
+        if self.sourcemeter and self._sm_on and var_name:
+            s, curr = self.sourcemeter.measure_current(term)
+            if s and curr is not None: self.measurement_result_signal.emit(var_name, curr, self.sample_number, conditions); self._log(f"  SM I ({term}): {curr:.4e} (Var: {var_name})"); step_success = True
+        elif not self._sm_on: error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Sourcemeter")
+        elif not self.sourcemeter: error_msg = "Sourcemeter가 초기화되지 않았습니다."
+        else: error_msg = "변수명 누락"
+        return step_success, error_msg
+
+    def _do_sm_enable_output(self, params: Dict[str, Any], conditions: Dict[str, Any]) -> Tuple[bool, str]:  # 이름 변경된 상수에 맞춰 확인 (SEQ_PREFIX_SM_OUTPUT_CONTROL)
+        step_success = False
+        error_msg = ""
+        state_str = params.get(constants.SEQ_PARAM_KEY_STATE, "TRUE").upper()
+        if self.sourcemeter and self._sm_on:
+            state_bool = (state_str == "TRUE")
+            step_success = self.sourcemeter.enable_output(state_bool)
+            if step_success: self._log(f"  SM Output: {state_str}")
+            else: error_msg = f"SM 출력 상태 변경 실패 ({state_str})"
+        elif not self._sm_on: error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Sourcemeter")
+        elif not self.sourcemeter: error_msg = "Sourcemeter가 초기화되지 않았습니다."
+        # V-Source 구성 액션은 별도로 처리 (이 블록은 순수 Enable/Disable만)
+        # else: error_msg = "상태 파라미터 누락" # V-Source의 경우 파라미터 없을 수 있음
+        return step_success, error_msg
+
+    def _do_sm_configure_vsource_and_enable(self, params: Dict[str, Any], conditions: Dict[str, Any]) -> Tuple[bool, str]:
+        step_success = False
+        error_msg = ""
+        if self.sourcemeter and self._sm_on:
+            if self.sourcemeter.get_cached_set_voltage() is None:
+                error_msg = "SM Configure V-Source: Output voltage level not set prior to enabling."
+            else:
+                step_success = self.sourcemeter.configure_vsource_and_enable()
+                if step_success:
+                    current_smu_terminal = self.sourcemeter._current_terminal
+                    self._log(f"  SM V-Source Configured and Output Enabled on {current_smu_terminal} (using cached voltage: {self.sourcemeter.get_cached_set_voltage():.3f}V)")
+                else: error_msg = f"SM V-Source 구성 및 출력 활성화 실패"
+        elif not self._sm_on: error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Sourcemeter")
+        elif not self.sourcemeter: error_msg = "Sourcemeter가 초기화되지 않았습니다."
+        return step_success, error_msg
+
+    def _do_sm_set_terminal(self, params: Dict[str, Any], conditions: Dict[str, Any]) -> Tuple[bool, str]:
+        step_success = False
+        error_msg = ""
+        term = params.get(constants.SEQ_PARAM_KEY_TERMINAL)
+        if self.sourcemeter and self._sm_on and term:
+            step_success = self.sourcemeter.set_terminal(term)
+            if step_success: self._log(f"  SM 터미널 {term}으로 설정.")
+            else: error_msg = f"SM 터미널 설정 실패 ({term})"
+        elif not self._sm_on: error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Sourcemeter")
+        elif not self.sourcemeter: error_msg = "Sourcemeter가 초기화되지 않았습니다."
+        else: error_msg = "터미널 파라미터 누락"
+        return step_success, error_msg
+
+    def _do_sm_set_protection_i(self, params: Dict[str, Any], conditions: Dict[str, Any]) -> Tuple[bool, str]:
+        step_success = False
+        error_msg = ""
+        val_from_params = params.get(constants.SEQ_PARAM_KEY_CURRENT_LIMIT)
+        if self.sourcemeter and self._sm_on and val_from_params is not None:
+            try:
+                limit_float = float(val_from_params)
+                step_success = self.sourcemeter.set_protection_current(limit_float)
+                if step_success: self._log(f"  SM Protection Current: {limit_float:.3e}A")
+                else: error_msg = f"SM 보호 전류 설정 실패 ({limit_float:.3e}A)"
+            except ValueError: error_msg = f"SM 보호 전류 값 '{val_from_params}' 오류"
+        elif not self._sm_on: error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Sourcemeter")
+        elif not self.sourcemeter: error_msg = "Sourcemeter가 초기화되지 않았습니다."
+        else: error_msg = "전류 제한 값 파라미터 누락"
+        return step_success, error_msg
+
+    def _do_chamber_set_temp(self, params: Dict[str, Any], conditions: Dict[str, Any]) -> Tuple[bool, str]:
+        step_success = False
+        error_msg = ""
+        self._conditions_dirty = True # 측정 조건(설정값)이 바뀔 수 있으므로 다음 단계에서 다시 조회
+        val_from_params = params.get(constants.SEQ_PARAM_KEY_VALUE)
+        if self.chamber and self._ch_on and val_from_params is not None:
+            try:
+                temp_float = float(val_from_params)
+                self._log(f"  DEBUG_SP: Attempting Chamber.set_target_temperature({temp_float})")
+                set_temp_ok = self.chamber.set_target_temperature(temp_float)
+                if set_temp_ok:
+                    self._log(f"  DEBUG_SP: Attempting Chamber.start_operation() after set_target_temperature.")
+                    start_op_ok = self.chamber.start_operation()
+                    if start_op_ok:
+                        self._log(f"  Chamber 목표 온도 {temp_float}°C 설정 및 동작 시작.")
+                        step_success = True
+                    else: error_msg = "Chamber 동작 시작 실패"
+                else: error_msg = f"Chamber 목표 온도 설정 실패 ({temp_float}°C)"
+            except ValueError: error_msg = f"Chamber 온도 값 '{val_from_params}' 오류"
+        elif not self._ch_on: error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Chamber")
+        elif not self.chamber: error_msg = "Chamber가 초기화되지 않았습니다."
+        else: error_msg = "온도 값 파라미터 누락"
+        return step_success, error_msg
+
+    def _do_chamber_check_temp(self, params: Dict[str, Any], conditions: Dict[str, Any]) -> Tuple[bool, str]:
+        step_success = False
+        error_msg = ""
+        target_temp_from_params = params.get(constants.SEQ_PARAM_KEY_VALUE)
+        timeout_from_params = params.get(constants.SEQ_PARAM_KEY_TIMEOUT, str(constants.DEFAULT_CHAMBER_CHECK_TEMP_TIMEOUT_SEC))
+        tolerance_from_params = params.get(constants.SEQ_PARAM_KEY_TOLERANCE, str(constants.DEFAULT_CHAMBER_CHECK_TEMP_TOLERANCE_DEG))
+
+        if self.chamber and self._ch_on and target_temp_from_params is not None:
+            try:
+                target_temp_float = float(target_temp_from_params)
+                timeout_float = float(timeout_from_params)
+                tolerance_float = float(tolerance_from_params)
+                self._log(f"  DEBUG_SP: Attempting Chamber.is_temperature_stable(target={target_temp_float}, tol={tolerance_float}, timeout={timeout_float})")
+                self._flush_log() # 온도 안정화 대기는 길어질 수 있으므로 그 전까지의 로그를 먼저 표시
+                is_stable, last_temp = self.chamber.is_temperature_stable(target_temp_float, tolerance_float, timeout_float)
+
+                if self.request_stop_flag: error_msg = "온도 안정화 대기 중 중단됨."
+                elif is_stable: self._log(constants.MSG_CHAMBER_TEMP_STABLE.format(target_temp=target_temp_float, current_temp=last_temp if last_temp is not None else "N/A")); step_success = True
+                else: error_msg = constants.MSG_CHAMBER_TEMP_TIMEOUT.format(target_temp=target_temp_float, current_temp=last_temp if last_temp is not None else "N/A", timeout=timeout_float)
+            except ValueError: error_msg = "Chamber Check Temp 파라미터 숫자 변환 오류"
+        elif not self._ch_on: error_msg = constants.MSG_DEVICE_NOT_ENABLED.format(device_name="Chamber")
+        elif not self.chamber: error_msg = "Chamber가 초기화되지 않았습니다."
+        else: error_msg = "목표 온도 파라미터 누락"
+        return step_success, error_msg
+
     def request_stop_sequence(self):
         self.request_stop_flag = True
+        if self.chamber: self.chamber.notify_stop()
         self.log_message_signal.emit("시퀀스 중단 요청됨 (플래그 설정). 다음 단계 시작 전 또는 루프 반복 시 중단됩니다.")
\ No newline at end of file
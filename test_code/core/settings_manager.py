@@ -65,7 +65,8 @@ class SettingsManager:
                     ]
                 }
             ],
-            "error_halts_sequence": False
+            "error_halts_sequence": False,
+            "i2c_read_cache_ttl_steps": 0
         }
 
     def _determine_config_path(self) -> str:
@@ -1,5 +1,6 @@
 # main_app.py
 import sys
+import logging
 from PyQt5.QtWidgets import QApplication, QStyleFactory # QApplication은 먼저 임포트
 from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt 
@@ -16,6 +17,9 @@ def main():
     QApplication을 생성하고, 메인 윈도우를 설정 및 표시한 후, 이벤트 루프를 시작합니다.
     """
     
+    # 기본 INFO 레벨: core 모듈의 logger.debug(...) 출력은 런타임 비용 없이 생략됩니다.
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+
     app = QApplication(sys.argv)
 
     # --- 애플리케이션 폰트 설정 ---
@@ -88,16 +88,16 @@ class RegisterViewerTab(QWidget):
 
         def get_sort_key(field_info_item: LogicalFieldInfo) -> Tuple[int, str]:
             # regions_mapping이 있고, 비어있지 않은지 확인
-            if field_info_item.get('regions_mapping') and field_info_item['regions_mapping']:
-                first_addr_hex = field_info_item['regions_mapping'][0][0]
+            if field_info_item.regions_mapping:
+                first_addr_hex = field_info_item.regions_mapping[0][0]
                 try:
                     # normalize_hex_input 함수 직접 사용
                     addr_int = int(normalize_hex_input(first_addr_hex, add_prefix=True) or "0xFFFF", 16)
-                    return (addr_int, field_info_item['id'])
+                    return (addr_int, field_info_item.id)
                 except (ValueError, TypeError):
                     # 주소 파싱 실패 시 정렬 우선순위를 낮춤
-                    return (0xFFFF, field_info_item['id']) 
-            return (0xFFFF, field_info_item['id']) # regions_mapping이 없는 경우
+                    return (0xFFFF, field_info_item.id) 
+            return (0xFFFF, field_info_item.id) # regions_mapping이 없는 경우
 
         try:
             fields_info_list.sort(key=get_sort_key)
@@ -111,26 +111,26 @@ class RegisterViewerTab(QWidget):
             self.reg_table.insertRow(row_position)
 
             # Register Name
-            self.reg_table.setItem(row_position, 0, QTableWidgetItem(field_info['id']))
+            self.reg_table.setItem(row_position, 0, QTableWidgetItem(field_info.id))
             
             # Access
-            item_access = QTableWidgetItem(field_info['access'])
+            item_access = QTableWidgetItem(field_info.access)
             item_access.setTextAlignment(Qt.AlignCenter)
             self.reg_table.setItem(row_position, 1, item_access)
             
             # Length
-            item_length = QTableWidgetItem(str(field_info['length']))
+            item_length = QTableWidgetItem(str(field_info.length))
             item_length.setTextAlignment(Qt.AlignCenter)
             self.reg_table.setItem(row_position, 2, item_length)
 
             # Address
             addr_display = "N/A"
-            if field_info.get('regions_mapping'):
+            if field_info.regions_mapping:
                 try:
                     # 주소 문자열을 정수형으로 변환하여 정렬 후 다시 문자열로 포맷팅
                     addrs_in_field_int = sorted(list(set(
                         int(normalize_hex_input(addr, add_prefix=True) or "0", 16) 
-                        for addr, _, _, _, _ in field_info['regions_mapping']
+                        for addr, _, _, _, _ in field_info.regions_mapping
                         if normalize_hex_input(addr, add_prefix=True) # 유효한 hex 주소만 필터링
                     )))
                     if addrs_in_field_int:
@@ -140,20 +140,20 @@ class RegisterViewerTab(QWidget):
                         max_a_hex = f"0X{max_a_int:04X}"
                         addr_display = f"{min_a_hex} - {max_a_hex}" if min_a_hex != max_a_hex else min_a_hex
                 except (ValueError, TypeError) as e:
-                    print(f"Warning: Error processing addresses for field '{field_info['id']}': {e}")
+                    print(f"Warning: Error processing addresses for field '{field_info.id}': {e}")
                     addr_display = "ErrAddr" # 주소 처리 중 오류 발생 시
             item_addr = QTableWidgetItem(addr_display)
             item_addr.setTextAlignment(Qt.AlignCenter)
             self.reg_table.setItem(row_position, 3, item_addr)
 
             # Value (Hex)
-            current_val_hex = register_map.get_logical_field_value_hex(field_info['id'], from_initial=False)
+            current_val_hex = register_map.get_logical_field_value_hex(field_info.id, from_initial=False)
             item_value = QTableWidgetItem(current_val_hex)
             item_value.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
             self.reg_table.setItem(row_position, 4, item_value)
             
             # Description - 수정된 부분
-            description_text = field_info.get('description') or '' # None일 경우 빈 문자열로 처리
+            description_text = field_info.description or '' # None일 경우 빈 문자열로 처리
             desc_item = QTableWidgetItem(description_text)
             self.reg_table.setItem(row_position, 5, desc_item)
 
@@ -728,6 +728,7 @@ class SequenceControllerTab(QWidget):
         self.sequence_player.moveToThread(self.sequence_player_thread)
 
         self.sequence_player.log_message_signal.connect(self._handle_log_message)
+        self.sequence_player.log_batch_signal.connect(self._handle_log_batch)
         self.sequence_player.measurement_result_signal.connect(self.new_measurement_signal) 
         self.sequence_player.sequence_finished_signal.connect(self._handle_sequence_finished)
         
@@ -751,6 +752,7 @@ class SequenceControllerTab(QWidget):
         
         if self.sequence_player and self.sequence_player_thread and self.sequence_player_thread.isRunning():
             self.sequence_player.request_stop_flag = True 
+            if self.sequence_player.chamber: self.sequence_player.chamber.notify_stop()
             if self.stop_seq_button: self.stop_seq_button.setEnabled(False) 
             if self.execution_log_textedit: 
                 self.execution_log_textedit.append("--- 시퀀스 중단 요청됨. 현재 단계 완료 후 중단됩니다... ---")
@@ -765,6 +767,16 @@ class SequenceControllerTab(QWidget):
         """시퀀스 플레이어로부터 로그 메시지를 수신하여 로그 창에 표시합니다."""
         self.log_message(message)
 
+    @pyqtSlot(list)
+    def _handle_log_batch(self, entries: list):
+        """시퀀스 플레이어가 모아 보낸 (기록 시각, 메시지) 목록을 줄마다 기록 시각을 붙여 한 번에 표시합니다."""
+        if self.execution_log_textedit and entries:
+            self.execution_log_textedit.append("\n".join(
+                f"[{datetime.fromtimestamp(ts).strftime('%H:%M:%S')}] {message}" for ts, message in entries))
+            self.execution_log_textedit.verticalScrollBar().setValue(
+                self.execution_log_textedit.verticalScrollBar().maximum()
+            )
+
     def log_message(self, message: str):
         """로그 메시지를 UI의 로그 창에 표시합니다."""
         if self.execution_log_textedit: